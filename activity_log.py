@@ -0,0 +1,125 @@
+import atexit
+import logging
+import queue
+import threading
+import time
+
+from datetime import datetime
+from sqlalchemy import insert
+
+from models import db, ActivityLog
+
+
+class ActivityLogWriter:
+    """Background sink that batches ActivityLog rows into multi-row inserts
+
+    Requests only enqueue a row; a daemon thread flushes the queue once it
+    holds batch_size rows or flush_interval seconds have passed. When the
+    bounded queue is full new rows are dropped and counted instead of
+    blocking the request.
+    """
+
+    def __init__(self, app=None, max_queue_size=10000, batch_size=200, flush_interval=2.0):
+        self.max_queue_size = max_queue_size
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self.dropped = 0
+        self.written = 0
+        self._queue = queue.Queue(maxsize=max_queue_size)
+        self._stop_event = threading.Event()
+        self._counter_lock = threading.Lock()
+        self._write_lock = threading.Lock()
+        self._thread = None
+        self.app = None
+
+        if app is not None:
+            self.init_app(app)
+
+    def init_app(self, app):
+        """Bind the writer to an app and start the flush thread"""
+        self.app = app
+        self._thread = threading.Thread(target=self._run, name='activity-log-writer', daemon=True)
+        self._thread.start()
+        atexit.register(self.stop)
+
+    def log(self, **row):
+        """Queue an ActivityLog row; returns False if it had to be dropped"""
+        row.setdefault('created_at', datetime.utcnow())
+        try:
+            self._queue.put_nowait(row)
+            return True
+        except queue.Full:
+            with self._counter_lock:
+                self.dropped += 1
+            return False
+
+    def stats(self):
+        """Counters for monitoring the writer"""
+        return {'pending': self._queue.qsize(), 'written': self.written, 'dropped': self.dropped}
+
+    def flush(self):
+        """Write everything currently queued from the calling thread"""
+        while True:
+            batch = []
+            while len(batch) < self.batch_size:
+                try:
+                    batch.append(self._queue.get_nowait())
+                except queue.Empty:
+                    break
+            if not batch:
+                return
+            self._write(batch)
+
+    def stop(self, timeout=10):
+        """Stop the flush thread and write out any remaining rows"""
+        if self._stop_event.is_set():
+            return
+        self._stop_event.set()
+        if self._thread is not None:
+            self._thread.join(timeout)
+        self.flush()
+
+    def _run(self):
+        while not self._stop_event.is_set():
+            batch = self._collect()
+            if batch:
+                self._write(batch)
+
+    def _collect(self):
+        """Block until a batch is full or the flush interval has elapsed"""
+        batch = []
+        deadline = time.monotonic() + self.flush_interval
+        while len(batch) < self.batch_size and not self._stop_event.is_set():
+            timeout = deadline - time.monotonic()
+            if timeout <= 0:
+                break
+            try:
+                batch.append(self._queue.get(timeout=timeout))
+            except queue.Empty:
+                break
+        return batch
+
+    def _write(self, batch):
+        with self._write_lock, self.app.app_context():
+            written = self._insert(batch)
+            with self._counter_lock:
+                self.written += written
+                self.dropped += len(batch) - written
+
+    def _insert(self, rows):
+        """Insert rows, splitting the batch to isolate rows that fail; returns how many were written
+
+        One bad row (say, for a user deleted while it was queued) costs only
+        itself, not the rest of its batch.
+        """
+        try:
+            db.session.execute(insert(ActivityLog), rows)
+            db.session.commit()
+            return len(rows)
+        except Exception as e:
+            db.session.rollback()
+            if len(rows) == 1:
+                logging.error(f"Failed to write activity log record for user {rows[0].get('user_id')}: {str(e)}")
+                return 0
+        middle = len(rows) // 2
+        return self._insert(rows[:middle]) + self._insert(rows[middle:])
@@ -1,16 +1,28 @@
 import os
 import json
+import gzip
+import hashlib
 import logging
-import secrets
-import string
+import subprocess
+import shutil
+import sys
+import threading
+import time
 
+import click
+
+from collections import OrderedDict
 from datetime import datetime, timedelta
-from flask import Flask, render_template, request, jsonify, session, redirect, url_for, flash, send_from_directory
+from flask import Flask, render_template, request, jsonify, session, redirect, url_for, flash, send_file, send_from_directory, g, stream_with_context
 from flask_sqlalchemy import SQLAlchemy
-from sqlalchemy.orm import DeclarativeBase
+from sqlalchemy import func, select, update
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import DeclarativeBase, load_only, selectinload
 from werkzeug.middleware.proxy_fix import ProxyFix
-from werkzeug.utils import secure_filename
+from werkzeug.exceptions import NotFound
+from werkzeug.utils import secure_filename, send_file as werkzeug_send_file
 from functools import wraps
+from urllib.parse import quote
 
 # Configure logging
 logging.basicConfig(level=logging.DEBUG)
@@ -27,23 +39,62 @@ app.config["SQLALCHEMY_ENGINE_OPTIONS"] = {
     "pool_pre_ping": True,
 }
 
+# SQLite tuning: busy timeout through the engine options, pragmas applied on every connect
+from sqlite_tuning import sqlite_pragmas_from_env, sqlite_engine_options, init_sqlite_tuning
+
+if app.config["SQLALCHEMY_DATABASE_URI"].startswith("sqlite"):
+    app.config["SQLALCHEMY_ENGINE_OPTIONS"].update(sqlite_engine_options())
+app.config["SQLITE_PRAGMAS"] = sqlite_pragmas_from_env()
+app.config["SQLITE_OPTIMIZE_INTERVAL"] = int(os.environ.get("SQLITE_OPTIMIZE_INTERVAL", 0))
+
 # File upload configuration
 UPLOAD_FOLDER = 'uploads'
 ALLOWED_EXTENSIONS = {'pdf', 'doc', 'docx', 'txt', 'png', 'jpg', 'jpeg'}
 app.config['UPLOAD_FOLDER'] = UPLOAD_FOLDER
 app.config['MAX_CONTENT_LENGTH'] = 16 * 1024 * 1024  # 16MB max file size
+# Larger files go through the chunked upload API, one chunk per request
+app.config['UPLOAD_CHUNK_SIZE'] = int(os.environ.get('UPLOAD_CHUNK_SIZE', 8 * 1024 * 1024))
+app.config['UPLOAD_MAX_SIZE'] = int(os.environ.get('UPLOAD_MAX_SIZE', 2 * 1024 * 1024 * 1024))
+# Seconds a request waits for its document to be rendered
+app.config['PDF_RENDER_TIMEOUT'] = float(os.environ.get('PDF_RENDER_TIMEOUT', 30))
+# Batch rendering: documents per job, and how long finished jobs and their files are kept
+app.config['RENDER_JOB_MAX_ITEMS'] = int(os.environ.get('RENDER_JOB_MAX_ITEMS', 1000))
+app.config['RENDER_JOB_RETENTION_HOURS'] = float(os.environ.get('RENDER_JOB_RETENTION_HOURS', 72))
+# Rendered PDFs are cached by content; 0 disables the cache
+app.config['RENDER_CACHE_DIR'] = os.path.abspath(os.environ.get('RENDER_CACHE_DIR', 'render_cache'))
+app.config['RENDER_CACHE_MAX_BYTES'] = int(os.environ.get('RENDER_CACHE_MAX_BYTES', 256 * 1024 * 1024))
+# Orphaned files stay in quarantine this long before they are deleted
+app.config['FILE_GC_QUARANTINE_DAYS'] = int(os.environ.get('FILE_GC_QUARANTINE_DAYS', 7))
+app.config['FILE_GC_MAX_FILES'] = int(os.environ.get('FILE_GC_MAX_FILES', 10000))
+# Let the front proxy stream downloads: '' (serve from the app), 'nginx' (X-Accel-Redirect) or 'sendfile' (X-Sendfile)
+app.config['FILE_OFFLOAD'] = os.environ.get('FILE_OFFLOAD', '')
+# nginx internal location that maps onto FILE_OFFLOAD_ROOT
+app.config['FILE_OFFLOAD_PREFIX'] = os.environ.get('FILE_OFFLOAD_PREFIX', '/protected/')
+app.config['FILE_OFFLOAD_ROOT'] = os.path.abspath(os.environ.get('FILE_OFFLOAD_ROOT', os.getcwd()))
+# Database backups: '', 'gzip' or 'zstd' (needs the zstandard package)
+app.config['BACKUP_COMPRESSION'] = os.environ.get('BACKUP_COMPRESSION', '')
+# Backup retention: newest snapshot of each of the last N days and M weeks
+app.config['BACKUP_KEEP_DAILY'] = int(os.environ.get('BACKUP_KEEP_DAILY', 7))
+app.config['BACKUP_KEEP_WEEKLY'] = int(os.environ.get('BACKUP_KEEP_WEEKLY', 4))
+# Scheduled backups, run by one leader process across all workers
+app.config['BACKUP_SCHEDULER_ENABLED'] = os.environ.get('BACKUP_SCHEDULER', '1') == '1'
+app.config['BACKUP_INTERVAL_HOURS'] = float(os.environ.get('BACKUP_INTERVAL_HOURS', 24))
+# Streamed NDJSON database imports are exempt from the upload limit unless this is set
+app.config['IMPORT_MAX_CONTENT_LENGTH'] = int(os.environ['IMPORT_MAX_CONTENT_LENGTH']) if os.environ.get('IMPORT_MAX_CONTENT_LENGTH') else None
 
 # Ensure upload directory exists
 os.makedirs(UPLOAD_FOLDER, exist_ok=True)
 
 # Import models and initialize database
-from models import db, User, UserPDFCode, PDFRequest, Message, DownloadCode, BusinessSettings, UserBusinessSettings, ClientSettings, ActivityLog, GeneratedDocument, SystemSettings
+from models import db, User, UserPDFCode, PDFRequest, Message, DownloadCode, BusinessSettings, UserBusinessSettings, ClientSettings, ActivityLog, GeneratedDocument, RenderJob, SystemSettings, settings_to_dict, settings_to_json, clear_settings_json_cache, ensure_indexes
 
 # Initialize the app with the extension
 db.init_app(app)
+init_sqlite_tuning(app, db)
 
 with app.app_context():
     db.create_all()
+    ensure_indexes()
 
     # Create default admin user if none exists
     admin = User.query.filter_by(is_admin=True).first()
@@ -61,13 +112,138 @@ with app.app_context():
         db.session.commit()
         logging.info("Default admin user created: admin/admin123")
 
+from download_codes import create_download_codes
+from data_export import EXPORT_TABLES, JSON_EXPORT_TABLES, iter_table_rows, iter_ndjson_export
+from data_import import DataImportError, import_records, iter_json_records, iter_ndjson_records
+from backups import PRE_RESTORE_LABEL, BackupError, BackupStore, swap_in_staged
+from backup_scheduler import BackupScheduler, lower_process_priority, parse_last_run
+from file_storage import FileStore
+from chunked_uploads import UPLOAD_SESSION_MAX_AGE, UploadOffsetMismatch, UploadSessionError, UploadSessionStore
+from file_gc import OrphanCollector
+
+# Uploads are stored once per unique content under uploads/objects/
+file_store = FileStore(UPLOAD_FOLDER)
+upload_sessions = UploadSessionStore(os.path.join(UPLOAD_FOLDER, '.tmp', 'sessions'), file_store)
+
+# Activity logs are written in batches by a background thread
+from activity_log import ActivityLogWriter
+
+activity_writer = ActivityLogWriter(
+    app,
+    max_queue_size=int(os.environ.get('ACTIVITY_LOG_QUEUE_SIZE', 10000)),
+    batch_size=int(os.environ.get('ACTIVITY_LOG_BATCH_SIZE', 200)),
+    flush_interval=float(os.environ.get('ACTIVITY_LOG_FLUSH_INTERVAL', 2.0))
+)
+
+# Documents are rendered to PDF in a small pool of worker processes
+from pdf_render import RenderPool, RenderPoolBusy, UnsupportedDocument, render_to_file
+
+render_pool = RenderPool(
+    max_workers=int(os.environ.get('PDF_RENDER_WORKERS', 2)),
+    max_pending=int(os.environ.get('PDF_RENDER_QUEUE_SIZE', 8))
+)
+
+# Repeat renders of the same document are served from disk
+from render_cache import RenderCache, render_cache_key
+
+render_cache = RenderCache(app.config['RENDER_CACHE_DIR'], max_bytes=app.config['RENDER_CACHE_MAX_BYTES'])
+
+# Download counts are buffered in memory and added to UserPDFCode periodically
+from download_counts import DownloadCounter
+
+download_counter = DownloadCounter(app, flush_interval=float(os.environ.get('DOWNLOAD_COUNT_FLUSH_INTERVAL', 5.0)))
+
+# Batch render jobs are queued in the database and rendered by one leader process on all cores
+from render_jobs import RenderJobRunner, cancel_render_job, client_documents, create_render_job, iter_zip
+
+render_job_workers = int(os.environ.get('RENDER_JOB_WORKERS', os.cpu_count() or 2))
+render_job_runner = RenderJobRunner(
+    app,
+    render_job_workers,
+    lock_path=os.path.join(app.instance_path, 'render_jobs.lock'),
+    output_dir=os.path.join(os.getcwd(), 'generated_documents', 'jobs'),
+    retention=timedelta(hours=app.config['RENDER_JOB_RETENTION_HOURS']),
+    static_root=app.static_folder,
+    cache=render_cache,
+    cache_key=lambda document_data, user, generated_on: document_cache_key(document_data, user, generated_on)
+)
+
 def allowed_file(filename):
     return '.' in filename and filename.rsplit('.', 1)[1].lower() in ALLOWED_EXTENSIONS
 
+# Short-lived cache of (is_admin, is_verified) flags keyed by user id, so the
+# auth decorators can answer without touching the database on every request.
+# Changes made by another worker reach this one through the users_version
+# system setting, which is re-read at most every USER_FLAGS_VERSION_INTERVAL
+# seconds; that is how long a demoted or deleted user can keep their access here.
+USER_FLAGS_TTL = int(os.environ.get('USER_FLAGS_CACHE_TTL', 30))
+USER_FLAGS_CACHE_SIZE = int(os.environ.get('USER_FLAGS_CACHE_SIZE', 10000))
+USER_FLAGS_VERSION_INTERVAL = float(os.environ.get('USER_FLAGS_VERSION_INTERVAL', 1.0))
+_user_flags_cache = OrderedDict()
+_user_flags_lock = threading.Lock()
+_users_version = {'value': None, 'checked_at': None}
+
+def cache_user_flags(user):
+    with _user_flags_lock:
+        _user_flags_cache[user.id] = (time.monotonic() + USER_FLAGS_TTL, user.is_admin, user.is_verified)
+        _user_flags_cache.move_to_end(user.id)
+        while len(_user_flags_cache) > USER_FLAGS_CACHE_SIZE:
+            _user_flags_cache.popitem(last=False)
+
+def forget_user_flags(user_id=None):
+    """Drop cached flags in this process only, for one user or all of them"""
+    with _user_flags_lock:
+        if user_id is None:
+            _user_flags_cache.clear()
+        else:
+            _user_flags_cache.pop(user_id, None)
+
+def check_users_version():
+    """Clear the flags cache if another process changed a user since the last check"""
+    now = time.monotonic()
+    checked_at = _users_version['checked_at']
+    if checked_at is not None and now - checked_at < USER_FLAGS_VERSION_INTERVAL:
+        return
+    version = get_system_setting('users_version')
+    if checked_at is not None and version != _users_version['value']:
+        forget_user_flags()
+    _users_version.update(value=version, checked_at=now)
+
+def load_current_user():
+    """Return the logged-in User, loading it at most once per request"""
+    if 'current_user' not in g:
+        user_id = session.get('user_id')
+        g.current_user = db.session.get(User, user_id) if user_id else None
+        if g.current_user:
+            cache_user_flags(g.current_user)
+    return g.current_user
+
+def get_user_flags(user_id):
+    """Get cached (is_admin, is_verified) flags for the session user, or None if the user no longer exists"""
+    check_users_version()
+    with _user_flags_lock:
+        cached = _user_flags_cache.get(user_id)
+        if cached and cached[0] > time.monotonic():
+            _user_flags_cache.move_to_end(user_id)
+            return cached[1], cached[2]
+
+    user = load_current_user()
+    if not user:
+        return None
+    return user.is_admin, user.is_verified
+
+def invalidate_user_flags(user_id=None):
+    """Drop cached flags after a user's role, verification or existence changes, in every process
+
+    Call once the change is committed; this commits the new users_version.
+    """
+    forget_user_flags(user_id)
+    set_system_setting('users_version', f'{time.time_ns():x}')
+
 def login_required(f):
     @wraps(f)
     def decorated_function(*args, **kwargs):
-        if 'user_id' not in session:
+        if 'user_id' not in session or get_user_flags(session['user_id']) is None:
             flash('Please log in to access this page.', 'error')
             return redirect(url_for('login'))
         return f(*args, **kwargs)
@@ -80,33 +256,45 @@ def admin_required(f):
             flash('Please log in to access this page.', 'error')
             return redirect(url_for('login'))
 
-        user = User.query.get(session['user_id'])
-        if not user or not user.is_admin:
+        flags = get_user_flags(session['user_id'])
+        if not flags or not flags[0]:
             flash('Admin access required.', 'error')
             return redirect(url_for('dashboard'))
         return f(*args, **kwargs)
     return decorated_function
 
 def log_activity(user_id, activity_type, description, ip_address=None, user_agent=None):
-    """Log user activity"""
-    try:
-        activity = ActivityLog(
-            user_id=user_id,
-            activity_type=activity_type,
-            description=description,
-            ip_address=ip_address,
-            user_agent=user_agent
-        )
-        db.session.add(activity)
-        db.session.commit()
-    except Exception as e:
-        logging.error(f"Failed to log activity: {str(e)}")
+    """Queue a user activity record for the background log writer"""
+    if not activity_writer.log(
+        user_id=user_id,
+        activity_type=activity_type,
+        description=description,
+        ip_address=ip_address,
+        user_agent=user_agent
+    ):
+        logging.warning(f"Activity log queue full, dropped {activity_type} record for user {user_id}")
 
 def send_email(to_email, subject, body, is_html=False):
     """Email functionality disabled - SMTP settings removed"""
     logging.info(f"Email sending disabled - would have sent to {to_email}: {subject}")
     return True
 
+def splice_json(payload, fragments):
+    """Encode payload as a JSON object with already-encoded JSON values spliced in
+
+    fragments maps extra keys to bytes that are valid JSON, so cached settings
+    or stored document data can be sent without decoding and re-encoding them.
+    """
+    body = json.dumps(payload, separators=(',', ':')).encode('utf-8')[:-1]
+    for key, fragment in fragments.items():
+        if len(body) > 1:
+            body += b','
+        body += json.dumps(key).encode('utf-8') + b':' + fragment
+    return body + b'}'
+
+def spliced_json_response(payload, fragments, status=200):
+    return app.response_class(splice_json(payload, fragments), status=status, mimetype='application/json')
+
 @app.route('/')
 def index():
     """Main application page with document generator"""
@@ -168,7 +356,7 @@ def admin_register_user():
         db.session.commit()
 
         # Log registration activity
-        admin_user = User.query.get(session['user_id'])
+        admin_user = load_current_user()
         log_activity(session['user_id'], 'admin_user_creation', f"Admin {admin_user.username} created user {user.username}", request.remote_addr, request.user_agent.string)
 
         return jsonify({
@@ -228,6 +416,7 @@ def logout():
 
     if user_id:
         log_activity(user_id, 'logout', f"User {username} logged out", request.remote_addr, request.user_agent.string)
+        forget_user_flags(user_id)
 
     session.clear()
     flash('You have been logged out.', 'info')
@@ -239,7 +428,7 @@ def logout():
 @login_required
 def profile():
     """User profile management"""
-    user = User.query.get(session['user_id'])
+    user = load_current_user()
 
     if request.method == 'POST':
         data = request.get_json()
@@ -280,7 +469,7 @@ def profile():
 @login_required
 def dashboard():
     """User dashboard"""
-    user = User.query.get(session['user_id'])
+    user = load_current_user()
 
     if user.is_admin:
         return redirect(url_for('admin_dashboard'))
@@ -358,24 +547,9 @@ def upload_pdf_for_user(user_id):
 
         if file and allowed_file(file.filename):
             filename = secure_filename(file.filename)
-            # Add timestamp to prevent filename conflicts
-            timestamp = datetime.now().strftime('%Y%m%d_%H%M%S_')
-            filename = timestamp + filename
-
-            file_path = os.path.join(app.config['UPLOAD_FOLDER'], filename)
-            file.save(file_path)
-
-            user_pdf = UserPDFCode(
-                user_id=user_id,
-                filename=filename,
-                original_filename=file.filename,
-                file_path=file_path,
-                description=description,
-                uploaded_by_admin_id=session['user_id']
-            )
 
-            db.session.add(user_pdf)
-            db.session.commit()
+            staged = file_store.stage(file.stream)
+            save_user_pdf(staged, user_id, filename, file.filename, description, session['user_id'])
 
             return jsonify({'success': True, 'message': 'File uploaded successfully!'})
         else:
@@ -385,6 +559,102 @@ def upload_pdf_for_user(user_id):
         logging.error(f"Error uploading file: {str(e)}")
         return jsonify({'success': False, 'error': 'Failed to upload file'}), 500
 
+def save_user_pdf(staged, user_id, filename, original_filename, description, admin_id):
+    """Commit a UserPDFCode row for a staged file and move the file into the store
+
+    Identical content is stored once and shared between users.
+    """
+    try:
+        file_store.add_reference(staged.digest, staged.size)
+        user_pdf = UserPDFCode(
+            user_id=user_id,
+            filename=filename,
+            original_filename=original_filename,
+            file_path=staged.path,
+            description=description,
+            uploaded_by_admin_id=admin_id
+        )
+
+        db.session.add(user_pdf)
+        db.session.commit()
+        file_store.publish(staged)
+        return user_pdf
+    finally:
+        file_store.discard(staged)
+
+@app.route('/api/upload-pdf/<int:user_id>/chunked', methods=['POST'])
+@admin_required
+def start_chunked_upload(user_id):
+    """Start a resumable upload; the file is then sent in chunks with PATCH"""
+    try:
+        data = request.get_json(silent=True) or {}
+        original_filename = data.get('filename', '')
+        size = data.get('size')
+
+        if not original_filename or not allowed_file(original_filename):
+            return jsonify({'success': False, 'error': 'Invalid file type'}), 400
+        if not isinstance(size, int) or size <= 0 or size > app.config['UPLOAD_MAX_SIZE']:
+            return jsonify({'success': False, 'error': f"File size must be between 1 byte and {app.config['UPLOAD_MAX_SIZE']} bytes"}), 400
+        if not User.query.get(user_id):
+            return jsonify({'success': False, 'error': 'User not found'}), 404
+
+        upload_sessions.sweep()
+        upload_id = upload_sessions.create(
+            size,
+            user_id=user_id,
+            admin_id=session['user_id'],
+            filename=secure_filename(original_filename),
+            original_filename=original_filename,
+            description=data.get('description', ''),
+            sha256=data.get('sha256')
+        )
+
+        return jsonify({'success': True, 'upload_id': upload_id, 'offset': 0, 'chunk_size': app.config['UPLOAD_CHUNK_SIZE']}), 201
+
+    except Exception as e:
+        logging.error(f"Error starting upload: {str(e)}")
+        return jsonify({'success': False, 'error': 'Failed to start upload'}), 500
+
+@app.route('/api/upload-pdf/<int:user_id>/chunked/<upload_id>', methods=['GET', 'PATCH', 'DELETE'])
+@admin_required
+def chunked_upload(user_id, upload_id):
+    """Get the resume offset (GET), send a chunk at Upload-Offset (PATCH) or abort (DELETE)
+
+    The upload is committed as a UserPDFCode row when its last chunk arrives.
+    """
+    try:
+        metadata = upload_sessions.load(upload_id)
+        if metadata['user_id'] != user_id:
+            return jsonify({'success': False, 'error': 'Unknown upload'}), 404
+
+        if request.method == 'GET':
+            return jsonify({'success': True, 'offset': metadata['offset'], 'size': metadata['size']})
+
+        if request.method == 'DELETE':
+            upload_sessions.abort(upload_id)
+            return jsonify({'success': True, 'message': 'Upload cancelled'})
+
+        offset = request.headers.get('Upload-Offset', type=int)
+        if offset is None:
+            return jsonify({'success': False, 'error': 'Upload-Offset header is required'}), 400
+
+        offset = upload_sessions.append(upload_id, offset, request.stream)
+        if offset < metadata['size']:
+            return jsonify({'success': True, 'offset': offset, 'complete': False})
+
+        metadata, staged = upload_sessions.finish(upload_id)
+        user_pdf = save_user_pdf(staged, user_id, metadata['filename'], metadata['original_filename'], metadata['description'], metadata['admin_id'])
+
+        return jsonify({'success': True, 'offset': offset, 'complete': True, 'file_id': user_pdf.id, 'message': 'File uploaded successfully!'})
+
+    except UploadOffsetMismatch as e:
+        return jsonify({'success': False, 'error': str(e), 'offset': e.offset}), 409
+    except UploadSessionError as e:
+        return jsonify({'success': False, 'error': str(e)}), 400
+    except Exception as e:
+        logging.error(f"Error receiving upload chunk: {str(e)}")
+        return jsonify({'success': False, 'error': 'Failed to upload file'}), 500
+
 @app.route('/api/respond-request/<int:request_id>', methods=['POST'])
 @admin_required
 def respond_to_request(request_id):
@@ -413,6 +683,36 @@ def respond_to_request(request_id):
         logging.error(f"Error responding to request: {str(e)}")
         return jsonify({'success': False, 'error': 'Failed to respond to request'}), 500
 
+def send_download(path, download_name):
+    """Send a file as an attachment, after the caller has checked permissions
+
+    With FILE_OFFLOAD=nginx or sendfile the response only carries an
+    X-Accel-Redirect or X-Sendfile header and the front proxy streams the
+    file (and handles Range requests itself). Otherwise the file is sent from
+    here with ETag, Last-Modified and Range support.
+    """
+    path = os.path.abspath(path)
+    if not os.path.isfile(path):
+        raise NotFound()
+
+    offload = app.config['FILE_OFFLOAD']
+    relative_path = os.path.relpath(path, app.config['FILE_OFFLOAD_ROOT'])
+    if offload in ('nginx', 'sendfile') and relative_path.split(os.sep, 1)[0] != os.pardir:
+        response = werkzeug_send_file(
+            path, request.environ, as_attachment=True, download_name=download_name,
+            use_x_sendfile=True, conditional=False, response_class=app.response_class
+        )
+        if offload == 'nginx':
+            del response.headers['X-Sendfile']
+            response.headers['X-Accel-Redirect'] = app.config['FILE_OFFLOAD_PREFIX'].rstrip('/') + '/' + quote(relative_path.replace(os.sep, '/'))
+    else:
+        # Content-addressed uploads never change, so their digest is a strong ETag
+        response = send_file(path, as_attachment=True, download_name=download_name, conditional=True, etag=file_store.digest_from_path(path) or True)
+
+    # Downloads are per-user; shared caches must not keep them
+    response.cache_control.private = True
+    return response
+
 @app.route('/download/<int:file_id>')
 @login_required
 def download_file(file_id):
@@ -428,19 +728,16 @@ def download_file(file_id):
         flash('Access denied.', 'error')
         return redirect(url_for('dashboard'))
 
-    # Update download stats
-    user_pdf.download_count += 1
-    user_pdf.downloaded_at = datetime.utcnow()
-    db.session.commit()
+    # Counted in memory; the database is updated in the background
+    download_counter.record(user_pdf.id)
 
-    return send_from_directory(app.config['UPLOAD_FOLDER'], user_pdf.filename, 
-                             as_attachment=True, download_name=user_pdf.original_filename)
+    return send_download(user_pdf.file_path, user_pdf.original_filename)
 
 @app.route('/messages')
 @login_required
 def messages():
     """Messages page"""
-    user = User.query.get(session['user_id'])
+    user = load_current_user()
 
     # Get all messages for this user
     sent_messages = Message.query.filter_by(sender_id=user.id).order_by(Message.created_at.desc()).all()
@@ -471,7 +768,7 @@ def send_message():
             return jsonify({'success': False, 'error': 'Recipient not found'}), 404
 
         # Check if user can message this recipient (users can only message admins)
-        sender = User.query.get(session['user_id'])
+        sender = load_current_user()
         if not sender.is_admin and not recipient.is_admin:
             return jsonify({'success': False, 'error': 'Users can only message administrators'}), 403
 
@@ -578,19 +875,14 @@ def generate_code():
         if not user:
             return jsonify({'success': False, 'error': 'User not found'}), 404
 
-        # Generate a random 8-character code
-        code = ''.join(secrets.choice(string.ascii_uppercase + string.digits) for _ in range(8))
-
-        # Store the code in database with expiration (24 hours)
+        # Generate a random 8-character code with expiration (24 hours)
         expiry = datetime.utcnow() + timedelta(hours=24)
-        download_code = DownloadCode(
-            code=code, 
+        code = create_download_codes(
+            1,
+            expiry,
             user_id=user_id,
-            document_data=json.dumps(document_data) if document_data else None,
-            expires_at=expiry
-        )
-        db.session.add(download_code)
-        db.session.commit()
+            document_data=json.dumps(document_data) if document_data else None
+        )[0]
 
         return jsonify({
             'success': True,
@@ -602,41 +894,86 @@ def generate_code():
         logging.error(f"Error generating code: {str(e)}")
         return jsonify({'success': False, 'error': 'Failed to generate code'}), 500
 
+# Anyone may generate a small batch of codes; larger print runs need an admin
+BULK_CODES_PUBLIC_MAX = 100
+BULK_CODES_ADMIN_MAX = int(os.environ.get('BULK_CODES_ADMIN_MAX', 100000))
+
+def stream_codes(codes, expires_at, output_format):
+    """Yield the generated codes as CSV or NDJSON in chunks of lines"""
+    expiry = expires_at.isoformat()
+    if output_format == 'csv':
+        yield 'code,expires_at\n'
+    for i in range(0, len(codes), 1000):
+        if output_format == 'csv':
+            yield ''.join(f"{code},{expiry}\n" for code in codes[i:i + 1000])
+        else:
+            yield ''.join(json.dumps({'code': code, 'expires_at': expiry}) + '\n' for code in codes[i:i + 1000])
+
 @app.route('/api/generate-bulk-codes', methods=['POST'])
 def generate_bulk_codes():
-    """Generate multiple one-time download codes"""
+    """Generate multiple one-time download codes (?format=json|csv|ndjson)"""
     try:
         data = request.get_json()
-        quantity = data.get('quantity', 1)
+        try:
+            quantity = int(data.get('quantity', 1))
+        except (TypeError, ValueError):
+            return jsonify({'success': False, 'error': 'Quantity must be a number'}), 400
+
+        output_format = request.args.get('format', data.get('format', 'json'))
+        if output_format not in ('json', 'csv', 'ndjson'):
+            return jsonify({'success': False, 'error': 'Format must be json, csv or ndjson'}), 400
 
         # Validate quantity
-        if quantity < 1 or quantity > 100:
-            return jsonify({'success': False, 'error': 'Quantity must be between 1 and 100'}), 400
+        flags = get_user_flags(session['user_id']) if 'user_id' in session else None
+        max_quantity = BULK_CODES_ADMIN_MAX if flags and flags[0] else BULK_CODES_PUBLIC_MAX
+        if quantity < 1 or quantity > max_quantity:
+            return jsonify({'success': False, 'error': f'Quantity must be between 1 and {max_quantity}'}), 400
 
         # Generate codes
-        codes = []
         expiry = datetime.utcnow() + timedelta(days=365)  # 1 year expiry
+        codes = create_download_codes(quantity, expiry)
 
-        for _ in range(quantity):
-            code = ''.join(secrets.choice(string.ascii_uppercase + string.digits) for _ in range(8))
-            download_code = DownloadCode(code=code, expires_at=expiry)
-            db.session.add(download_code)
-            codes.append({
-                'code': code,
-                'expires_at': expiry.isoformat()
-            })
-
-        db.session.commit()
+        if output_format != 'json':
+            timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
+            mimetype = 'text/csv' if output_format == 'csv' else 'application/x-ndjson'
+            response = app.response_class(stream_codes(codes, expiry, output_format), mimetype=mimetype)
+            response.headers['Content-Disposition'] = f'attachment; filename=download_codes_{timestamp}.{output_format}'
+            return response
 
         return jsonify({
             'success': True,
-            'codes': codes,
+            'codes': [{'code': code, 'expires_at': expiry.isoformat()} for code in codes],
             'expires_at': expiry.isoformat()
         })
     except Exception as e:
+        db.session.rollback()
         logging.error(f"Error generating bulk codes: {str(e)}")
         return jsonify({'success': False, 'error': 'Failed to generate codes'}), 500
 
+def redeem_download_code(code):
+    """Atomically mark an unused, unexpired code as used
+
+    A single conditional UPDATE claims the code, so concurrent requests for
+    the same code cannot both succeed. Returns (user_id, document_data) for
+    the redeemed code, or None if it could not be redeemed. The caller
+    commits.
+    """
+    now = datetime.utcnow()
+    stmt = (update(DownloadCode)
+            .where(DownloadCode.code == code, DownloadCode.used == False, DownloadCode.expires_at > now)
+            .values(used=True, used_at=now))
+
+    if db.engine.dialect.update_returning:
+        return db.session.execute(stmt.returning(DownloadCode.user_id, DownloadCode.document_data)).first()
+
+    # Engines without UPDATE ... RETURNING: the code is unique, so once our
+    # UPDATE has claimed it the row can be read back safely
+    if db.session.execute(stmt).rowcount != 1:
+        return None
+    return db.session.execute(
+        select(DownloadCode.user_id, DownloadCode.document_data).where(DownloadCode.code == code)
+    ).first()
+
 @app.route('/api/verify-code', methods=['POST'])
 def verify_code():
     """Verify and consume a download code"""
@@ -647,94 +984,50 @@ def verify_code():
         if not code:
             return jsonify({'success': False, 'error': 'Code is required'}), 400
 
-        # Find the code in database
-        download_code = DownloadCode.query.filter_by(code=code, used=False).first()
-
-        if not download_code:
+        redeemed = redeem_download_code(code)
+        if not redeemed:
+            db.session.rollback()
+            # Only failed redemptions pay for a lookup to pick the error message
+            download_code = DownloadCode.query.filter_by(code=code, used=False).first()
+            if download_code:
+                return jsonify({'success': False, 'error': 'Code has expired'}), 400
             return jsonify({'success': False, 'error': 'Invalid or already used code'}), 400
 
-        # Check if code has expired
-        if download_code.expires_at < datetime.utcnow():
-            return jsonify({'success': False, 'error': 'Code has expired'}), 400
+        user_id, document_data = redeemed
 
         # Prepare response data
         response_data = {
             'success': True,
-            'message': 'Code verified successfully',
-            'business_settings': {}
+            'message': 'Code verified successfully'
         }
 
-        # Get user's business settings if user is associated with code
-        if download_code.user_id:
-            user = download_code.user
-            user_settings = UserBusinessSettings.query.filter_by(user_id=user.id).first()
-
+        # Use the user's business settings if a user is associated with the code,
+        # otherwise (bulk codes) the default settings
+        user_row = None
+        if user_id:
+            # User and settings in one query
+            user_row = (db.session.query(User, UserBusinessSettings)
+                        .outerjoin(UserBusinessSettings, UserBusinessSettings.user_id == User.id)
+                        .filter(User.id == user_id)
+                        .first())
+
+        if user_row:
+            user, user_settings = user_row
             response_data['user_info'] = {
                 'name': f"{user.first_name} {user.last_name}",
                 'email': user.email
             }
-
-            # Add business settings if available
-            if user_settings:
-                response_data['business_settings'] = {
-                    'businessName': user_settings.business_name or '',
-                    'businessAddress': user_settings.business_address or '',
-                    'businessPhone': user_settings.business_phone or '',
-                    'businessEmail': user_settings.business_email or '',
-                    'businessLogoUrl': user_settings.business_logo_url or '',
-                    'signatureUrl': user_settings.signature_url or '',
-                    'taxRate': user_settings.tax_rate or 0,
-                    'currency': user_settings.currency or 'USD'
-                }
-            else:
-                # Create empty settings for user if none exist
-                response_data['business_settings'] = {
-                    'businessName': '',
-                    'businessAddress': '',
-                    'businessPhone': '',
-                    'businessEmail': '',
-                    'businessLogoUrl': '',
-                    'signatureUrl': '',
-                    'taxRate': 0,
-                    'currency': 'USD'
-                }
+            fragments = {'business_settings': settings_to_json(user_settings)}
         else:
-            # For bulk codes without specific user, use default settings
-            default_settings = BusinessSettings.query.first()
-            if default_settings:
-                response_data['business_settings'] = {
-                    'businessName': default_settings.business_name or '',
-                    'businessAddress': default_settings.business_address or '',
-                    'businessPhone': default_settings.business_phone or '',
-                    'businessEmail': default_settings.business_email or '',
-                    'businessLogoUrl': default_settings.business_logo_url or '',
-                    'signatureUrl': default_settings.signature_url or '',
-                    'taxRate': default_settings.tax_rate or 0,
-                    'currency': default_settings.currency or 'USD'
-                }
-            else:
-                # Default empty settings
-                response_data['business_settings'] = {
-                    'businessName': '',
-                    'businessAddress': '',
-                    'businessPhone': '',
-                    'businessEmail': '',
-                    'businessLogoUrl': '',
-                    'signatureUrl': '',
-                    'taxRate': 0,
-                    'currency': 'USD'
-                }
-
-        # Add document data if available
-        if download_code.document_data:
-            response_data['document_data'] = json.loads(download_code.document_data)
-
-        # Mark code as used
-        download_code.used = True
-        download_code.used_at = datetime.utcnow()
+            fragments = {'business_settings': settings_to_json(BusinessSettings.query.first())}
+
+        # Document data is stored as JSON text and is passed through as-is
+        if document_data:
+            fragments['document_data'] = document_data.encode('utf-8')
+
         db.session.commit()
 
-        return jsonify(response_data)
+        return spliced_json_response(response_data, fragments)
 
     except Exception as e:
         logging.error(f"Error verifying code: {str(e)}")
@@ -765,6 +1058,7 @@ def save_business_settings():
         business_settings.updated_at = datetime.utcnow()
 
         db.session.commit()
+        invalidate_public_settings()
 
         logging.info(f"Business settings saved by admin {session['user_id']}: {business_settings.business_name}")
 
@@ -778,41 +1072,38 @@ def save_business_settings():
         logging.error(f"Error saving business settings: {str(e)}")
         return jsonify({'success': False, 'error': 'Failed to save business settings'}), 500
 
+# Encoded /api/get-public-settings response, shared by all anonymous page loads.
+# Settings writes in this process invalidate it; the TTL bounds staleness
+# when another worker made the change.
+PUBLIC_SETTINGS_TTL = int(os.environ.get('PUBLIC_SETTINGS_CACHE_TTL', 60))
+_public_settings_cache = {}
+
+def invalidate_public_settings():
+    """Drop the cached public settings after the global settings change"""
+    _public_settings_cache.clear()
+
+def get_public_settings_payload():
+    """Return (body, etag) for the public settings response, rebuilding it when stale"""
+    cached = _public_settings_cache.get('payload')
+    if cached and cached[2] > time.monotonic():
+        return cached[0], cached[1]
+
+    body = splice_json({'success': True}, {'settings': settings_to_json(BusinessSettings.query.first())})
+    etag = hashlib.sha256(body).hexdigest()
+    _public_settings_cache['payload'] = (body, etag, time.monotonic() + PUBLIC_SETTINGS_TTL)
+    return body, etag
+
 @app.route('/api/get-public-settings')
 def get_public_settings():
     """Get default business settings for public use"""
     try:
-        # Get default global settings
-        settings = BusinessSettings.query.first()
-        if settings:
-            return jsonify({
-                'success': True,
-                'settings': {
-                    'businessName': settings.business_name or '',
-                    'businessAddress': settings.business_address or '',
-                    'businessPhone': settings.business_phone or '',
-                    'businessEmail': settings.business_email or '',
-                    'businessLogoUrl': settings.business_logo_url or '',
-                    'signatureUrl': settings.signature_url or '',
-                    'taxRate': settings.tax_rate or 0,
-                    'currency': settings.currency or 'USD'
-                }
-            })
+        body, etag = get_public_settings_payload()
 
-        # Default empty settings
-        return jsonify({
-            'success': True,
-            'settings': {
-                'businessName': '',
-                'businessAddress': '',
-                'businessPhone': '',
-                'businessEmail': '',
-                'businessLogoUrl': '',
-                'signatureUrl': '',
-                'taxRate': 0,
-                'currency': 'USD'
-            }
-        })
+        response = app.response_class(body, mimetype='application/json')
+        response.set_etag(etag)
+        # Let browsers keep the response but revalidate it, so repeat loads get a 304
+        response.headers['Cache-Control'] = 'public, no-cache'
+        return response.make_conditional(request)
 
     except Exception as e:
         logging.error(f"Error getting public settings: {str(e)}")
@@ -823,36 +1114,9 @@ def get_public_settings():
 def get_business_settings():
     """Get business settings for admin to edit"""
     try:
+        # Falls back to empty defaults for a new setup
         settings = BusinessSettings.query.first()
-        if settings:
-            return jsonify({
-                'success': True,
-                'settings': {
-                    'businessName': settings.business_name or '',
-                    'businessAddress': settings.business_address or '',
-                    'businessPhone': settings.business_phone or '',
-                    'businessEmail': settings.business_email or '',
-                    'businessLogoUrl': settings.business_logo_url or '',
-                    'signatureUrl': settings.signature_url or '',
-                    'taxRate': settings.tax_rate or 0,
-                    'currency': settings.currency or 'USD'
-                }
-            })
-
-        # Default empty settings for new setup
-        return jsonify({
-            'success': True,
-            'settings': {
-                'businessName': '',
-                'businessAddress': '',
-                'businessPhone': '',
-                'businessEmail': '',
-                'businessLogoUrl': '',
-                'signatureUrl': '',
-                'taxRate': 0,
-                'currency': 'USD'
-            }
-        })
+        return spliced_json_response({'success': True}, {'settings': settings_to_json(settings)})
 
     except Exception as e:
         logging.error(f"Error getting business settings: {str(e)}")
@@ -868,14 +1132,7 @@ def export_business_settings():
             return jsonify({'success': False, 'error': 'No business settings found'}), 404
 
         settings_data = {
-            'businessName': settings.business_name,
-            'businessAddress': settings.business_address,
-            'businessPhone': settings.business_phone,
-            'businessEmail': settings.business_email,
-            'businessLogoUrl': settings.business_logo_url,
-            'signatureUrl': settings.signature_url,
-            'taxRate': settings.tax_rate,
-            'currency': settings.currency,
+            **settings.to_settings_dict(),
             'exportDate': datetime.utcnow().isoformat(),
             'exportedBy': f"{session['user_id']}",
             'version': '1.0'
@@ -926,6 +1183,7 @@ def import_business_settings():
         business_settings.updated_at = datetime.utcnow()
 
         db.session.commit()
+        invalidate_public_settings()
 
         # Log admin activity
         log_activity(session['user_id'], 'business_settings_import', f"Admin imported business settings", request.remote_addr, request.user_agent.string)
@@ -960,6 +1218,7 @@ def reset_business_settings():
         business_settings.updated_at = datetime.utcnow()
 
         db.session.commit()
+        invalidate_public_settings()
 
         # Log admin activity
         log_activity(session['user_id'], 'business_settings_reset', f"Admin reset business settings to defaults", request.remote_addr, request.user_agent.string)
@@ -971,47 +1230,74 @@ def reset_business_settings():
         logging.error(f"Error resetting business settings: {str(e)}")
         return jsonify({'success': False, 'error': 'Failed to reset business settings'}), 500
 
+# Fields accepted by the ?fields= selector of /api/admin/users
+USER_LIST_FIELDS = ('id', 'username', 'email', 'first_name', 'last_name', 'created_at', 'last_login', 'business_settings', 'clients')
+USER_LIST_COLUMNS = ('username', 'email', 'first_name', 'last_name', 'created_at', 'last_login')
+
+def serialize_user_for_admin(user, fields):
+    """Build the admin users payload for one user, limited to the requested fields"""
+    user_data = {}
+    for field in fields:
+        if field == 'business_settings':
+            user_settings = user.business_settings[0] if user.business_settings else None
+            user_data['business_settings'] = settings_to_dict(user_settings)
+        elif field == 'clients':
+            user_data['clients'] = [{
+                'id': client.id,
+                'name': client.client_name,
+                'address': client.client_address,
+                'email': client.client_email,
+                'phone': client.client_phone,
+                'is_active': client.is_active
+            } for client in user.clients]
+        elif field == 'created_at':
+            user_data['created_at'] = user.created_at.isoformat() if user.created_at else None
+        elif field == 'last_login':
+            user_data['last_login'] = user.last_login.isoformat() if user.last_login else None
+        else:
+            user_data[field] = getattr(user, field)
+    return user_data
+
 @app.route('/api/admin/users')
 @admin_required
 def get_all_users():
-    """Get all users for admin"""
+    """Get users for admin using keyset pagination (?after=<id>&per_page=N&fields=a,b)"""
     try:
-        users = User.query.filter_by(is_admin=False).all()
-        users_data = []
-
-        for user in users:
-            user_settings = UserBusinessSettings.query.filter_by(user_id=user.id).first()
-            clients = ClientSettings.query.filter_by(user_id=user.id).all()
-
-            users_data.append({
-                'id': user.id,
-                'username': user.username,
-                'email': user.email,
-                'first_name': user.first_name,
-                'last_name': user.last_name,
-                'created_at': user.created_at.isoformat(),
-                'last_login': user.last_login.isoformat() if user.last_login else None,
-                'business_settings': {
-                    'businessName': user_settings.business_name if user_settings else '',
-                    'businessAddress': user_settings.business_address if user_settings else '',
-                    'businessPhone': user_settings.business_phone if user_settings else '',
-                    'businessEmail': user_settings.business_email if user_settings else '',
-                    'businessLogoUrl': user_settings.business_logo_url if user_settings else '',
-                    'signatureUrl': user_settings.signature_url if user_settings else '',
-                    'taxRate': user_settings.tax_rate if user_settings else 0,
-                    'currency': user_settings.currency if user_settings else 'USD'
-                },
-                'clients': [{
-                    'id': client.id,
-                    'name': client.client_name,
-                    'address': client.client_address,
-                    'email': client.client_email,
-                    'phone': client.client_phone,
-                    'is_active': client.is_active
-                } for client in clients]
-            })
+        per_page = min(max(request.args.get('per_page', 100, type=int), 1), 500)
+        after_id = request.args.get('after', 0, type=int)
+
+        fields_param = request.args.get('fields')
+        if fields_param:
+            fields = [field for field in fields_param.split(',') if field in USER_LIST_FIELDS]
+            if not fields:
+                return jsonify({'success': False, 'error': 'No valid fields requested'}), 400
+        else:
+            fields = list(USER_LIST_FIELDS)
+
+        # Load only the requested columns and at most one extra SELECT per relationship,
+        # so the query count does not grow with the number of users
+        options = [load_only(User.id, *[getattr(User, field) for field in fields if field in USER_LIST_COLUMNS])]
+        if 'business_settings' in fields:
+            options.append(selectinload(User.business_settings))
+        if 'clients' in fields:
+            options.append(selectinload(User.clients))
+
+        users = (User.query
+                 .options(*options)
+                 .filter(User.is_admin == False, User.id > after_id)
+                 .order_by(User.id)
+                 .limit(per_page + 1)
+                 .all())
+
+        has_more = len(users) > per_page
+        users = users[:per_page]
+        users_data = [serialize_user_for_admin(user, fields) for user in users]
 
-        return jsonify({'success': True, 'users': users_data})
+        return jsonify({
+            'success': True,
+            'users': users_data,
+            'next_cursor': users[-1].id if has_more else None
+        })
 
     except Exception as e:
         logging.error(f"Error getting users: {str(e)}")
@@ -1033,17 +1319,8 @@ def generate_code_for_user():
             return jsonify({'success': False, 'error': 'User not found'}), 404
 
         # Generate code
-        code = ''.join(secrets.choice(string.ascii_uppercase + string.digits) for _ in range(8))
         expiry = datetime.utcnow() + timedelta(hours=24)
-
-        download_code = DownloadCode(
-            code=code,
-            user_id=user_id,
-            expires_at=expiry
-        )
-
-        db.session.add(download_code)
-        db.session.commit()
+        code = create_download_codes(1, expiry, user_id=user_id)[0]
 
         return jsonify({
             'success': True,
@@ -1123,6 +1400,7 @@ def toggle_user_verification(user_id):
 
         user.is_verified = not user.is_verified
         db.session.commit()
+        invalidate_user_flags(user.id)
 
         status = 'verified' if user.is_verified else 'unverified'
 
@@ -1201,6 +1479,8 @@ def delete_user(user_id):
             return jsonify({'success': False, 'error': 'Cannot delete admin user'}), 400
 
         # Delete user's files and messages
+        released = [file_store.digest_from_path(pdf_code.file_path) for pdf_code in user.pdf_codes]
+        released = [digest for digest in released if digest]
         for pdf_code in user.pdf_codes:
             db.session.delete(pdf_code)
 
@@ -1235,8 +1515,21 @@ def delete_user(user_id):
         for doc in generated_docs:
             db.session.delete(doc)
 
+        # Delete user's render jobs; their files are removed after the commit
+        render_job_ids = [job.id for job in user.render_jobs]
+        for job in user.render_jobs:
+            db.session.delete(job)
+
         db.session.delete(user)
+        for digest in released:
+            file_store.release_reference(digest)
         db.session.commit()
+        invalidate_user_flags(user_id)
+
+        for digest in released:
+            file_store.remove_if_unreferenced(digest)
+        for job_id in render_job_ids:
+            shutil.rmtree(render_job_runner.job_dir(job_id), ignore_errors=True)
 
         # Log deletion activity
         log_activity(session['user_id'], 'user_deletion', f"Admin deleted user {user.username}", request.remote_addr, request.user_agent.string)
@@ -1302,7 +1595,7 @@ def update_user_password(user_id):
         db.session.commit()
 
         # Log admin activity
-        admin_user = User.query.get(session['user_id'])
+        admin_user = load_current_user()
         log_activity(session['user_id'], 'admin_password_change', f"Admin {admin_user.username} changed password for user {user.username}", request.remote_addr, request.user_agent.string)
 
         return jsonify({'success': True, 'message': 'Password updated successfully'})
@@ -1340,7 +1633,10 @@ def get_activity_logs():
             'logs': logs_data,
             'total': logs.total,
             'pages': logs.pages,
-            'current_page': page
+            'current_page': page,
+            'writer': activity_writer.stats(),
+            'download_counter': download_counter.stats(),
+            'render_cache': render_cache.stats()
         })
 
     except Exception as e:
@@ -1382,12 +1678,7 @@ def download_generated_document(doc_id):
             return jsonify({'success': False, 'error': 'Document not found'}), 404
 
         if os.path.exists(doc.file_path):
-            return send_from_directory(
-                os.path.dirname(doc.file_path),
-                os.path.basename(doc.file_path),
-                as_attachment=True,
-                download_name=f"{doc.document_title}.pdf"
-            )
+            return send_download(doc.file_path, f"{doc.document_title}.pdf")
         else:
             return jsonify({'success': False, 'error': 'File not found on disk'}), 404
 
@@ -1395,222 +1686,455 @@ def download_generated_document(doc_id):
         logging.error(f"Error downloading document: {str(e)}")
         return jsonify({'success': False, 'error': 'Failed to download document'}), 500
 
+def new_generated_document(document_type, document_title):
+    """A GeneratedDocument for the session user with a fresh file path (not yet added)"""
+    # Create generated documents directory if it doesn't exist
+    docs_dir = os.path.join(os.getcwd(), 'generated_documents')
+    os.makedirs(docs_dir, exist_ok=True)
+
+    # Generate filename
+    timestamp = datetime.now().strftime('%Y%m%d_%H%M%S_%f')
+    filename = f"{secure_filename(document_type) or 'document'}_{timestamp}.pdf"
+
+    return GeneratedDocument(
+        user_id=session['user_id'],
+        document_type=document_type,
+        document_title=document_title,
+        file_path=os.path.join(docs_dir, filename)
+    )
+
+def get_settings_version(user_id):
+    """Changes whenever the global or the user's business settings are saved"""
+    global_updated = db.session.execute(select(func.max(BusinessSettings.updated_at))).scalar()
+    user_updated = db.session.execute(
+        select(func.max(UserBusinessSettings.updated_at)).where(UserBusinessSettings.user_id == user_id)
+    ).scalar()
+    return f'{global_updated}|{user_updated}'
+
+def document_cache_key(document_data, user, generated_on):
+    return render_cache_key(document_data, user.username, generated_on, get_settings_version(user.id))
+
+def submit_render(document_data, file_path):
+    """Write a document's PDF to file_path, from the render cache or the render pool; returns the future"""
+    user = load_current_user()
+    generated_on = datetime.now()
+    future = render_cache.render(
+        render_pool, document_cache_key(document_data, user, generated_on), file_path,
+        render_to_file, document_data, file_path, user.username, generated_on, app.static_folder
+    )
+    future.add_done_callback(log_render_failure)
+    return future
+
+def log_render_failure(future):
+    if not future.cancelled() and future.exception() and not isinstance(future.exception(), UnsupportedDocument):
+        logging.error(f"Error rendering document: {str(future.exception())}")
+
 @app.route('/api/save-generated-document', methods=['POST'])
 @login_required
 def save_generated_document():
-    """Save generated document info"""
+    """Save generated document info, rendering the PDF on the server when document_data is sent"""
     try:
         data = request.get_json()
 
-        # Create generated documents directory if it doesn't exist
-        docs_dir = os.path.join(os.getcwd(), 'generated_documents')
-        os.makedirs(docs_dir, exist_ok=True)
-
-        # Generate filename
-        timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
-        filename = f"{data.get('document_type', 'document')}_{timestamp}.pdf"
-        file_path = os.path.join(docs_dir, filename)
-
-        # Save document record
-        doc = GeneratedDocument(
-            user_id=session['user_id'],
-            document_type=data.get('document_type', 'unknown'),
-            document_title=data.get('document_title', 'Untitled Document'),
-            file_path=file_path
-        )
-
+        doc = new_generated_document(data.get('document_type', 'unknown'), data.get('document_title', 'Untitled Document'))
         db.session.add(doc)
         db.session.commit()
 
+        # The browser already has its copy; the server's is rendered in the background
+        rendering = False
+        if isinstance(data.get('document_data'), dict):
+            try:
+                submit_render(data['document_data'], doc.file_path)
+                rendering = True
+            except RenderPoolBusy:
+                logging.warning(f"Render queue full, generated document {doc.id} has no server copy")
+
         # Log PDF generation activity
-        user = User.query.get(session['user_id'])
+        user = load_current_user()
         log_activity(session['user_id'], 'pdf_generated', f"User {user.username} generated {data.get('document_type')} - {data.get('document_title')}", request.remote_addr, request.user_agent.string)
 
         return jsonify({
             'success': True,
-            'file_path': file_path,
-            'document_id': doc.id
+            'file_path': doc.file_path,
+            'document_id': doc.id,
+            'rendering': rendering
         })
 
     except Exception as e:
         logging.error(f"Error saving generated document: {str(e)}")
         return jsonify({'success': False, 'error': 'Failed to save document info'}), 500
 
-@app.route('/api/admin/backup-database', methods=['POST'])
-@admin_required
-def backup_database():
-    """Create database backup"""
+@app.route('/api/render-document', methods=['POST'])
+@login_required
+def render_generated_document():
+    """Render a document on the server, record it and send the PDF"""
     try:
-        import shutil
-        from datetime import datetime
+        data = request.get_json(silent=True) or {}
+        document_data = data.get('document_data')
+        if not isinstance(document_data, dict):
+            return jsonify({'success': False, 'error': 'document_data is required'}), 400
 
-        # Create backups directory
-        backup_dir = get_backup_directory()
-        os.makedirs(backup_dir, exist_ok=True)
+        document_type = str(document_data.get('type') or 'document')
+        number = document_data.get('number', '')
+        doc = new_generated_document(document_type.lower(), f"{document_type} {number}")
 
-        # Generate backup filename
-        timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
-        backup_filename = f"database_backup_{timestamp}.db"
-        backup_path = os.path.join(backup_dir, backup_filename)
+        submit_render(document_data, doc.file_path).result(timeout=app.config['PDF_RENDER_TIMEOUT'])
 
-        # Copy database file
-        db_path = os.path.join(os.getcwd(), 'instance', 'business_docs.db')
-        if os.path.exists(db_path):
-            shutil.copy2(db_path, backup_path)
+        db.session.add(doc)
+        db.session.commit()
+
+        user = load_current_user()
+        log_activity(session['user_id'], 'pdf_generated', f"User {user.username} generated {doc.document_type} - {doc.document_title} on the server", request.remote_addr, request.user_agent.string)
 
-            # Also backup uploads and generated documents
-            if os.path.exists('uploads'):
-                shutil.copytree('uploads', os.path.join(backup_dir, f"uploads_backup_{timestamp}"), dirs_exist_ok=True)
+        return send_download(doc.file_path, f"{document_type}-{number}.pdf")
 
-            if os.path.exists('generated_documents'):
-                shutil.copytree('generated_documents', os.path.join(backup_dir, f"generated_documents_backup_{timestamp}"), dirs_exist_ok=True)
+    except RenderPoolBusy as e:
+        return jsonify({'success': False, 'error': str(e)}), 503
+    except UnsupportedDocument as e:
+        # The browser renderer embeds a font covering the text instead
+        return jsonify({'success': False, 'error': str(e), 'render_in_browser': True}), 422
+    except Exception as e:
+        logging.error(f"Error rendering document: {str(e)}")
+        return jsonify({'success': False, 'error': 'Failed to render document'}), 500
+
+def load_render_job(job_id):
+    """The RenderJob if the session user may see it (its owner or an admin), else None"""
+    job = db.session.get(RenderJob, job_id)
+    if job is None or (job.user_id != session['user_id'] and not get_user_flags(session['user_id'])[0]):
+        return None
+    return job
+
+def render_job_to_dict(job, include_items=True):
+    result = {
+        'job_id': job.id,
+        'status': job.status,
+        'total': job.total_items,
+        'completed': job.completed_items,
+        'failed': job.failed_items,
+        'created_at': job.created_at.isoformat() if job.created_at else None,
+        'started_at': job.started_at.isoformat() if job.started_at else None,
+        'finished_at': job.finished_at.isoformat() if job.finished_at else None,
+        'download_url': url_for('download_render_job', job_id=job.id)
+    }
+    if include_items:
+        result['items'] = [{
+            'position': item.position,
+            'status': item.status,
+            'attempts': item.attempts,
+            'error': item.error
+        } for item in job.items]
+    return result
+
+@app.route('/api/render-jobs', methods=['GET', 'POST'])
+@login_required
+def render_jobs():
+    """List the session user's render jobs, or queue a batch of documents
 
-            return jsonify({'success': True, 'message': 'Backup created successfully', 'backup_path': backup_path})
+    POST either {"documents": [document_data, ...]} or {"template": document_data,
+    "client_ids": [...] | "all"} to render one copy of the template per client.
+    """
+    try:
+        if request.method == 'GET':
+            jobs = RenderJob.query.filter_by(user_id=session['user_id']).order_by(RenderJob.created_at.desc()).limit(50).all()
+            return jsonify({'success': True, 'jobs': [render_job_to_dict(job, include_items=False) for job in jobs], 'runner': render_job_runner.stats()})
+
+        data = request.get_json(silent=True) or {}
+        if isinstance(data.get('template'), dict):
+            clients = ClientSettings.query.filter_by(user_id=session['user_id'], is_active=True)
+            if data.get('client_ids') != 'all':
+                clients = clients.filter(ClientSettings.id.in_([int(client_id) for client_id in data.get('client_ids') or []]))
+            documents = client_documents(data['template'], clients.order_by(ClientSettings.client_name).all())
         else:
-            return jsonify({'success': False, 'error': 'Database file not found'}), 404
+            documents = data.get('documents')
+
+        if not isinstance(documents, list) or not documents or not all(isinstance(document, dict) for document in documents):
+            return jsonify({'success': False, 'error': 'A non-empty list of documents (or a template and clients) is required'}), 400
+        if len(documents) > app.config['RENDER_JOB_MAX_ITEMS']:
+            return jsonify({'success': False, 'error': f"At most {app.config['RENDER_JOB_MAX_ITEMS']} documents per job"}), 400
 
+        job = create_render_job(session['user_id'], documents)
+        render_job_runner.start()
+        render_job_runner.wake()
+
+        user = load_current_user()
+        log_activity(session['user_id'], 'render_job_created', f"User {user.username} queued {len(documents)} documents for rendering (job {job.id})", request.remote_addr, request.user_agent.string)
+
+        return jsonify({'success': True, **render_job_to_dict(job, include_items=False)}), 202
+
+    except (TypeError, ValueError) as e:
+        return jsonify({'success': False, 'error': f'Invalid request: {str(e)}'}), 400
+    except Exception as e:
+        db.session.rollback()
+        logging.error(f"Error handling render jobs: {str(e)}")
+        return jsonify({'success': False, 'error': 'Failed to handle render jobs'}), 500
+
+@app.route('/api/render-jobs/<int:job_id>', methods=['GET', 'DELETE'])
+@login_required
+def render_job(job_id):
+    """Get a render job's progress per item, or cancel the items not yet started"""
+    try:
+        job = load_render_job(job_id)
+        if job is None:
+            return jsonify({'success': False, 'error': 'Render job not found'}), 404
+
+        if request.method == 'DELETE':
+            cancelled = cancel_render_job(job)
+            return jsonify({'success': True, 'cancelled': cancelled, **render_job_to_dict(job, include_items=False)})
+
+        return jsonify({'success': True, **render_job_to_dict(job)})
+
+    except Exception as e:
+        db.session.rollback()
+        logging.error(f"Error handling render job {job_id}: {str(e)}")
+        return jsonify({'success': False, 'error': 'Failed to handle render job'}), 500
+
+@app.route('/api/render-jobs/<int:job_id>/download')
+@login_required
+def download_render_job(job_id):
+    """Stream a ZIP of a job's rendered documents; ?partial=1 before the job has finished"""
+    try:
+        job = load_render_job(job_id)
+        if job is None:
+            return jsonify({'success': False, 'error': 'Render job not found'}), 404
+        if job.status not in ('completed', 'cancelled') and request.args.get('partial') != '1':
+            return jsonify({'success': False, 'error': 'Render job has not finished', **render_job_to_dict(job, include_items=False)}), 409
+
+        entries = []
+        failures = []
+        for item in job.items:
+            if item.status == 'done' and item.file_path and os.path.exists(item.file_path):
+                entries.append((os.path.basename(item.file_path), item.file_path))
+            elif item.status in ('failed', 'cancelled'):
+                failures.append(f"{item.position}\t{item.status}\t{item.error or ''}")
+        if failures:
+            entries.append(('failures.txt', ('position\tstatus\terror\n' + '\n'.join(failures) + '\n').encode('utf-8')))
+
+        response = app.response_class(iter_zip(entries), mimetype='application/zip')
+        response.headers['Content-Disposition'] = f'attachment; filename=render_job_{job.id}.zip'
+        return response
+
+    except Exception as e:
+        logging.error(f"Error downloading render job {job_id}: {str(e)}")
+        return jsonify({'success': False, 'error': 'Failed to download render job'}), 500
+
+def get_database_path():
+    """Filesystem path of the SQLite database, or None for other engines"""
+    url = db.engine.url
+    return url.database if url.get_backend_name() == 'sqlite' else None
+
+def get_backup_store():
+    """Content-addressed snapshot store inside the configured backup directory"""
+    return BackupStore(os.path.join(get_backup_directory(), 'store'))
+
+def create_backup(label='', restores=None):
+    """Snapshot the database, uploads and generated documents into the backup store
+
+    Must run inside an app context. Applies the retention policy and frees
+    blobs no snapshot needs any more, except for the pre_restore snapshot
+    taken before restoring `restores`, which must not delete the snapshot
+    being restored. Returns the snapshot stats.
+    """
+    db_path = get_database_path()
+    if not db_path or not os.path.exists(db_path):
+        raise BackupError('Database file not found')
+
+    store = get_backup_store()
+    stats = store.create_snapshot(
+        db_path,
+        [app.config['UPLOAD_FOLDER'], 'generated_documents'],
+        compression=app.config['BACKUP_COMPRESSION'],
+        label=label,
+        restores=restores
+    )
+    if restores:
+        logging.info(f"Backup snapshot {stats['snapshot']} of the state before restoring {restores}: {stats['files']} files in {stats['duration_seconds']}s")
+        stats['snapshots_removed'] = 0
+        stats['bytes_freed'] = 0
+        return stats
+
+    set_system_setting('last_backup_at', datetime.utcnow().isoformat())
+
+    removed = store.apply_retention(app.config['BACKUP_KEEP_DAILY'], app.config['BACKUP_KEEP_WEEKLY'])
+    blobs_removed, bytes_freed = store.collect_garbage()
+    stats['snapshots_removed'] = len(removed)
+    stats['bytes_freed'] = bytes_freed
+
+    logging.info(f"Backup snapshot {stats['snapshot']}: {stats['files']} files, {stats['bytes_written']} new bytes in {stats['duration_seconds']}s; "
+                 f"retention removed {len(removed)} snapshots and {blobs_removed} blobs ({bytes_freed} bytes)")
+    return stats
+
+@app.route('/api/admin/backup-database', methods=['POST'])
+@admin_required
+def backup_database():
+    """Create database backup"""
+    try:
+        stats = create_backup()
+        return jsonify({
+            'success': True,
+            'message': 'Backup created successfully',
+            'backup_path': stats['path'],
+            'snapshot': stats['snapshot'],
+            'files': stats['files'],
+            'bytes_written': stats['bytes_written'],
+            'bytes_freed': stats['bytes_freed'],
+            'duration_seconds': stats['duration_seconds']
+        })
+
+    except BackupError as e:
+        logging.error(f"Error creating backup: {str(e)}")
+        return jsonify({'success': False, 'error': str(e)}), 500
     except Exception as e:
         logging.error(f"Error creating backup: {str(e)}")
         return jsonify({'success': False, 'error': 'Failed to create backup'}), 500
 
-@app.route('/api/admin/export-database', methods=['POST'])
+def restore_backup(snapshot=None, before=None, verify_only=False):
+    """Restore the database and backed-up directories from a snapshot
+
+    Picks the named snapshot, or the newest one taken at or before `before`
+    (or the newest overall). Every blob is checked against its digest and the
+    database with PRAGMA integrity_check before anything live is touched; a
+    pre_restore snapshot of the current state is taken so the restore can be
+    undone. Must run inside an app context. Returns the restore stats.
+    """
+    started = time.monotonic()
+    db_path = get_database_path()
+    if not db_path:
+        raise BackupError('Restore is only supported for SQLite databases')
+
+    store = get_backup_store()
+    name = snapshot or store.find_snapshot(before)
+    if not name or name not in store.list_snapshots():
+        raise BackupError('No matching snapshot found')
+
+    problems = store.verify_snapshot(name)
+    if problems:
+        raise BackupError(f"Snapshot {name} failed verification: {'; '.join(problems[:5])}")
+    if verify_only:
+        return {'snapshot': name, 'verified': True, 'restored': False, 'duration_seconds': round(time.monotonic() - started, 3)}
+
+    manifest, staged_database, staged_directories = store.stage_snapshot(name, os.getcwd())
+    safety_snapshot = create_backup(label=PRE_RESTORE_LABEL, restores=name)['snapshot']
+
+    db.session.remove()
+    db.engine.dispose()
+    swap_in_staged(staged_database, db_path, staged_directories, os.getcwd())
+
+    invalidate_public_settings()
+    clear_settings_json_cache()
+    invalidate_user_flags()
+
+    stats = {
+        'snapshot': name,
+        'created_at': manifest['created_at'],
+        'verified': True,
+        'restored': True,
+        'files': len(manifest['files']),
+        'pre_restore_snapshot': safety_snapshot,
+        'duration_seconds': round(time.monotonic() - started, 3)
+    }
+    logging.info(f"Restored snapshot {name} ({stats['files']} files) in {stats['duration_seconds']}s; previous state saved as {safety_snapshot}")
+    return stats
+
+@app.route('/api/admin/backup-snapshots', methods=['GET'])
 @admin_required
-def export_database():
-    """Export database data to JSON format"""
+def list_backup_snapshots():
+    """List backup snapshots, newest first"""
     try:
-        data = {}
-        
-        # Export Users (excluding password hashes for security)
-        users = User.query.all()
-        data['users'] = []
-        for user in users:
-            user_data = {
-                'id': user.id,
-                'username': user.username,
-                'email': user.email,
-                'first_name': user.first_name,
-                'last_name': user.last_name,
-                'is_admin': user.is_admin,
-                'is_verified': user.is_verified,
-                'created_at': user.created_at.isoformat() if user.created_at else None,
-                'last_login': user.last_login.isoformat() if user.last_login else None
-            }
-            data['users'].append(user_data)
-
-        # Export Business Settings
-        business_settings = BusinessSettings.query.all()
-        data['business_settings'] = []
-        for setting in business_settings:
-            data['business_settings'].append({
-                'id': setting.id,
-                'business_name': setting.business_name,
-                'business_address': setting.business_address,
-                'business_phone': setting.business_phone,
-                'business_email': setting.business_email,
-                'business_logo_url': setting.business_logo_url,
-                'signature_url': setting.signature_url,
-                'tax_rate': setting.tax_rate,
-                'currency': setting.currency,
-                'created_at': setting.created_at.isoformat() if setting.created_at else None,
-                'updated_at': setting.updated_at.isoformat() if setting.updated_at else None
+        store = get_backup_store()
+        snapshots = []
+        for name in reversed(store.list_snapshots()):
+            manifest = store.load_manifest(name)
+            snapshots.append({
+                'snapshot': name,
+                'label': manifest.get('label', ''),
+                'created_at': manifest['created_at'],
+                'files': len(manifest['files'])
             })
+        return jsonify({'success': True, 'snapshots': snapshots})
 
-        # Export User Business Settings
-        user_business_settings = UserBusinessSettings.query.all()
-        data['user_business_settings'] = []
-        for setting in user_business_settings:
-            data['user_business_settings'].append({
-                'id': setting.id,
-                'user_id': setting.user_id,
-                'business_name': setting.business_name,
-                'business_address': setting.business_address,
-                'business_phone': setting.business_phone,
-                'business_email': setting.business_email,
-                'business_logo_url': setting.business_logo_url,
-                'signature_url': setting.signature_url,
-                'tax_rate': setting.tax_rate,
-                'currency': setting.currency,
-                'created_at': setting.created_at.isoformat() if setting.created_at else None,
-                'updated_at': setting.updated_at.isoformat() if setting.updated_at else None
-            })
+    except Exception as e:
+        logging.error(f"Error listing backup snapshots: {str(e)}")
+        return jsonify({'success': False, 'error': 'Failed to list backup snapshots'}), 500
 
-        # Export Client Settings
-        client_settings = ClientSettings.query.all()
-        data['client_settings'] = []
-        for client in client_settings:
-            data['client_settings'].append({
-                'id': client.id,
-                'user_id': client.user_id,
-                'client_name': client.client_name,
-                'client_address': client.client_address,
-                'client_email': client.client_email,
-                'client_phone': client.client_phone,
-                'is_active': client.is_active,
-                'created_at': client.created_at.isoformat() if client.created_at else None,
-                'updated_at': client.updated_at.isoformat() if client.updated_at else None
-            })
+@app.route('/api/admin/restore-backup', methods=['POST'])
+@admin_required
+def restore_backup_route():
+    """Restore a backup snapshot, or only verify it with verify_only"""
+    try:
+        data = request.get_json(silent=True) or {}
+        before = datetime.fromisoformat(data['before']) if data.get('before') else None
+        admin_id = session['user_id']
 
-        # Export PDF Requests
-        pdf_requests = PDFRequest.query.all()
-        data['pdf_requests'] = []
-        for req in pdf_requests:
-            data['pdf_requests'].append({
-                'id': req.id,
-                'user_id': req.user_id,
-                'title': req.title,
-                'description': req.description,
-                'status': req.status,
-                'admin_response': req.admin_response,
-                'created_at': req.created_at.isoformat() if req.created_at else None,
-                'updated_at': req.updated_at.isoformat() if req.updated_at else None
-            })
+        stats = restore_backup(snapshot=data.get('snapshot'), before=before, verify_only=bool(data.get('verify_only')))
 
-        # Export Messages
-        messages = Message.query.all()
-        data['messages'] = []
-        for msg in messages:
-            data['messages'].append({
-                'id': msg.id,
-                'sender_id': msg.sender_id,
-                'recipient_id': msg.recipient_id,
-                'subject': msg.subject,
-                'content': msg.content,
-                'is_read': msg.is_read,
-                'parent_message_id': msg.parent_message_id,
-                'created_at': msg.created_at.isoformat() if msg.created_at else None
-            })
+        if stats['restored']:
+            # Logged into the restored database, so the restore itself stays on record
+            log_activity(admin_id, 'database_restore', f"Admin restored backup snapshot {stats['snapshot']}", request.remote_addr, request.user_agent.string)
 
-        # Export System Settings
-        system_settings = SystemSettings.query.all()
-        data['system_settings'] = []
-        for setting in system_settings:
-            data['system_settings'].append({
-                'id': setting.id,
-                'setting_key': setting.setting_key,
-                'setting_value': setting.setting_value,
-                'created_at': setting.created_at.isoformat() if setting.created_at else None,
-                'updated_at': setting.updated_at.isoformat() if setting.updated_at else None
-            })
+        return jsonify({'success': True, **stats})
+
+    except ValueError as e:
+        return jsonify({'success': False, 'error': f'Invalid timestamp: {str(e)}'}), 400
+    except BackupError as e:
+        logging.error(f"Error restoring backup: {str(e)}")
+        return jsonify({'success': False, 'error': str(e)}), 500
+    except Exception as e:
+        logging.error(f"Error restoring backup: {str(e)}")
+        return jsonify({'success': False, 'error': 'Failed to restore backup'}), 500
+
+@app.route('/api/admin/gc-files', methods=['POST'])
+@admin_required
+def gc_files():
+    """Run one incremental pass of the orphan-file collector"""
+    try:
+        data = request.get_json(silent=True) or {}
+        stats = collect_orphan_files(max_files=data.get('max_files'), dry_run=bool(data.get('dry_run')), restart=bool(data.get('restart')))
+        return jsonify({'success': True, **stats})
+
+    except Exception as e:
+        logging.error(f"Error collecting orphan files: {str(e)}")
+        return jsonify({'success': False, 'error': 'Failed to collect orphan files'}), 500
+
+@app.route('/api/admin/export-database', methods=['POST'])
+@admin_required
+def export_database():
+    """Export database data to JSON, or stream it as NDJSON with ?format=ndjson|ndjson.gz
+
+    Only the NDJSON formats include the high-volume tables; the JSON export
+    is built in memory and keeps to the sections in JSON_EXPORT_TABLES.
+    """
+    try:
+        output_format = request.args.get('format', 'json')
+        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+
+        if output_format in ('ndjson', 'ndjson.gz'):
+            compress = output_format == 'ndjson.gz'
+            response = app.response_class(
+                stream_with_context(iter_ndjson_export(compress=compress)),
+                mimetype='application/gzip' if compress else 'application/x-ndjson'
+            )
+            response.headers['Content-Disposition'] = f'attachment; filename=database_export_{timestamp}.{output_format}'
+            return response
+
+        if output_format != 'json':
+            return jsonify({'success': False, 'error': 'Format must be json, ndjson or ndjson.gz'}), 400
+
+        tables = [table for table in EXPORT_TABLES if table[0] in JSON_EXPORT_TABLES]
+        data = {}
+        for name, model, serializer in tables:
+            data[name] = list(iter_table_rows(model, serializer))
 
         # Add export metadata
         data['export_info'] = {
             'export_date': datetime.utcnow().isoformat(),
             'version': '1.0',
-            'total_records': {
-                'users': len(data['users']),
-                'business_settings': len(data['business_settings']),
-                'user_business_settings': len(data['user_business_settings']),
-                'client_settings': len(data['client_settings']),
-                'pdf_requests': len(data['pdf_requests']),
-                'messages': len(data['messages']),
-                'system_settings': len(data['system_settings'])
-            }
+            'total_records': {name: len(data[name]) for name, _, _ in tables}
         }
 
         return jsonify({
             'success': True,
             'data': data,
-            'filename': f'database_export_{datetime.now().strftime("%Y%m%d_%H%M%S")}.json'
+            'filename': f'database_export_{timestamp}.json'
         })
 
     except Exception as e:
@@ -1620,60 +2144,60 @@ def export_database():
 @app.route('/api/admin/import-database', methods=['POST'])
 @admin_required
 def import_database():
-    """Import database data from JSON format"""
+    """Import database data from a JSON export, or stream an NDJSON (optionally gzip) export
+
+    NDJSON imports upsert users, settings, clients, requests and messages in
+    one transaction; ?mode=insert leaves existing rows alone and ?dry_run=1
+    only reports what would change. Users whose id belongs to a different
+    account here are refused unless ?overwrite=1 is given. JSON bodies keep the original behaviour of
+    adding missing business and system settings only.
+    """
     try:
-        data = request.get_json()
-        import_data = data.get('data')
-
-        if not import_data:
-            return jsonify({'success': False, 'error': 'No import data provided'}), 400
-
-        imported_counts = {}
-
-        # Import Business Settings (non-destructive)
-        if 'business_settings' in import_data:
-            for setting_data in import_data['business_settings']:
-                existing = BusinessSettings.query.filter_by(id=setting_data.get('id')).first()
-                if not existing:
-                    setting = BusinessSettings(
-                        business_name=setting_data.get('business_name'),
-                        business_address=setting_data.get('business_address'),
-                        business_phone=setting_data.get('business_phone'),
-                        business_email=setting_data.get('business_email'),
-                        business_logo_url=setting_data.get('business_logo_url'),
-                        signature_url=setting_data.get('signature_url'),
-                        tax_rate=setting_data.get('tax_rate', 0),
-                        currency=setting_data.get('currency', 'USD')
-                    )
-                    db.session.add(setting)
-            imported_counts['business_settings'] = len(import_data['business_settings'])
-
-        # Import System Settings (non-destructive)
-        if 'system_settings' in import_data:
-            for setting_data in import_data['system_settings']:
-                existing = SystemSettings.query.filter_by(setting_key=setting_data.get('setting_key')).first()
-                if not existing:
-                    setting = SystemSettings(
-                        setting_key=setting_data.get('setting_key'),
-                        setting_value=setting_data.get('setting_value')
-                    )
-                    db.session.add(setting)
-            imported_counts['system_settings'] = len(import_data['system_settings'])
-
-        # Note: We don't import users, messages, or other sensitive data for security
-        # This would require more careful handling and user confirmation
+        dry_run = request.args.get('dry_run', '').lower() in ('1', 'true', 'yes')
 
-        db.session.commit()
+        if request.mimetype == 'application/json':
+            data = request.get_json()
+            import_data = data.get('data')
+
+            if not import_data:
+                return jsonify({'success': False, 'error': 'No import data provided'}), 400
+
+            # Note: We don't import users, messages, or other sensitive data from JSON files
+            records = iter_json_records(import_data, ['business_settings', 'system_settings'])
+            imported_counts, ignored = import_records(records, tables=['business_settings', 'system_settings'], mode='insert', dry_run=dry_run)
+        else:
+            # Exports can be far larger than regular uploads; the body is read line by line
+            request.max_content_length = app.config['IMPORT_MAX_CONTENT_LENGTH']
+            stream = request.stream
+            if request.mimetype == 'application/gzip' or request.headers.get('Content-Encoding') == 'gzip':
+                stream = gzip.GzipFile(fileobj=stream)
+
+            records = iter_ndjson_records(stream)
+            overwrite = request.args.get('overwrite', '').lower() in ('1', 'true', 'yes')
+            imported_counts, ignored = import_records(records, mode=request.args.get('mode', 'upsert'), dry_run=dry_run, overwrite=overwrite)
+
+        if not dry_run:
+            invalidate_public_settings()
+            clear_settings_json_cache()
+            invalidate_user_flags()
 
-        # Log import activity
-        log_activity(session['user_id'], 'database_import', f"Admin imported database settings", request.remote_addr, request.user_agent.string)
+            # Log import activity
+            log_activity(session['user_id'], 'database_import', "Admin imported database data", request.remote_addr, request.user_agent.string)
 
         return jsonify({
             'success': True,
-            'message': 'Database settings imported successfully',
-            'imported_counts': imported_counts
+            'message': 'Dry run completed, no changes were made' if dry_run else 'Database data imported successfully',
+            'dry_run': dry_run,
+            'imported_counts': imported_counts,
+            'ignored_counts': ignored
         })
 
+    except (DataImportError, gzip.BadGzipFile, EOFError) as e:
+        logging.error(f"Invalid database import: {str(e)}")
+        return jsonify({'success': False, 'error': f'Invalid import data: {str(e)}'}), 400
+    except IntegrityError as e:
+        logging.error(f"Database import conflicts with existing data: {str(e)}")
+        return jsonify({'success': False, 'error': 'Import conflicts with existing data (duplicate username, email or key)'}), 400
     except Exception as e:
         db.session.rollback()
         logging.error(f"Error importing database: {str(e)}")
@@ -1698,15 +2222,7 @@ def backup_settings():
                 return jsonify({'success': False, 'error': 'Backup directory is required'}), 400
 
             # Update or create setting
-            backup_dir_setting = SystemSettings.query.filter_by(setting_key='backup_directory').first()
-            if backup_dir_setting:
-                backup_dir_setting.setting_value = new_backup_dir
-                backup_dir_setting.updated_at = datetime.utcnow()
-            else:
-                backup_dir_setting = SystemSettings(setting_key='backup_directory', setting_value=new_backup_dir)
-                db.session.add(backup_dir_setting)
-
-            db.session.commit()
+            set_system_setting('backup_directory', new_backup_dir)
 
             return jsonify({'success': True, 'message': 'Backup directory updated successfully'})
 
@@ -1719,6 +2235,38 @@ def get_backup_directory():
     backup_dir_setting = SystemSettings.query.filter_by(setting_key='backup_directory').first()
     return backup_dir_setting.setting_value if backup_dir_setting else os.path.join(os.getcwd(), 'backups')
 
+def get_system_setting(key):
+    setting = SystemSettings.query.filter_by(setting_key=key).first()
+    return setting.setting_value if setting else None
+
+def set_system_setting(key, value):
+    """Create or update a system setting and commit"""
+    setting = SystemSettings.query.filter_by(setting_key=key).first()
+    if setting:
+        setting.setting_value = value
+        setting.updated_at = datetime.utcnow()
+    else:
+        setting = SystemSettings(setting_key=key, setting_value=value)
+        db.session.add(setting)
+    db.session.commit()
+
+# Font subsets built by build_fonts.py; their names change with their content
+FONT_CACHE_MAX_AGE = 365 * 24 * 3600
+
+@app.route('/static/fonts/<path:filename>')
+def static_fonts(filename):
+    """Serve PDF font subsets for good and the manifest naming them always fresh"""
+    fonts_dir = os.path.join(app.static_folder, 'fonts')
+    if filename == 'manifest.json':
+        response = send_from_directory(fonts_dir, filename, max_age=0)
+        response.cache_control.no_cache = True
+        return response
+
+    response = send_from_directory(fonts_dir, filename, max_age=FONT_CACHE_MAX_AGE, mimetype='font/ttf')
+    response.cache_control.public = True
+    response.cache_control.immutable = True
+    return response
+
 @app.route('/offline.html')
 def offline():
     return render_template('offline.html')
@@ -1727,7 +2275,7 @@ def offline():
 def get_current_user():
     """Get current logged in user info"""
     if 'user_id' in session:
-        user = User.query.get(session['user_id'])
+        user = load_current_user()
         if user:
             return jsonify({
                 'success': True,
@@ -1737,47 +2285,157 @@ def get_current_user():
 
     return jsonify({'success': False, 'error': 'Not logged in'}), 401
 
-def setup_automatic_backup():
-    """Setup automatic backup every 24 hours"""
-    import threading
-    import time
-
-    def backup_scheduler():
-        while True:
-            time.sleep(24 * 60 * 60)  # 24 hours
-            try:
-                with app.app_context():
-                    import shutil
-                    from datetime import datetime
-
-                    backup_dir = get_backup_directory()
-                    os.makedirs(backup_dir, exist_ok=True)
-
-                    timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
-
-                    # Backup database
-                    db_path = os.path.join(os.getcwd(), 'instance', 'business_docs.db')
-                    if os.path.exists(db_path):
-                        backup_db_path = os.path.join(backup_dir, f"auto_database_backup_{timestamp}.db")
-                        shutil.copy2(db_path, backup_db_path)
-
-                    # Backup uploads
-                    if os.path.exists('uploads'):
-                        shutil.copytree('uploads', os.path.join(backup_dir, f"auto_uploads_backup_{timestamp}"), dirs_exist_ok=True)
-
-                    # Backup generated documents
-                    if os.path.exists('generated_documents'):
-                        shutil.copytree('generated_documents', os.path.join(backup_dir, f"auto_generated_documents_backup_{timestamp}"), dirs_exist_ok=True)
+@app.cli.command('create-backup')
+@click.option('--label', default='', help='Tag stored with the snapshot')
+@click.option('--low-priority', is_flag=True, help='Lower this process\'s CPU and I/O priority first (I/O needs psutil or ionice)')
+def create_backup_command(label, low_priority):
+    """Create a backup snapshot"""
+    if low_priority:
+        lower_process_priority()
+    stats = create_backup(label=label)
+    click.echo(json.dumps(stats))
+
+@app.cli.command('restore-backup')
+@click.argument('snapshot', required=False)
+@click.option('--before', help='Restore the newest snapshot taken at or before this ISO timestamp (UTC)')
+@click.option('--verify-only', is_flag=True, help='Only check the snapshot, do not restore it')
+@click.option('--list', 'list_only', is_flag=True, help='List the available snapshots')
+@click.option('--yes', is_flag=True, help='Do not ask for confirmation')
+def restore_backup_command(snapshot, before, verify_only, list_only, yes):
+    """Restore the database and uploads from a backup snapshot"""
+    if list_only:
+        for name in reversed(get_backup_store().list_snapshots()):
+            click.echo(name)
+        return
+
+    before = datetime.fromisoformat(before) if before else None
+    if not verify_only and not yes:
+        click.confirm('This replaces the live database and uploaded files. Continue?', abort=True)
+    try:
+        stats = restore_backup(snapshot=snapshot, before=before, verify_only=verify_only)
+    except BackupError as e:
+        raise click.ClickException(str(e))
+    click.echo(json.dumps(stats))
+
+def collect_orphan_files(max_files=None, dry_run=False, restart=False):
+    """Run one incremental pass of the orphan-file collector
+
+    Continues from the cursor stored by the previous pass and stores the new
+    one, so successive calls walk the whole tree a slice at a time. Also
+    removes temp files and upload sessions abandoned by failed uploads. Must
+    run inside an app context. Returns the run stats.
+    """
+    collector = OrphanCollector(
+        [app.config['UPLOAD_FOLDER'], 'generated_documents'],
+        file_store,
+        quarantine_days=app.config['FILE_GC_QUARANTINE_DAYS']
+    )
+    cursor = None if restart else get_system_setting('file_gc_cursor')
+    stats = collector.run(cursor=cursor or None, max_files=max_files or app.config['FILE_GC_MAX_FILES'], dry_run=dry_run)
+
+    if not dry_run:
+        set_system_setting('file_gc_cursor', stats['cursor'] or '')
+        stats['upload_sessions_removed'] = upload_sessions.sweep()
+        temp_files, temp_bytes = file_store.sweep_tmp(UPLOAD_SESSION_MAX_AGE)
+        stats['temp_files_removed'] = temp_files
+        stats['bytes_reclaimed'] += temp_bytes
+
+    logging.info(f"File GC: scanned {stats['scanned']} files, quarantined {stats['orphans']} orphans ({stats['bytes_quarantined']} bytes), "
+                 f"reclaimed {stats['bytes_reclaimed']} bytes{'' if stats['cursor'] else ', pass complete'}")
+    return stats
+
+@app.cli.command('gc-files')
+@click.option('--max-files', type=int, help='Files to check in this run (default FILE_GC_MAX_FILES)')
+@click.option('--dry-run', is_flag=True, help='Only report orphans, do not move or delete anything')
+@click.option('--restart', is_flag=True, help='Start from the beginning instead of the stored cursor')
+def gc_files_command(max_files, dry_run, restart):
+    """Quarantine files no database row references and purge old quarantines"""
+    click.echo(json.dumps(collect_orphan_files(max_files=max_files, dry_run=dry_run, restart=restart)))
+
+@app.cli.command('migrate-uploads')
+@click.option('--dry-run', is_flag=True, help='Only report what would be migrated')
+def migrate_uploads_command(dry_run):
+    """Move flat uploads into the content-addressed store"""
+    stats = {'migrated': 0, 'missing': 0, 'already_stored': 0, 'bytes_before': 0, 'bytes_deduplicated': 0}
+    seen = set()
+
+    for user_pdf in UserPDFCode.query.order_by(UserPDFCode.id).all():
+        if file_store.digest_from_path(user_pdf.file_path):
+            stats['already_stored'] += 1
+            continue
+        if not os.path.exists(user_pdf.file_path):
+            logging.warning(f"Upload {user_pdf.id} is missing its file {user_pdf.file_path}")
+            stats['missing'] += 1
+            continue
+
+        old_path = user_pdf.file_path
+        with open(old_path, 'rb') as f:
+            staged = file_store.stage(f)
+        stats['bytes_before'] += staged.size
+        if staged.digest in seen or os.path.exists(staged.path):
+            stats['bytes_deduplicated'] += staged.size
+        seen.add(staged.digest)
 
-                    logging.info(f"Automatic backup completed: {timestamp}")
+        try:
+            if dry_run:
+                stats['migrated'] += 1
+                continue
+            file_store.add_reference(staged.digest, staged.size)
+            user_pdf.file_path = staged.path
+            db.session.commit()
+            file_store.publish(staged)
+        finally:
+            file_store.discard(staged)
+
+        # Legacy files belong to a single row, unless someone pointed two rows at one file
+        if not UserPDFCode.query.filter_by(file_path=old_path).first():
+            os.remove(old_path)
+        stats['migrated'] += 1
+
+    click.echo(json.dumps(stats))
+
+def run_backup_process():
+    """Run one scheduled backup in a separate, low-priority process"""
+    if getattr(sys, 'frozen', False):
+        # Packaged executables cannot start the flask CLI; back up in this thread instead
+        with app.app_context():
+            create_backup(label='auto')
+        return
+
+    command = [sys.executable, '-m', 'flask', '--app', os.path.abspath(__file__), 'create-backup', '--label', 'auto', '--low-priority']
+    creationflags = getattr(subprocess, 'BELOW_NORMAL_PRIORITY_CLASS', 0)
+    result = subprocess.run(command, cwd=os.getcwd(), capture_output=True, text=True, creationflags=creationflags)
+    if result.returncode != 0:
+        logging.error(f"Automatic backup failed: {result.stderr.strip()[-2000:]}")
+    else:
+        logging.info(f"Automatic backup completed: {result.stdout.strip().splitlines()[-1] if result.stdout.strip() else ''}")
+
+def get_last_backup_time():
+    with app.app_context():
+        return parse_last_run(get_system_setting('last_backup_at'))
+
+backup_scheduler = BackupScheduler(
+    lock_path=os.path.join(app.instance_path, 'backup_scheduler.lock'),
+    interval=timedelta(hours=app.config['BACKUP_INTERVAL_HOURS']),
+    get_last_run=get_last_backup_time,
+    run_backup=run_backup_process
+)
+
+@app.before_request
+def setup_automatic_backup():
+    """Start the backup scheduler in the first process that serves a request
 
-            except Exception as e:
-                logging.error(f"Automatic backup failed: {str(e)}")
+    Every gunicorn worker starts one, but only the worker holding the leader
+    lock runs backups. CLI commands and the reloader parent never serve
+    requests, so they never start it.
+    """
+    if app.config['BACKUP_SCHEDULER_ENABLED']:
+        backup_scheduler.start()
 
-    # Start backup scheduler in background thread
-    backup_thread = threading.Thread(target=backup_scheduler, daemon=True)
-    backup_thread.start()
+@app.before_request
+def setup_render_jobs():
+    """Start the render job runner; as with backups, only the leader dispatches"""
+    render_job_runner.start()
 
 if __name__ == '__main__':
-    setup_automatic_backup()
-    app.run(host='0.0.0.0', port=5000, debug=True)
\ No newline at end of file
+    app.run(host='0.0.0.0', port=5000, debug=True)
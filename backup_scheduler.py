@@ -0,0 +1,151 @@
+import logging
+import os
+import shutil
+import subprocess
+import threading
+import time
+
+from datetime import datetime
+
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None
+    import msvcrt
+
+try:
+    import psutil
+except ImportError:  # optional; without it `ionice` is used where available
+    psutil = None
+
+
+def lower_process_priority():
+    """Give this process the lowest CPU and idle I/O priority the platform offers
+
+    Returns the list of what was lowered, e.g. ['cpu', 'io'].
+    """
+    lowered = []
+    if hasattr(os, 'nice'):
+        os.nice(19)
+        lowered.append('cpu')
+
+    try:
+        if psutil is not None:
+            process = psutil.Process()
+            if hasattr(psutil, 'IOPRIO_CLASS_IDLE'):
+                process.ionice(psutil.IOPRIO_CLASS_IDLE)
+            else:
+                process.nice(psutil.BELOW_NORMAL_PRIORITY_CLASS)
+                process.ionice(psutil.IOPRIO_VERYLOW)
+                lowered.append('cpu')
+            lowered.append('io')
+        elif shutil.which('ionice'):
+            subprocess.run(['ionice', '-c3', '-p', str(os.getpid())], check=True, capture_output=True)
+            lowered.append('io')
+    except (OSError, subprocess.CalledProcessError) as e:
+        logging.warning(f"Could not lower I/O priority: {str(e)}")
+    return lowered
+
+
+class LeaderLock:
+    """Non-blocking exclusive lock on a file, shared by all processes on the host
+
+    Whoever holds it is the leader. The OS drops the lock when the holding
+    process exits, so another worker can take over.
+    """
+
+    def __init__(self, path):
+        self.path = path
+        self._file = None
+
+    @property
+    def is_held(self):
+        return self._file is not None
+
+    def acquire(self):
+        if self._file is not None:
+            return True
+
+        os.makedirs(os.path.dirname(self.path), exist_ok=True)
+        lock_file = open(self.path, 'a+')
+        try:
+            if fcntl:
+                fcntl.flock(lock_file.fileno(), fcntl.LOCK_EX | fcntl.LOCK_NB)
+            else:
+                lock_file.seek(0)
+                msvcrt.locking(lock_file.fileno(), msvcrt.LK_NBLCK, 1)
+        except OSError:
+            lock_file.close()
+            return False
+
+        self._file = lock_file
+        return True
+
+    def release(self):
+        if self._file is None:
+            return
+        try:
+            if fcntl:
+                fcntl.flock(self._file.fileno(), fcntl.LOCK_UN)
+            else:
+                self._file.seek(0)
+                msvcrt.locking(self._file.fileno(), msvcrt.LK_UNLCK, 1)
+        finally:
+            self._file.close()
+            self._file = None
+
+
+class BackupScheduler:
+    """Runs backups every `interval` from exactly one process
+
+    Every process may start a scheduler; only the one holding the leader lock
+    runs backups, the others retry the lock every poll_interval. The next run
+    is computed from the last successful run reported by get_last_run, so a
+    backup missed during downtime runs as soon as a leader is up again.
+    """
+
+    def __init__(self, lock_path, interval, get_last_run, run_backup, poll_interval=300):
+        self.lock = LeaderLock(lock_path)
+        self.interval = interval
+        self.poll_interval = poll_interval
+        self.get_last_run = get_last_run
+        self.run_backup = run_backup
+        self._thread = None
+
+    def start(self):
+        if self._thread is None:
+            self._thread = threading.Thread(target=self._run, name='backup-scheduler', daemon=True)
+            self._thread.start()
+
+    def seconds_until_due(self):
+        last_run = self.get_last_run()
+        if last_run is None:
+            return 0
+        return (last_run + self.interval - datetime.utcnow()).total_seconds()
+
+    def _run(self):
+        while True:
+            try:
+                if not self.lock.acquire():
+                    time.sleep(self.poll_interval)
+                    continue
+
+                wait = self.seconds_until_due()
+                if wait <= 0:
+                    self.run_backup()
+                    # A failed run leaves the last run unchanged; retry after a poll
+                    wait = max(self.seconds_until_due(), 0) or self.poll_interval
+
+                time.sleep(min(wait, self.poll_interval))
+            except Exception as e:
+                logging.error(f"Backup scheduler error: {str(e)}")
+                time.sleep(self.poll_interval)
+
+
+def parse_last_run(value):
+    """Parse a stored ISO timestamp, treating missing or bad values as never"""
+    try:
+        return datetime.fromisoformat(value) if value else None
+    except ValueError:
+        return None
+
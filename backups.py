@@ -0,0 +1,513 @@
+import gzip
+import hashlib
+import json
+import os
+import shutil
+import sqlite3
+import tempfile
+import time
+
+from datetime import datetime, timedelta
+
+try:
+    import zstandard
+except ImportError:  # optional, only needed for BACKUP_COMPRESSION=zstd
+    zstandard = None
+
+# Pages copied per backup step, and the pause between steps that lets writers in
+BACKUP_PAGES_PER_STEP = 256
+BACKUP_STEP_SLEEP = 0.005
+# Restarts caused by concurrent writes before falling back to VACUUM INTO
+BACKUP_MAX_RESTARTS = 3
+
+COMPRESSION_SUFFIXES = {'': '', 'gzip': '.gz', 'zstd': '.zst'}
+
+# Label of the snapshot taken of the live state right before a restore
+PRE_RESTORE_LABEL = 'pre_restore'
+
+
+class BackupError(Exception):
+    """Raised when a backup cannot be created or fails verification"""
+
+
+def check_integrity(path):
+    """Run PRAGMA integrity_check on a SQLite file, raising BackupError if it is damaged"""
+    connection = sqlite3.connect(f'file:{path}?mode=ro', uri=True)
+    try:
+        result = connection.execute('PRAGMA integrity_check').fetchone()[0]
+    finally:
+        connection.close()
+    if result != 'ok':
+        raise BackupError(f'Integrity check failed for {path}: {result}')
+
+
+def compress_file(path, compression):
+    """Compress path next to itself, remove the original and return the new path"""
+    if compression == 'gzip':
+        target = path + '.gz'
+        with open(path, 'rb') as source, gzip.open(target, 'wb', compresslevel=6) as destination:
+            shutil.copyfileobj(source, destination, 1024 * 1024)
+    elif compression == 'zstd':
+        if zstandard is None:
+            raise BackupError('zstd compression requires the zstandard package')
+        target = path + '.zst'
+        with open(path, 'rb') as source, open(target, 'wb') as destination:
+            zstandard.ZstdCompressor(level=3).copy_stream(source, destination)
+    else:
+        raise BackupError(f'Unknown compression: {compression}')
+
+    os.remove(path)
+    return target
+
+
+def decompress_file(path, target, compression):
+    """Write the decompressed content of path to target"""
+    if compression == 'gzip':
+        with gzip.open(path, 'rb') as source, open(target, 'wb') as destination:
+            shutil.copyfileobj(source, destination, 1024 * 1024)
+    elif compression == 'zstd':
+        if zstandard is None:
+            raise BackupError('zstd compression requires the zstandard package')
+        with open(path, 'rb') as source, open(target, 'wb') as destination:
+            zstandard.ZstdDecompressor().copy_stream(source, destination)
+    elif compression:
+        raise BackupError(f'Unknown compression: {compression}')
+    else:
+        shutil.copyfile(path, target)
+
+
+class _TooManyRestarts(Exception):
+    pass
+
+
+def _stepped_backup(source, temp_path, pages_per_step, step_sleep, max_restarts=BACKUP_MAX_RESTARTS):
+    """Run the online backup API a few pages at a time
+
+    SQLite restarts the copy whenever another connection writes to the
+    source; after max_restarts of those _TooManyRestarts is raised.
+    """
+    state = {'remaining': None, 'restarts': 0}
+
+    def progress(status, remaining, total):
+        if state['remaining'] is not None and remaining > state['remaining']:
+            state['restarts'] += 1
+            if state['restarts'] > max_restarts:
+                raise _TooManyRestarts()
+        state['remaining'] = remaining
+        time.sleep(step_sleep)
+
+    destination = sqlite3.connect(temp_path)
+    try:
+        source.backup(destination, pages=pages_per_step, progress=progress)
+    finally:
+        destination.close()
+
+
+def backup_sqlite_database(source_path, dest_path, compression='', pages_per_step=BACKUP_PAGES_PER_STEP, step_sleep=BACKUP_STEP_SLEEP):
+    """Copy a live SQLite database with the online backup API
+
+    The copy is taken a few pages per step with a short pause in between so
+    live traffic keeps going. SQLite restarts the copy when another
+    connection writes mid-way, so the result is always consistent; under
+    constant writes it falls back to VACUUM INTO. The copy is
+    integrity-checked before it is (optionally) compressed. Returns the final
+    path, the bytes written and the duration.
+    """
+    if compression not in COMPRESSION_SUFFIXES:
+        raise BackupError(f'Unknown compression: {compression}')
+    if not os.path.exists(source_path):
+        raise BackupError(f'Database file not found: {source_path}')
+
+    started = time.monotonic()
+    temp_path = dest_path + '.tmp'
+    if os.path.exists(temp_path):
+        os.remove(temp_path)
+
+    source = sqlite3.connect(f'file:{source_path}?mode=ro', uri=True)
+    try:
+        try:
+            _stepped_backup(source, temp_path, pages_per_step, step_sleep)
+        except _TooManyRestarts:
+            # Writers kept invalidating the stepped copy; VACUUM INTO reads one
+            # consistent snapshot in a single pass and never restarts
+            os.remove(temp_path)
+            source.execute('VACUUM INTO ?', (temp_path,))
+    finally:
+        source.close()
+
+    try:
+        # Make the copy a self-contained file even when the live database uses WAL
+        copy = sqlite3.connect(temp_path)
+        try:
+            copy.execute('PRAGMA journal_mode=DELETE')
+        finally:
+            copy.close()
+        check_integrity(temp_path)
+        os.replace(temp_path, dest_path)
+    except Exception:
+        if os.path.exists(temp_path):
+            os.remove(temp_path)
+        raise
+
+    final_path = compress_file(dest_path, compression) if compression else dest_path
+
+    return {
+        'path': final_path,
+        'bytes_written': os.path.getsize(final_path),
+        'duration_seconds': round(time.monotonic() - started, 3)
+    }
+
+
+class BackupStore:
+    """Incremental, content-addressed backup store
+
+    Every unique file is kept once under blobs/<first two hex digits>/<sha256>
+    and each snapshot is a small JSON manifest in snapshots/ mapping relative
+    paths to blob digests. Files whose size and mtime match the previous
+    snapshot are not read again, so a backup costs roughly what changed.
+    """
+
+    def __init__(self, root):
+        self.root = root
+        self.blobs_dir = os.path.join(root, 'blobs')
+        self.snapshots_dir = os.path.join(root, 'snapshots')
+        self.tmp_dir = os.path.join(root, 'tmp')
+
+    def blob_path(self, digest):
+        return os.path.join(self.blobs_dir, digest[:2], digest)
+
+    def manifest_path(self, name):
+        return os.path.join(self.snapshots_dir, f'{name}.json')
+
+    def add_file(self, path):
+        """Store a file's content if it is not stored yet; returns (digest, size, added_bytes)"""
+        os.makedirs(self.tmp_dir, exist_ok=True)
+        hasher = hashlib.sha256()
+        size = 0
+        fd, temp_path = tempfile.mkstemp(dir=self.tmp_dir)
+        try:
+            # Hash while copying so each new file is read only once
+            with open(path, 'rb') as source, os.fdopen(fd, 'wb') as destination:
+                for chunk in iter(lambda: source.read(1024 * 1024), b''):
+                    hasher.update(chunk)
+                    destination.write(chunk)
+                    size += len(chunk)
+
+            digest = hasher.hexdigest()
+            target = self.blob_path(digest)
+            if os.path.exists(target):
+                os.remove(temp_path)
+                self._touch(target)
+                return digest, size, 0
+
+            os.makedirs(os.path.dirname(target), exist_ok=True)
+            os.replace(temp_path, target)
+            return digest, size, size
+        except Exception:
+            if os.path.exists(temp_path):
+                os.remove(temp_path)
+            raise
+
+    def _touch(self, blob):
+        # A fresh mtime keeps blobs picked up by a running snapshot safe from
+        # collect_garbage() until its manifest has been written
+        os.utime(blob)
+
+    def list_snapshots(self):
+        """Snapshot names, oldest first"""
+        if not os.path.isdir(self.snapshots_dir):
+            return []
+        return sorted(name[:-5] for name in os.listdir(self.snapshots_dir) if name.endswith('.json'))
+
+    def load_manifest(self, name):
+        with open(self.manifest_path(name)) as f:
+            return json.load(f)
+
+    def create_snapshot(self, database_path, directories, compression='', label='', restores=None):
+        """Back up the database and the given directories into a new snapshot
+
+        `restores` names the snapshot about to be restored over this state,
+        which apply_retention() keeps for as long as this one. Returns the snapshot stats, including the manifest path, the number of
+        files, how many bytes were newly stored and the duration.
+        """
+        started = time.monotonic()
+        created_at = datetime.utcnow()
+        # Names sort chronologically; the label only tags the snapshot's origin
+        name = created_at.strftime('%Y%m%d_%H%M%S_%f') + (f'_{label}' if label else '')
+        os.makedirs(self.snapshots_dir, exist_ok=True)
+        os.makedirs(self.tmp_dir, exist_ok=True)
+
+        snapshots = self.list_snapshots()
+        previous_files = self.load_manifest(snapshots[-1]).get('files', {}) if snapshots else {}
+
+        # Database: consistent online copy, then stored like any other file
+        database_copy = os.path.join(self.tmp_dir, f'{name}.db')
+        database_stats = backup_sqlite_database(database_path, database_copy, compression=compression)
+        try:
+            digest, size, bytes_added = self.add_file(database_stats['path'])
+        finally:
+            if os.path.exists(database_stats['path']):
+                os.remove(database_stats['path'])
+
+        manifest = {
+            'name': name,
+            'label': label,
+            'created_at': created_at.isoformat(),
+            'database': {'digest': digest, 'size': size, 'compression': compression},
+            'directories': [os.path.relpath(directory).replace(os.sep, '/') for directory in directories],
+            'files': {}
+        }
+        if restores:
+            manifest['restores'] = restores
+        new_blobs = 1 if bytes_added else 0
+
+        for directory in directories:
+            if not os.path.isdir(directory):
+                continue
+            for dirpath, dirnames, filenames in os.walk(directory):
+                # Temp files and quarantined orphans are not worth keeping
+                dirnames[:] = [name for name in dirnames if not name.startswith('.')]
+                for filename in filenames:
+                    path = os.path.join(dirpath, filename)
+                    relative_path = os.path.relpath(path).replace(os.sep, '/')
+                    stat = os.stat(path)
+
+                    previous = previous_files.get(relative_path)
+                    if (previous and previous['size'] == stat.st_size and previous['mtime_ns'] == stat.st_mtime_ns
+                            and os.path.exists(self.blob_path(previous['digest']))):
+                        file_digest, added = previous['digest'], 0
+                        self._touch(self.blob_path(file_digest))
+                    else:
+                        file_digest, _, added = self.add_file(path)
+
+                    if added:
+                        new_blobs += 1
+                        bytes_added += added
+                    manifest['files'][relative_path] = {'digest': file_digest, 'size': stat.st_size, 'mtime_ns': stat.st_mtime_ns}
+
+        temp_manifest = self.manifest_path(name) + '.tmp'
+        with open(temp_manifest, 'w') as f:
+            json.dump(manifest, f)
+        os.replace(temp_manifest, self.manifest_path(name))
+
+        return {
+            'path': self.manifest_path(name),
+            'snapshot': name,
+            'files': len(manifest['files']),
+            'new_blobs': new_blobs,
+            'bytes_written': bytes_added,
+            'duration_seconds': round(time.monotonic() - started, 3)
+        }
+
+    def find_snapshot(self, before=None):
+        """Name of the newest snapshot, or of the newest one taken at or before `before`"""
+        for name in reversed(self.list_snapshots()):
+            if before is None or datetime.fromisoformat(self.load_manifest(name)['created_at']) <= before:
+                return name
+        return None
+
+    def copy_blob(self, digest, target):
+        """Copy a blob to target, raising BackupError if its content no longer matches its digest"""
+        source_path = self.blob_path(digest)
+        if not os.path.exists(source_path):
+            raise BackupError(f'Missing blob {digest}')
+
+        hasher = hashlib.sha256()
+        with open(source_path, 'rb') as source, open(target, 'wb') as destination:
+            for chunk in iter(lambda: source.read(1024 * 1024), b''):
+                hasher.update(chunk)
+                destination.write(chunk)
+
+        if hasher.hexdigest() != digest:
+            os.remove(target)
+            raise BackupError(f'Blob {digest} is corrupted')
+
+    def verify_snapshot(self, name):
+        """Check that every blob of a snapshot exists and matches its digest
+
+        Returns a list of problems, empty when the snapshot can be restored.
+        """
+        manifest = self.load_manifest(name)
+        entries = [('database', manifest['database']['digest'])]
+        entries += [(path, entry['digest']) for path, entry in manifest['files'].items()]
+
+        problems = []
+        for path, digest in entries:
+            blob = self.blob_path(digest)
+            if not os.path.exists(blob):
+                problems.append(f'{path}: missing blob {digest}')
+                continue
+            hasher = hashlib.sha256()
+            with open(blob, 'rb') as f:
+                for chunk in iter(lambda: f.read(1024 * 1024), b''):
+                    hasher.update(chunk)
+            if hasher.hexdigest() != digest:
+                problems.append(f'{path}: blob {digest} is corrupted')
+        return problems
+
+    def stage_snapshot(self, name, base_dir):
+        """Rebuild a snapshot next to the live data without touching it
+
+        The database is written to the store's tmp directory and checked with
+        PRAGMA integrity_check; each backed-up directory is rebuilt as a
+        sibling `<directory>.restore` under base_dir, so swap_in_staged() can
+        move it into place with a rename on the same filesystem. Every blob is
+        verified against its digest while it is copied. Returns the manifest
+        and the staged paths.
+        """
+        manifest = self.load_manifest(name)
+        os.makedirs(self.tmp_dir, exist_ok=True)
+        base_dir = os.path.abspath(base_dir)
+
+        directories = manifest.get('directories') or sorted({path.split('/', 1)[0] for path in manifest['files']})
+        staged_directories = {}
+        for directory in directories:
+            staged = os.path.join(base_dir, directory) + '.restore'
+            if os.path.exists(staged):
+                shutil.rmtree(staged)
+            os.makedirs(staged)
+            staged_directories[directory] = staged
+
+        for relative_path, entry in manifest['files'].items():
+            directory = next((d for d in staged_directories if relative_path.startswith(d + '/')), None)
+            staged = staged_directories.get(directory)
+            target = os.path.normpath(os.path.join(staged, relative_path[len(directory) + 1:])) if staged else None
+            if not staged or not target.startswith(staged + os.sep):
+                raise BackupError(f'Unsafe path in snapshot {name}: {relative_path}')
+            os.makedirs(os.path.dirname(target), exist_ok=True)
+            self.copy_blob(entry['digest'], target)
+            os.utime(target, ns=(entry['mtime_ns'], entry['mtime_ns']))
+
+        database = manifest['database']
+        staged_database = os.path.join(self.tmp_dir, f'{name}.restore.db')
+        stored_copy = staged_database + COMPRESSION_SUFFIXES.get(database['compression'], '')
+        self.copy_blob(database['digest'], stored_copy)
+        if database['compression']:
+            decompress_file(stored_copy, staged_database, database['compression'])
+            os.remove(stored_copy)
+        check_integrity(staged_database)
+
+        return manifest, staged_database, staged_directories
+
+    def apply_retention(self, keep_daily, keep_weekly, now=None):
+        """Delete snapshot manifests outside the retention policy
+
+        Keeps the newest snapshot of each of the last keep_daily days and of
+        each of the last keep_weekly ISO weeks that have snapshots. Snapshots
+        labelled pre_restore are the only undo point of a restore, so they do
+        not take part in that choice; each is kept for keep_daily days along
+        with the snapshot it restored. Returns the names of the removed
+        snapshots; their blobs are only freed by collect_garbage().
+        """
+        pre_restore_cutoff = (now or datetime.utcnow()) - timedelta(days=keep_daily)
+        keep = set()
+        days = {}
+        weeks = {}
+        for name in reversed(self.list_snapshots()):
+            manifest = self.load_manifest(name)
+            created_at = datetime.fromisoformat(manifest['created_at'])
+            if manifest.get('label') == PRE_RESTORE_LABEL:
+                if created_at >= pre_restore_cutoff:
+                    keep.add(name)
+                    if manifest.get('restores'):
+                        keep.add(manifest['restores'])
+                continue
+            days.setdefault(created_at.date(), name)
+            weeks.setdefault(created_at.isocalendar()[:2], name)
+
+        keep.update(list(days.values())[:keep_daily])
+        keep.update(list(weeks.values())[:keep_weekly])
+
+        removed = []
+        for name in self.list_snapshots():
+            if name not in keep:
+                os.remove(self.manifest_path(name))
+                removed.append(name)
+        return removed
+
+    def collect_garbage(self, grace_seconds=3600):
+        """Delete blobs no snapshot references; returns (blobs removed, bytes freed)
+
+        Blobs touched within grace_seconds are kept, since a snapshot that is
+        still being written may be about to reference them.
+        """
+        referenced = set()
+        for name in self.list_snapshots():
+            manifest = self.load_manifest(name)
+            referenced.add(manifest['database']['digest'])
+            referenced.update(entry['digest'] for entry in manifest['files'].values())
+
+        removed = 0
+        freed = 0
+        if not os.path.isdir(self.blobs_dir):
+            return removed, freed
+        cutoff = time.time() - grace_seconds
+        for dirpath, _, filenames in os.walk(self.blobs_dir):
+            for filename in filenames:
+                path = os.path.join(dirpath, filename)
+                if filename not in referenced and os.path.getmtime(path) < cutoff:
+                    freed += os.path.getsize(path)
+                    os.remove(path)
+                    removed += 1
+        return removed, freed
+
+
+def _rollback_directories(swapped):
+    """Undo directory swaps, newest first, putting staged copies back where they were"""
+    for live, previous, staged, moved in reversed(swapped):
+        if moved:
+            os.rename(live, staged)
+        elif os.path.exists(live):
+            # Recreated by a request after the live directory was moved aside;
+            # keep whatever was written to it next to the restored original
+            if os.listdir(live):
+                os.rename(live, f'{live}.restore-conflict-{int(time.time())}')
+            else:
+                os.rmdir(live)
+        if os.path.exists(previous):
+            os.rename(previous, live)
+
+
+def swap_in_staged(staged_database, database_path, staged_directories, base_dir):
+    """Replace the live directories and database with staged copies
+
+    Each directory is swapped with two renames (live to `.previous`, staged
+    to live). If any rename fails, for instance because a request recreated
+    the directory in between, every directory swapped so far is renamed back
+    and nothing else changes. The database goes last, overwritten through
+    SQLite's backup API in a single write transaction so connections other
+    workers hold open see either the old or the restored content, never a
+    mix; if that fails the directories are rolled back too. The previous
+    versions are removed once everything is in place.
+    """
+    swapped = []
+    try:
+        for directory, staged in staged_directories.items():
+            live = os.path.join(os.path.abspath(base_dir), directory)
+            previous = live + '.previous'
+            if os.path.exists(previous):
+                shutil.rmtree(previous)
+            if os.path.exists(live):
+                os.rename(live, previous)
+            swapped.append([live, previous, staged, False])
+            os.rename(staged, live)
+            swapped[-1][3] = True
+
+        source = sqlite3.connect(staged_database)
+        destination = sqlite3.connect(database_path, timeout=30)
+        try:
+            source.backup(destination)
+        finally:
+            destination.close()
+            source.close()
+    except Exception as e:
+        try:
+            _rollback_directories(swapped)
+        except OSError as rollback_error:
+            raise BackupError(f'Restore failed ({str(e)}) and could not be rolled back: {str(rollback_error)}') from e
+        raise
+
+    os.remove(staged_database)
+    for live, previous, staged, moved in swapped:
+        if os.path.exists(previous):
+            shutil.rmtree(previous)
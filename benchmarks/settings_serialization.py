@@ -0,0 +1,84 @@
+#!/usr/bin/env python3
+"""
+Settings serialization benchmark for Business Documents Generator
+Compares cached JSON fragments with building a dict and jsonify-ing it per request
+
+Runs against a scratch database; usage: python benchmarks/settings_serialization.py [--users N]
+"""
+
+import argparse
+import os
+import sys
+import tempfile
+import timeit
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+def legacy_settings_dict(settings):
+    """The hand-built dict the endpoints used before settings_to_json()"""
+    if not settings:
+        return {'businessName': '', 'businessAddress': '', 'businessPhone': '', 'businessEmail': '',
+                'businessLogoUrl': '', 'signatureUrl': '', 'taxRate': 0, 'currency': 'USD'}
+    return {
+        'businessName': settings.business_name or '',
+        'businessAddress': settings.business_address or '',
+        'businessPhone': settings.business_phone or '',
+        'businessEmail': settings.business_email or '',
+        'businessLogoUrl': settings.business_logo_url or '',
+        'signatureUrl': settings.signature_url or '',
+        'taxRate': settings.tax_rate or 0,
+        'currency': settings.currency or 'USD'
+    }
+
+def report(name, legacy, cached, calls):
+    print(f"{name:<28} legacy {calls / legacy:>10,.0f}/s   cached {calls / cached:>10,.0f}/s   {legacy / cached:.1f}x")
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark settings serialization')
+    parser.add_argument('--users', type=int, default=500, help='Settings rows in the list benchmark')
+    parser.add_argument('--repeat', type=int, default=2000, help='Calls per single-row benchmark')
+    args = parser.parse_args()
+
+    # app.py sets itself up from the environment when imported
+    work_dir = tempfile.mkdtemp(prefix='settings-bench-')
+    os.environ['DATABASE_URL'] = f"sqlite:///{os.path.join(work_dir, 'bench.db')}"
+    os.environ['BACKUP_SCHEDULER'] = '0'
+    os.chdir(work_dir)
+    sys.path.insert(0, ROOT)
+
+    from flask import jsonify
+    from app import app, spliced_json_response
+    from models import db, BusinessSettings, UserBusinessSettings, User, settings_to_json
+
+    print("Business Documents Generator - Settings Serialization Benchmark")
+    print("="*50)
+
+    with app.app_context():
+        db.session.add(BusinessSettings(business_name='Acme Ltd', business_address='1 Main Street\nSpringfield',
+                                        business_phone='+1 555 0100', business_email='billing@acme.test',
+                                        business_logo_url='/static/uploads/logo.png', tax_rate=7.5, currency='NGN'))
+        for n in range(args.users):
+            user = User(username=f'bench{n}', email=f'bench{n}@example.com', first_name='Bench', last_name=str(n), password_hash='x')
+            db.session.add(user)
+            db.session.flush()
+            db.session.add(UserBusinessSettings(user_id=user.id, business_name=f'Business {n}', tax_rate=n % 20, currency='USD'))
+        db.session.commit()
+
+        settings = BusinessSettings.query.first()
+        rows = UserBusinessSettings.query.all()
+
+        with app.test_request_context():
+            # One settings row per response, as in get_public_settings and verify_code
+            legacy = timeit.timeit(lambda: jsonify({'success': True, 'settings': legacy_settings_dict(settings)}).get_data(), number=args.repeat)
+            cached = timeit.timeit(lambda: spliced_json_response({'success': True}, {'settings': settings_to_json(settings)}).get_data(), number=args.repeat)
+            report('single settings response', legacy, cached, args.repeat)
+
+            # Every row's settings, as in the admin users listing
+            repeat = max(args.repeat // 100, 5)
+            legacy = timeit.timeit(lambda: jsonify({'settings': [legacy_settings_dict(row) for row in rows]}).get_data(), number=repeat)
+            cached = timeit.timeit(lambda: app.response_class(b'{"settings":[' + b','.join(settings_to_json(row) for row in rows) + b']}',
+                                                               mimetype='application/json').get_data(), number=repeat)
+            report(f'{len(rows)}-row settings list', legacy, cached, repeat)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,105 @@
+#!/usr/bin/env python3
+"""
+SQLite tuning benchmark for Business Documents Generator
+Measures concurrent writes and reads per second with and without the tuning
+profile from sqlite_tuning.py, using several processes like gunicorn workers
+
+Usage: python benchmarks/sqlite_tuning.py [--writers N] [--readers N] [--seconds S]
+"""
+
+import argparse
+import multiprocessing
+import os
+import sys
+import tempfile
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+def make_db(path, tuned):
+    """A Flask-SQLAlchemy setup on path, configured the way app.py does it when tuned"""
+    from flask import Flask
+    from flask_sqlalchemy import SQLAlchemy
+    from sqlalchemy import text
+    from sqlite_tuning import init_sqlite_tuning, sqlite_engine_options, sqlite_pragmas_from_env
+
+    app = Flask(__name__)
+    app.config['SQLALCHEMY_DATABASE_URI'] = f'sqlite:///{path}'
+    app.config['SQLALCHEMY_ENGINE_OPTIONS'] = sqlite_engine_options() if tuned else {}
+    app.config['SQLITE_PRAGMAS'] = sqlite_pragmas_from_env() if tuned else {}
+    db = SQLAlchemy(app)
+    if tuned:
+        init_sqlite_tuning(app, db)
+    return app, db, text
+
+def worker(path, tuned, role, seconds, results):
+    app, db, text = make_db(path, tuned)
+    done = 0
+    errors = 0
+    with app.app_context():
+        deadline = time.monotonic() + seconds
+        while time.monotonic() < deadline:
+            try:
+                if role == 'write':
+                    # Shaped like an activity log insert
+                    db.session.execute(text('INSERT INTO activity (user_id, description, created_at) VALUES (:user, :description, :now)'),
+                                       {'user': done % 100, 'description': 'benchmark row ' * 4, 'now': time.time()})
+                    db.session.commit()
+                else:
+                    # Shaped like a dashboard lookup
+                    db.session.execute(text('SELECT count(*) FROM activity WHERE user_id = :user'), {'user': done % 100}).scalar()
+                    db.session.execute(text('SELECT * FROM activity WHERE user_id = :user ORDER BY created_at DESC LIMIT 20'),
+                                       {'user': done % 100}).fetchall()
+                    db.session.rollback()
+                done += 1
+            except Exception:
+                # "database is locked" once the busy timeout runs out
+                db.session.rollback()
+                errors += 1
+    results.put((role, done, errors))
+
+def run(tuned, writers, readers, seconds):
+    path = os.path.join(tempfile.mkdtemp(prefix='sqlite-bench-'), 'bench.db')
+    app, db, text = make_db(path, tuned)
+    with app.app_context():
+        db.session.execute(text('CREATE TABLE activity (id INTEGER PRIMARY KEY, user_id INTEGER, description TEXT, created_at REAL)'))
+        db.session.execute(text('CREATE INDEX ix_activity_user_created ON activity (user_id, created_at)'))
+        db.session.commit()
+        db.engine.dispose()
+
+    context = multiprocessing.get_context('spawn')
+    results = context.Queue()
+    processes = [context.Process(target=worker, args=(path, tuned, role, seconds, results))
+                 for role in ['write'] * writers + ['read'] * readers]
+    for process in processes:
+        process.start()
+    totals = {'write': [0, 0], 'read': [0, 0]}
+    for _ in processes:
+        role, done, errors = results.get()
+        totals[role][0] += done
+        totals[role][1] += errors
+    for process in processes:
+        process.join()
+    return totals
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark the SQLite tuning profile')
+    parser.add_argument('--writers', type=int, default=2, help='Writing processes')
+    parser.add_argument('--readers', type=int, default=4, help='Reading processes')
+    parser.add_argument('--seconds', type=float, default=5, help='Duration of each run')
+    args = parser.parse_args()
+
+    print("Business Documents Generator - SQLite Tuning Benchmark")
+    print("="*50)
+    print(f"{args.writers} writers, {args.readers} readers, {args.seconds:g}s per profile\n")
+
+    for name, tuned in (('default', False), ('tuned', True)):
+        totals = run(tuned, args.writers, args.readers, args.seconds)
+        writes, write_errors = totals['write']
+        reads, read_errors = totals['read']
+        print(f"{name:<8} writes {writes / args.seconds:>9,.0f}/s   reads {reads / args.seconds:>9,.0f}/s   "
+              f"errors {write_errors + read_errors}")
+
+if __name__ == "__main__":
+    main()
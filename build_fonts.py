@@ -0,0 +1,126 @@
+#!/usr/bin/env python3
+"""
+Font build script for Business Documents Generator
+Cuts the PDF font into per-script subsets under static/fonts/
+
+The browser PDF generator (static/js/pdf-fonts.js) reads manifest.json and
+downloads the smallest subset covering a document's text, and only when the
+text needs more than the built-in Helvetica can show. Every subset contains
+the Latin set, so a single font always covers a document. File names carry
+a content hash, so the app serves them with a long cache lifetime.
+
+Needs fontTools (pip install fonttools); run again after changing the
+source font or the ranges below.
+"""
+
+import argparse
+import hashlib
+import json
+import os
+import subprocess
+import sys
+
+SOURCE_FONT = os.path.join('fonts', 'Roboto-Regular.ttf')
+OUTPUT_DIR = os.path.join('static', 'fonts')
+FAMILY = 'Roboto'
+
+# Latin-1, general punctuation and all currency signs (e.g. the naira and rupee)
+LATIN = [
+    (0x0000, 0x00FF), (0x0131, 0x0131), (0x0152, 0x0153), (0x02BB, 0x02BC), (0x02C6, 0x02C6),
+    (0x02DA, 0x02DA), (0x02DC, 0x02DC), (0x2000, 0x206F), (0x2074, 0x2074), (0x20A0, 0x20CF),
+    (0x2122, 0x2122), (0x2191, 0x2191), (0x2193, 0x2193), (0x2212, 0x2212), (0x2215, 0x2215),
+    (0xFEFF, 0xFEFF), (0xFFFD, 0xFFFD),
+]
+
+# Smallest first; the browser picks the first subset that covers the text
+SUBSETS = [
+    ('latin', LATIN),
+    ('latin-ext', LATIN + [(0x0100, 0x02AF), (0x0300, 0x036F), (0x1E00, 0x1EFF), (0x2C60, 0x2C7F), (0xA720, 0xA7FF)]),
+    ('greek', LATIN + [(0x0370, 0x03FF), (0x1F00, 0x1FFF)]),
+    ('cyrillic', LATIN + [(0x0400, 0x052F), (0x1C80, 0x1C88), (0x2DE0, 0x2DFF), (0xA640, 0xA69F)]),
+]
+
+def ensure_fonttools():
+    """Install fontTools if it is missing"""
+    try:
+        import fontTools  # noqa: F401
+        print("✓ fonttools already installed")
+    except ImportError:
+        print("Installing fonttools...")
+        subprocess.check_call([sys.executable, "-m", "pip", "install", "fonttools"])
+
+def to_ranges(codepoints):
+    """Collapse code points into [first, last] pairs"""
+    ranges = []
+    for codepoint in sorted(codepoints):
+        if ranges and codepoint == ranges[-1][1] + 1:
+            ranges[-1][1] = codepoint
+        else:
+            ranges.append([codepoint, codepoint])
+    return ranges
+
+def build_subset(source, name, unicodes, output_dir):
+    """Write one subset; returns its manifest entry"""
+    from fontTools import subset
+    from fontTools.ttLib import TTFont
+
+    options = subset.Options()
+    # jsPDF only needs outlines, metrics and the cmap
+    options.layout_features = []
+    options.hinting = False
+    options.notdef_outline = True
+
+    # Keep the source's timestamp so rebuilding unchanged input gives the same hash
+    font = TTFont(source, recalcTimestamp=False)
+    subsetter = subset.Subsetter(options)
+    subsetter.populate(unicodes=unicodes)
+    subsetter.subset(font)
+
+    temp_path = os.path.join(output_dir, f'{FAMILY}-{name}.tmp')
+    font.save(temp_path)
+    with open(temp_path, 'rb') as f:
+        data = f.read()
+    filename = f'{FAMILY}-{name}.{hashlib.sha256(data).hexdigest()[:10]}.ttf'
+    os.replace(temp_path, os.path.join(output_dir, filename))
+
+    covered = font.getBestCmap().keys()
+    print(f"✓ {filename}: {len(covered)} characters, {len(data) // 1024} KB")
+    return {'name': name, 'file': filename, 'size': len(data), 'ranges': to_ranges(covered)}
+
+def main():
+    """Build all subsets and the manifest"""
+    parser = argparse.ArgumentParser(description='Build per-script PDF font subsets')
+    parser.add_argument('--source', default=SOURCE_FONT, help='TrueType font to subset')
+    parser.add_argument('--output', default=OUTPUT_DIR, help='Directory for the subsets and manifest.json')
+    args = parser.parse_args()
+
+    print("Business Documents Generator - Font Build")
+    print("="*50)
+
+    ensure_fonttools()
+    from fontTools.ttLib import TTFont
+
+    os.makedirs(args.output, exist_ok=True)
+    entries = []
+    for name, ranges in SUBSETS:
+        unicodes = [codepoint for first, last in ranges for codepoint in range(first, last + 1)]
+        entries.append(build_subset(args.source, name, unicodes, args.output))
+
+    # Everything the font has, for documents mixing scripts
+    entries.append(build_subset(args.source, 'full', list(TTFont(args.source).getBestCmap()), args.output))
+
+    manifest = {'family': FAMILY, 'subsets': entries}
+    with open(os.path.join(args.output, 'manifest.json'), 'w') as f:
+        json.dump(manifest, f, separators=(',', ':'))
+
+    # Drop subsets from earlier builds
+    current = {entry['file'] for entry in entries} | {'manifest.json'}
+    for filename in os.listdir(args.output):
+        if filename not in current:
+            os.remove(os.path.join(args.output, filename))
+            print(f"  removed stale {filename}")
+
+    print(f"\nFont build completed: {len(entries)} subsets in {args.output}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,181 @@
+import hashlib
+import json
+import os
+import secrets
+import threading
+import time
+
+from backup_scheduler import LeaderLock
+from file_storage import StagedFile
+
+# Upload sessions untouched for this long are removed by sweep()
+UPLOAD_SESSION_MAX_AGE = 24 * 3600
+
+
+class UploadSessionError(ValueError):
+    """Raised for unknown upload sessions and invalid chunks"""
+
+
+class UploadOffsetMismatch(UploadSessionError):
+    """Raised when a chunk does not start where the stored data ends"""
+
+    def __init__(self, offset):
+        super().__init__(f'Chunk must start at offset {offset}')
+        self.offset = offset
+
+
+class UploadInProgress(UploadOffsetMismatch):
+    """Raised when another request is still writing a chunk of the same upload"""
+
+    def __init__(self, offset):
+        UploadSessionError.__init__(self, 'Another chunk of this upload is being written')
+        self.offset = offset
+
+
+class UploadSessionStore:
+    """Resumable uploads, received as a sequence of chunks
+
+    Each session is a JSON metadata file plus a .part file in `root`. A chunk
+    is only accepted at the current end of the .part file, so a client whose
+    connection dropped asks for the offset and continues from there. The
+    SHA-256 is updated as chunks are written; a worker that did not see the
+    earlier chunks (another process, or a restart) re-reads the .part file
+    once to catch up. Writers hold an exclusive lock on the session's .lock
+    file, so concurrent requests for one upload cannot both append.
+    """
+
+    def __init__(self, root, file_store):
+        self.root = root
+        self.file_store = file_store
+        self._hashers = {}
+        self._lock = threading.Lock()
+
+    def _meta_path(self, upload_id):
+        return os.path.join(self.root, f'{upload_id}.json')
+
+    def _part_path(self, upload_id):
+        return os.path.join(self.root, f'{upload_id}.part')
+
+    def _lock_path(self, upload_id):
+        return os.path.join(self.root, f'{upload_id}.lock')
+
+    def create(self, size, **metadata):
+        """Start a session for `size` bytes; returns the upload id"""
+        os.makedirs(self.root, exist_ok=True)
+        upload_id = secrets.token_hex(16)
+        metadata.update({'upload_id': upload_id, 'size': size, 'created_at': time.time()})
+        with open(self._meta_path(upload_id), 'w') as f:
+            json.dump(metadata, f)
+        open(self._part_path(upload_id), 'wb').close()
+        return upload_id
+
+    def load(self, upload_id):
+        """Session metadata with the current offset"""
+        if not upload_id.isalnum():
+            raise UploadSessionError('Unknown upload')
+        try:
+            with open(self._meta_path(upload_id)) as f:
+                metadata = json.load(f)
+        except FileNotFoundError:
+            raise UploadSessionError('Unknown upload')
+        metadata['offset'] = os.path.getsize(self._part_path(upload_id))
+        return metadata
+
+    def append(self, upload_id, offset, stream):
+        """Write a chunk at offset, hashing it on the way; returns the new offset"""
+        metadata = self.load(upload_id)
+        if offset != metadata['offset']:
+            raise UploadOffsetMismatch(metadata['offset'])
+
+        lock = LeaderLock(self._lock_path(upload_id))
+        if not lock.acquire():
+            raise UploadInProgress(metadata['offset'])
+        try:
+            # Another request may have appended between load() and the lock
+            part_path = self._part_path(upload_id)
+            current = os.path.getsize(part_path)
+            if offset != current:
+                raise UploadOffsetMismatch(current)
+
+            hasher = self._hasher_at(upload_id, offset)
+            written = offset
+            with open(part_path, 'r+b') as part:
+                part.seek(offset)
+                for chunk in iter(lambda: stream.read(1024 * 1024), b''):
+                    if written + len(chunk) > metadata['size']:
+                        part.truncate(offset)
+                        self._forget(upload_id)
+                        raise UploadSessionError('Upload is larger than its declared size')
+                    written += len(chunk)
+                    hasher.update(chunk)
+                    part.write(chunk)
+
+            with self._lock:
+                self._hashers[upload_id] = (written, hasher)
+            return written
+        finally:
+            lock.release()
+
+    def finish(self, upload_id):
+        """Hand a complete upload over as a StagedFile for the file store"""
+        metadata = self.load(upload_id)
+        if metadata['offset'] != metadata['size']:
+            raise UploadSessionError(f"Upload incomplete: {metadata['offset']} of {metadata['size']} bytes received")
+
+        digest = self._hasher_at(upload_id, metadata['offset']).hexdigest()
+        expected = metadata.get('sha256')
+        if expected and expected.lower() != digest:
+            self.abort(upload_id)
+            raise UploadSessionError('Checksum mismatch, upload discarded')
+
+        self._forget(upload_id)
+        os.remove(self._meta_path(upload_id))
+        if os.path.exists(self._lock_path(upload_id)):
+            os.remove(self._lock_path(upload_id))
+        return metadata, StagedFile(self._part_path(upload_id), digest, metadata['size'], self.file_store.path_for(digest))
+
+    def abort(self, upload_id):
+        self.load(upload_id)
+        self._forget(upload_id)
+        for path in (self._meta_path(upload_id), self._part_path(upload_id), self._lock_path(upload_id)):
+            if os.path.exists(path):
+                os.remove(path)
+
+    def sweep(self, max_age=UPLOAD_SESSION_MAX_AGE):
+        """Remove abandoned sessions; returns how many were removed"""
+        if not os.path.isdir(self.root):
+            return 0
+        cutoff = time.time() - max_age
+        removed = 0
+        for name in os.listdir(self.root):
+            upload_id, extension = os.path.splitext(name)
+            if extension != '.json':
+                continue
+            part_path = self._part_path(upload_id)
+            last_activity = os.path.getmtime(part_path) if os.path.exists(part_path) else 0
+            if last_activity < cutoff:
+                self.abort(upload_id)
+                removed += 1
+        return removed
+
+    def _hasher_at(self, upload_id, offset):
+        with self._lock:
+            known_offset, hasher = self._hashers.get(upload_id, (None, None))
+        if known_offset == offset:
+            return hasher.copy()
+
+        # Chunks before this one were received elsewhere; read them once to catch up
+        hasher = hashlib.sha256()
+        with open(self._part_path(upload_id), 'rb') as part:
+            remaining = offset
+            while remaining:
+                chunk = part.read(min(1024 * 1024, remaining))
+                if not chunk:
+                    break
+                hasher.update(chunk)
+                remaining -= len(chunk)
+        return hasher
+
+    def _forget(self, upload_id):
+        with self._lock:
+            self._hashers.pop(upload_id, None)
@@ -0,0 +1,227 @@
+import json
+import zlib
+
+from datetime import datetime
+from sqlalchemy import select
+
+from models import db, User, UserPDFCode, PDFRequest, Message, DownloadCode, BusinessSettings, UserBusinessSettings, ClientSettings, ActivityLog, GeneratedDocument, SystemSettings
+
+EXPORT_VERSION = '2.0'
+
+# Rows fetched per round trip while walking a table
+EXPORT_BATCH_SIZE = 1000
+
+# Uncompressed bytes collected before a chunk is handed to the response
+EXPORT_CHUNK_SIZE = 64 * 1024
+
+
+def _iso(value):
+    return value.isoformat() if value else None
+
+
+def serialize_user(user):
+    # Password hashes are never exported
+    return {
+        'id': user.id,
+        'username': user.username,
+        'email': user.email,
+        'first_name': user.first_name,
+        'last_name': user.last_name,
+        'is_admin': user.is_admin,
+        'is_verified': user.is_verified,
+        'created_at': _iso(user.created_at),
+        'last_login': _iso(user.last_login)
+    }
+
+
+def serialize_business_settings(setting):
+    return {
+        'id': setting.id,
+        'business_name': setting.business_name,
+        'business_address': setting.business_address,
+        'business_phone': setting.business_phone,
+        'business_email': setting.business_email,
+        'business_logo_url': setting.business_logo_url,
+        'signature_url': setting.signature_url,
+        'tax_rate': setting.tax_rate,
+        'currency': setting.currency,
+        'created_at': _iso(setting.created_at),
+        'updated_at': _iso(setting.updated_at)
+    }
+
+
+def serialize_user_business_settings(setting):
+    return {'user_id': setting.user_id, **serialize_business_settings(setting)}
+
+
+def serialize_client(client):
+    return {
+        'id': client.id,
+        'user_id': client.user_id,
+        'client_name': client.client_name,
+        'client_address': client.client_address,
+        'client_email': client.client_email,
+        'client_phone': client.client_phone,
+        'is_active': client.is_active,
+        'created_at': _iso(client.created_at),
+        'updated_at': _iso(client.updated_at)
+    }
+
+
+def serialize_pdf_request(req):
+    return {
+        'id': req.id,
+        'user_id': req.user_id,
+        'title': req.title,
+        'description': req.description,
+        'status': req.status,
+        'admin_response': req.admin_response,
+        'created_at': _iso(req.created_at),
+        'updated_at': _iso(req.updated_at)
+    }
+
+
+def serialize_message(msg):
+    return {
+        'id': msg.id,
+        'sender_id': msg.sender_id,
+        'recipient_id': msg.recipient_id,
+        'subject': msg.subject,
+        'content': msg.content,
+        'is_read': msg.is_read,
+        'parent_message_id': msg.parent_message_id,
+        'created_at': _iso(msg.created_at)
+    }
+
+
+def serialize_system_setting(setting):
+    return {
+        'id': setting.id,
+        'setting_key': setting.setting_key,
+        'setting_value': setting.setting_value,
+        'created_at': _iso(setting.created_at),
+        'updated_at': _iso(setting.updated_at)
+    }
+
+
+def serialize_user_pdf_code(pdf_code):
+    return {
+        'id': pdf_code.id,
+        'user_id': pdf_code.user_id,
+        'filename': pdf_code.filename,
+        'original_filename': pdf_code.original_filename,
+        'file_path': pdf_code.file_path,
+        'description': pdf_code.description,
+        'uploaded_by_admin_id': pdf_code.uploaded_by_admin_id,
+        'uploaded_at': _iso(pdf_code.uploaded_at),
+        'downloaded_at': _iso(pdf_code.downloaded_at),
+        'download_count': pdf_code.download_count
+    }
+
+
+def serialize_download_code(download_code):
+    return {
+        'id': download_code.id,
+        'code': download_code.code,
+        'user_id': download_code.user_id,
+        'document_data': download_code.document_data,
+        'created_at': _iso(download_code.created_at),
+        'expires_at': _iso(download_code.expires_at),
+        'used': download_code.used,
+        'used_at': _iso(download_code.used_at)
+    }
+
+
+def serialize_activity_log(log):
+    return {
+        'id': log.id,
+        'user_id': log.user_id,
+        'activity_type': log.activity_type,
+        'description': log.description,
+        'ip_address': log.ip_address,
+        'user_agent': log.user_agent,
+        'created_at': _iso(log.created_at)
+    }
+
+
+def serialize_generated_document(doc):
+    return {
+        'id': doc.id,
+        'user_id': doc.user_id,
+        'document_type': doc.document_type,
+        'document_title': doc.document_title,
+        'file_path': doc.file_path,
+        'created_at': _iso(doc.created_at)
+    }
+
+
+# (section name, model, serializer), in an order that keeps parents before children
+EXPORT_TABLES = [
+    ('users', User, serialize_user),
+    ('business_settings', BusinessSettings, serialize_business_settings),
+    ('user_business_settings', UserBusinessSettings, serialize_user_business_settings),
+    ('client_settings', ClientSettings, serialize_client),
+    ('pdf_requests', PDFRequest, serialize_pdf_request),
+    ('messages', Message, serialize_message),
+    ('system_settings', SystemSettings, serialize_system_setting),
+    ('user_pdf_codes', UserPDFCode, serialize_user_pdf_code),
+    ('download_codes', DownloadCode, serialize_download_code),
+    ('activity_logs', ActivityLog, serialize_activity_log),
+    ('generated_documents', GeneratedDocument, serialize_generated_document),
+]
+
+# Sections of the legacy JSON export, which is built in memory; the
+# high-volume tables (activity logs, download codes, ...) are NDJSON-only
+JSON_EXPORT_TABLES = ('users', 'business_settings', 'user_business_settings', 'client_settings',
+                      'pdf_requests', 'messages', 'system_settings')
+
+
+def iter_table_rows(model, serializer):
+    """Serialize every row of a table, fetching EXPORT_BATCH_SIZE rows at a time"""
+    stmt = select(model).order_by(model.id).execution_options(yield_per=EXPORT_BATCH_SIZE)
+    for row in db.session.execute(stmt).scalars():
+        yield serializer(row)
+
+
+def iter_ndjson_lines():
+    """Yield the export as NDJSON lines
+
+    The stream starts with an export_info line, then for each table a
+    section line followed by one row line per record, and ends with an end
+    line carrying the per-table record counts.
+    """
+    yield json.dumps({'type': 'export_info', 'version': EXPORT_VERSION, 'export_date': datetime.utcnow().isoformat()}) + '\n'
+
+    total_records = {}
+    for name, model, serializer in EXPORT_TABLES:
+        yield json.dumps({'type': 'section', 'table': name}) + '\n'
+        count = 0
+        for row in iter_table_rows(model, serializer):
+            yield json.dumps({'type': 'row', 'data': row}) + '\n'
+            count += 1
+        total_records[name] = count
+
+    yield json.dumps({'type': 'end', 'total_records': total_records}) + '\n'
+
+
+def iter_ndjson_export(compress=False):
+    """Yield the NDJSON export as byte chunks, gzip-compressed if requested"""
+    compressor = zlib.compressobj(6, zlib.DEFLATED, 31) if compress else None
+    buffer = []
+    size = 0
+
+    for line in iter_ndjson_lines():
+        buffer.append(line)
+        size += len(line)
+        if size >= EXPORT_CHUNK_SIZE:
+            chunk = ''.join(buffer).encode('utf-8')
+            buffer, size = [], 0
+            chunk = compressor.compress(chunk) if compressor else chunk
+            if chunk:
+                yield chunk
+
+    chunk = ''.join(buffer).encode('utf-8')
+    if compressor:
+        chunk = compressor.compress(chunk) + compressor.flush()
+    if chunk:
+        yield chunk
@@ -0,0 +1,200 @@
+import json
+
+from datetime import datetime
+from sqlalchemy import insert, select, update
+
+from models import db, User, PDFRequest, Message, BusinessSettings, UserBusinessSettings, ClientSettings, SystemSettings
+
+# Rows upserted per round of key lookup + INSERT + UPDATE
+IMPORT_BATCH_SIZE = 1000
+
+# Stored for imported users, since exports never contain password hashes.
+# It is not a valid hash, so these users cannot log in until an admin sets a password.
+UNUSABLE_PASSWORD_HASH = '!'
+
+# Tables accepted by the importer and the column rows are matched on
+IMPORT_TABLES = {
+    'users': (User, 'id'),
+    'business_settings': (BusinessSettings, 'id'),
+    'user_business_settings': (UserBusinessSettings, 'id'),
+    'client_settings': (ClientSettings, 'id'),
+    'pdf_requests': (PDFRequest, 'id'),
+    'messages': (Message, 'id'),
+    'system_settings': (SystemSettings, 'setting_key'),
+}
+
+
+class DataImportError(ValueError):
+    """Raised for malformed import data"""
+
+
+def iter_ndjson_records(lines):
+    """Turn the lines of an NDJSON export into (table, row) pairs"""
+    table = None
+    for line_number, line in enumerate(lines, 1):
+        line = line.strip()
+        if not line:
+            continue
+
+        try:
+            record = json.loads(line)
+        except ValueError as e:
+            raise DataImportError(f'Line {line_number}: invalid JSON ({str(e)})')
+
+        record_type = record.get('type')
+        if record_type == 'section':
+            table = record.get('table')
+        elif record_type == 'row':
+            if table is None:
+                raise DataImportError(f'Line {line_number}: row outside of a table section')
+            yield table, record.get('data') or {}
+
+
+def iter_json_records(data, tables):
+    """Turn a JSON export dict into (table, row) pairs for the given tables"""
+    for table in tables:
+        for row in data.get(table) or []:
+            yield table, row
+
+
+def _prepare_row(model, row):
+    """Keep only the model's columns and parse ISO datetimes"""
+    prepared = {}
+    for column in model.__table__.columns:
+        if column.name not in row:
+            continue
+        value = row[column.name]
+        if isinstance(column.type, db.DateTime) and isinstance(value, str):
+            value = datetime.fromisoformat(value)
+        prepared[column.name] = value
+    return prepared
+
+
+def _check_user_identities(by_id, mode, overwrite):
+    """Refuse user rows that would be applied to a different local account
+
+    Ids are only meaningful within one database, so an export from another
+    instance can carry an id that belongs to someone else here. A row whose
+    id exists with another username or email is refused unless overwrite is
+    set; one whose username or email belongs to another id always is.
+    """
+    usernames = [row.get('username') for row in by_id.values()]
+    emails = [row.get('email') for row in by_id.values()]
+    local = db.session.execute(
+        select(User.id, User.username, User.email)
+        .where(User.id.in_(list(by_id)) | User.username.in_(usernames) | User.email.in_(emails))
+    ).all()
+    by_local_id = {user.id: user for user in local}
+
+    conflicts = []
+    for user_id, row in by_id.items():
+        same_id = by_local_id.get(user_id)
+        if same_id is not None and mode == 'upsert' and not overwrite and (
+                ('username' in row and row['username'] != same_id.username) or
+                ('email' in row and row['email'] != same_id.email)):
+            conflicts.append(f"user {user_id} is {same_id.username} here, not {row.get('username')}")
+        if same_id is not None and mode == 'insert':
+            # Skipped anyway
+            continue
+        for other in local:
+            if other.id != user_id and (other.username == row.get('username') or other.email == row.get('email')):
+                conflicts.append(f"{row.get('username')} ({row.get('email')}) is user {other.id} here, not {user_id}")
+                break
+
+    if conflicts:
+        more = f' and {len(conflicts) - 5} more' if len(conflicts) > 5 else ''
+        raise DataImportError(f"Users do not match this database: {'; '.join(conflicts[:5])}{more}")
+
+
+def _import_batch(table, rows, mode, dry_run, counts, overwrite=False):
+    model, key = IMPORT_TABLES[table]
+    key_column = getattr(model, key)
+    table_counts = counts.setdefault(table, {'inserted': 0, 'updated': 0, 'skipped': 0})
+
+    # Last occurrence of a key in the batch wins
+    by_key = {}
+    for row in rows:
+        prepared = _prepare_row(model, row)
+        if prepared.get(key) is None:
+            table_counts['skipped'] += 1
+            continue
+        by_key[prepared[key]] = prepared
+
+    existing = dict(db.session.execute(
+        select(key_column, model.id).where(key_column.in_(list(by_key)))
+    ).all())
+    if model is User:
+        _check_user_identities(by_key, mode, overwrite)
+
+    inserts = []
+    updates = []
+    for key_value, prepared in by_key.items():
+        if key_value in existing:
+            if mode == 'insert':
+                table_counts['skipped'] += 1
+                continue
+            prepared['id'] = existing[key_value]
+            updates.append(prepared)
+        else:
+            if key != 'id':
+                # Ids from another database may already be taken here
+                prepared.pop('id', None)
+            if model is User:
+                prepared.setdefault('password_hash', UNUSABLE_PASSWORD_HASH)
+            inserts.append(prepared)
+
+    table_counts['inserted'] += len(inserts)
+    table_counts['updated'] += len(updates)
+
+    if dry_run:
+        return
+    if inserts:
+        db.session.execute(insert(model), inserts)
+    if updates:
+        db.session.execute(update(model), updates)
+
+
+def import_records(records, tables=None, mode='upsert', dry_run=False, batch_size=IMPORT_BATCH_SIZE, overwrite=False):
+    """Upsert (table, row) pairs in batches inside a single transaction
+
+    For every batch the existing keys are fetched with one IN query, new rows
+    go in with a multi-row INSERT and existing ones are updated by primary
+    key (or left alone when mode is 'insert'). Rows for tables outside
+    `tables` are counted as ignored. In dry-run mode nothing is written and
+    the returned counts show what would have happened. Users are matched by
+    id but refused when their username or email says they are someone else
+    here (see _check_user_identities); overwrite lets id matches win anyway.
+    Any error rolls back the whole import.
+    """
+    if mode not in ('upsert', 'insert'):
+        raise DataImportError('Mode must be upsert or insert')
+    allowed = set(tables or IMPORT_TABLES) & set(IMPORT_TABLES)
+
+    counts = {}
+    ignored = {}
+    batch_table = None
+    batch = []
+
+    try:
+        for table, row in records:
+            if table not in allowed:
+                ignored[table] = ignored.get(table, 0) + 1
+                continue
+            if batch and (table != batch_table or len(batch) >= batch_size):
+                _import_batch(batch_table, batch, mode, dry_run, counts, overwrite)
+                batch = []
+            batch_table = table
+            batch.append(row)
+
+        if batch:
+            _import_batch(batch_table, batch, mode, dry_run, counts, overwrite)
+
+        if dry_run:
+            db.session.rollback()
+        else:
+            db.session.commit()
+    except Exception:
+        db.session.rollback()
+        raise
+
+    return counts, ignored
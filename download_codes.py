@@ -0,0 +1,85 @@
+import secrets
+import string
+
+from datetime import datetime
+from sqlalchemy import insert, select
+from sqlalchemy.exc import IntegrityError
+
+from models import db, DownloadCode
+
+CODE_ALPHABET = string.ascii_uppercase + string.digits
+CODE_LENGTH = 8
+
+# Codes per IN (...) lookup and per multi-row INSERT
+LOOKUP_CHUNK_SIZE = 2000
+INSERT_CHUNK_SIZE = 5000
+
+
+def random_codes(count, length=CODE_LENGTH, alphabet=CODE_ALPHABET):
+    """Draw count random codes from bulk reads of the OS CSPRNG"""
+    # Bytes at or above limit are rejected so every character is equally likely
+    limit = 256 - (256 % len(alphabet))
+    needed = count * length
+    chars = []
+    while len(chars) < needed:
+        missing = needed - len(chars)
+        raw = secrets.token_bytes(missing * 256 // limit + 16)
+        chars.extend(alphabet[byte % len(alphabet)] for byte in raw if byte < limit)
+
+    joined = ''.join(chars[:needed])
+    return [joined[i:i + length] for i in range(0, needed, length)]
+
+
+def existing_codes(codes):
+    """Return the subset of codes already stored in the download_code table"""
+    codes = list(codes)
+    found = set()
+    for i in range(0, len(codes), LOOKUP_CHUNK_SIZE):
+        chunk = codes[i:i + LOOKUP_CHUNK_SIZE]
+        found.update(db.session.execute(select(DownloadCode.code).where(DownloadCode.code.in_(chunk))).scalars())
+    return found
+
+
+def unique_codes(quantity, max_rounds=10):
+    """Generate quantity codes unique within the batch and against the table"""
+    codes = set()
+    for _ in range(max_rounds):
+        missing = quantity - len(codes)
+        if missing <= 0:
+            break
+        candidates = set(random_codes(missing)) - codes
+        codes |= candidates - existing_codes(candidates)
+
+    if len(codes) < quantity:
+        raise RuntimeError(f'Could only generate {len(codes)} of {quantity} unique codes')
+    return list(codes)
+
+
+def create_download_codes(quantity, expires_at, user_id=None, document_data=None, max_attempts=3):
+    """Generate, insert and commit quantity unique download codes
+
+    Rows are written with multi-row INSERTs. If a concurrent request stored
+    one of the codes between the lookup and the insert, the whole batch is
+    rolled back and generated again. Returns the list of codes.
+    """
+    for attempt in range(max_attempts):
+        codes = unique_codes(quantity)
+        created_at = datetime.utcnow()
+        rows = [{
+            'code': code,
+            'user_id': user_id,
+            'document_data': document_data,
+            'created_at': created_at,
+            'expires_at': expires_at,
+            'used': False
+        } for code in codes]
+
+        try:
+            for i in range(0, len(rows), INSERT_CHUNK_SIZE):
+                db.session.execute(insert(DownloadCode), rows[i:i + INSERT_CHUNK_SIZE])
+            db.session.commit()
+            return codes
+        except IntegrityError:
+            db.session.rollback()
+            if attempt == max_attempts - 1:
+                raise
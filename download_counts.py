@@ -0,0 +1,100 @@
+import atexit
+import logging
+import threading
+
+from datetime import datetime
+from sqlalchemy import bindparam, func, update
+
+from models import db, UserPDFCode
+
+
+class DownloadCounter:
+    """Buffers download hits in memory and folds them into UserPDFCode
+
+    A download only bumps an in-process counter. A daemon thread applies
+    the totals every flush_interval seconds with one executemany of
+    UPDATE ... SET download_count = download_count + ?, which is atomic
+    in the database, so counts stay exact across workers and threads. Totals
+    from a failed flush are kept for the next one.
+    """
+
+    def __init__(self, app=None, flush_interval=5.0):
+        self.flush_interval = flush_interval
+        self.flushed = 0
+        self._pending = {}
+        self._lock = threading.Lock()
+        self._write_lock = threading.Lock()
+        self._stop_event = threading.Event()
+        self._thread = None
+        self.app = None
+
+        if app is not None:
+            self.init_app(app)
+
+    def init_app(self, app):
+        """Bind the counter to an app and start the flush thread"""
+        self.app = app
+        self._thread = threading.Thread(target=self._run, name='download-counter', daemon=True)
+        self._thread.start()
+        atexit.register(self.stop)
+
+    def record(self, file_id, downloaded_at=None):
+        """Count one download of a UserPDFCode"""
+        downloaded_at = downloaded_at or datetime.utcnow()
+        with self._lock:
+            count, _ = self._pending.get(file_id, (0, None))
+            self._pending[file_id] = (count + 1, downloaded_at)
+
+    def stats(self):
+        """Counters for monitoring the buffer"""
+        with self._lock:
+            pending = sum(count for count, _ in self._pending.values())
+        return {'pending': pending, 'flushed': self.flushed}
+
+    def flush(self):
+        """Apply all buffered counts from the calling thread"""
+        with self._lock:
+            pending, self._pending = self._pending, {}
+        if not pending:
+            return
+
+        rows = [{'file_id': file_id, 'hits': count, 'last_download': downloaded_at}
+                for file_id, (count, downloaded_at) in pending.items()]
+        stmt = (
+            update(UserPDFCode.__table__)
+            .where(UserPDFCode.__table__.c.id == bindparam('file_id'))
+            .values(
+                download_count=func.coalesce(UserPDFCode.__table__.c.download_count, 0) + bindparam('hits'),
+                downloaded_at=bindparam('last_download')
+            )
+        )
+
+        with self._write_lock, self.app.app_context():
+            try:
+                db.session.execute(stmt, rows)
+                db.session.commit()
+                self.flushed += sum(row['hits'] for row in rows)
+            except Exception as e:
+                db.session.rollback()
+                self._restore(pending)
+                logging.error(f"Failed to write {len(rows)} download counts: {str(e)}")
+
+    def stop(self, timeout=10):
+        """Stop the flush thread and write out any remaining counts"""
+        if self._stop_event.is_set():
+            return
+        self._stop_event.set()
+        if self._thread is not None:
+            self._thread.join(timeout)
+        self.flush()
+
+    def _run(self):
+        while not self._stop_event.wait(self.flush_interval):
+            self.flush()
+
+    def _restore(self, pending):
+        # Merge a failed batch back so no hit is lost
+        with self._lock:
+            for file_id, (count, downloaded_at) in pending.items():
+                current_count, current_at = self._pending.get(file_id, (0, None))
+                self._pending[file_id] = (current_count + count, max(filter(None, (current_at, downloaded_at))))
@@ -0,0 +1,193 @@
+import os
+import shutil
+import time
+
+from datetime import datetime
+from sqlalchemy import select
+
+from models import db, UserPDFCode, GeneratedDocument, RenderJobItem, StoredFile
+
+# Paths checked against the database per round of IN (...) queries
+GC_BATCH_SIZE = 500
+
+# Directories under a root that the collector manages itself or must not touch
+QUARANTINE_DIR = '.quarantine'
+SKIPPED_DIRS = {QUARANTINE_DIR, '.tmp'}
+
+
+def _sort_key(relative_path):
+    return tuple(relative_path.split('/'))
+
+
+def iter_files(root, after=None):
+    """Yield (relative path, absolute path) of files under root in a stable order
+
+    Paths are ordered component by component, so a run can stop anywhere and
+    the next one resumes after the last path it saw without rescanning the
+    directories before it.
+    """
+    after_key = _sort_key(after) if after else None
+
+    def walk(directory, prefix):
+        try:
+            entries = sorted(os.scandir(directory), key=lambda entry: entry.name)
+        except FileNotFoundError:
+            return
+        for entry in entries:
+            relative_path = f'{prefix}{entry.name}'
+            key = _sort_key(relative_path)
+            if entry.is_dir(follow_symlinks=False):
+                if not prefix and entry.name in SKIPPED_DIRS:
+                    continue
+                # Skip whole subtrees that sort before the cursor
+                if after_key and key < after_key[:len(key)]:
+                    continue
+                yield from walk(entry.path, relative_path + '/')
+            elif entry.is_file(follow_symlinks=False):
+                if after_key and key <= after_key:
+                    continue
+                yield relative_path, entry.path
+
+    yield from walk(root, '')
+
+
+def referenced_paths(paths, file_store):
+    """Return the subset of absolute paths that the database still references"""
+    # file_path columns hold both relative and absolute paths
+    candidates = {}
+    for path in paths:
+        candidates[path] = path
+        candidates[os.path.relpath(path)] = path
+
+    found = set()
+    keys = list(candidates)
+    for model in (UserPDFCode, GeneratedDocument, RenderJobItem):
+        for i in range(0, len(keys), GC_BATCH_SIZE):
+            chunk = keys[i:i + GC_BATCH_SIZE]
+            found.update(candidates[value] for value in db.session.execute(
+                select(model.file_path).where(model.file_path.in_(chunk))
+            ).scalars())
+
+    digests = {}
+    for path in paths:
+        digest = file_store.digest_from_path(path)
+        if digest:
+            digests[digest] = path
+    if digests:
+        found.update(digests[digest] for digest in db.session.execute(
+            select(StoredFile.sha256).where(StoredFile.sha256.in_(list(digests)), StoredFile.ref_count > 0)
+        ).scalars())
+    return found
+
+
+class OrphanCollector:
+    """Finds files no database row references and retires them in two steps
+
+    Orphans are first moved into <root>/.quarantine/<date>/, keeping their
+    relative path, and only deleted once their quarantine is older than
+    quarantine_days, so a mistake can be undone by moving files back. Files
+    modified within grace_seconds are left alone because an upload may be
+    about to commit a row for them. Each run checks at most max_files files
+    and returns a cursor for the next run, so a large tree is covered over
+    several short runs instead of one long scan.
+    """
+
+    def __init__(self, roots, file_store, quarantine_days=7, grace_seconds=3600):
+        self.roots = [os.path.abspath(root) for root in roots]
+        self.file_store = file_store
+        self.quarantine_days = quarantine_days
+        self.grace_seconds = grace_seconds
+
+    def run(self, cursor=None, max_files=10000, dry_run=False):
+        """Scan up to max_files files starting after cursor
+
+        The cursor has the form '<root index>:<relative path>'; None starts
+        from the beginning. Returns the run stats, including the next cursor,
+        which is None once the whole tree has been covered.
+        """
+        stats = {'scanned': 0, 'orphans': 0, 'bytes_quarantined': 0, 'restored': 0, 'purged': 0, 'bytes_reclaimed': 0, 'cursor': None}
+        if not dry_run:
+            self._purge_quarantine(stats)
+
+        root_index, after = 0, None
+        if cursor:
+            index, _, after = cursor.partition(':')
+            root_index = int(index)
+
+        cutoff = time.time() - self.grace_seconds
+        for index in range(root_index, len(self.roots)):
+            root = self.roots[index]
+            batch = []
+            for relative_path, path in iter_files(root, after if index == root_index else None):
+                stats['scanned'] += 1
+                batch.append((relative_path, path))
+                if len(batch) >= GC_BATCH_SIZE:
+                    self._collect(root, batch, cutoff, dry_run, stats)
+                    batch = []
+                if stats['scanned'] >= max_files:
+                    self._collect(root, batch, cutoff, dry_run, stats)
+                    stats['cursor'] = f'{index}:{relative_path}'
+                    return stats
+            self._collect(root, batch, cutoff, dry_run, stats)
+
+        return stats
+
+    def _collect(self, root, batch, cutoff, dry_run, stats):
+        if not batch:
+            return
+        referenced = referenced_paths([path for _, path in batch], self.file_store)
+        orphans = []
+        for relative_path, path in batch:
+            if path in referenced:
+                continue
+            try:
+                stat = os.stat(path)
+            except FileNotFoundError:
+                continue
+            if stat.st_mtime >= cutoff:
+                continue
+            stats['orphans'] += 1
+            stats['bytes_quarantined'] += stat.st_size
+            orphans.append((relative_path, path))
+
+        if dry_run or not orphans:
+            return
+
+        quarantine = os.path.join(root, QUARANTINE_DIR, datetime.utcnow().strftime('%Y%m%d'))
+        moved = []
+        for relative_path, path in orphans:
+            target = os.path.join(quarantine, relative_path)
+            os.makedirs(os.path.dirname(target), exist_ok=True)
+            os.replace(path, target)
+            moved.append((path, target))
+
+        # A row may have started referencing a file between the check and the move
+        still_referenced = referenced_paths([path for path, _ in moved], self.file_store)
+        db.session.commit()
+        for path, target in moved:
+            if path in still_referenced and not os.path.exists(path):
+                os.replace(target, path)
+                stats['restored'] += 1
+                stats['orphans'] -= 1
+                stats['bytes_quarantined'] -= os.path.getsize(path)
+
+    def _purge_quarantine(self, stats):
+        """Delete quarantine folders older than quarantine_days"""
+        oldest_kept = datetime.utcnow().date().toordinal() - self.quarantine_days
+        for root in self.roots:
+            quarantine_root = os.path.join(root, QUARANTINE_DIR)
+            if not os.path.isdir(quarantine_root):
+                continue
+            for name in os.listdir(quarantine_root):
+                try:
+                    day = datetime.strptime(name, '%Y%m%d').date().toordinal()
+                except ValueError:
+                    continue
+                if day >= oldest_kept:
+                    continue
+                folder = os.path.join(quarantine_root, name)
+                for dirpath, _, filenames in os.walk(folder):
+                    for filename in filenames:
+                        stats['purged'] += 1
+                        stats['bytes_reclaimed'] += os.path.getsize(os.path.join(dirpath, filename))
+                shutil.rmtree(folder)
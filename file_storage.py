@@ -0,0 +1,156 @@
+import hashlib
+import os
+import re
+import tempfile
+import time
+
+from sqlalchemy import delete, insert, select, update
+from sqlalchemy.exc import IntegrityError
+
+from models import db, StoredFile
+
+_DIGEST_RE = re.compile(r'^[0-9a-f]{64}$')
+
+
+class StagedFile:
+    """An upload written to the store's tmp directory, not yet published"""
+
+    def __init__(self, temp_path, digest, size, path):
+        self.temp_path = temp_path
+        self.digest = digest
+        self.size = size
+        self.path = path
+
+
+class FileStore:
+    """Content-addressed upload storage with reference counts
+
+    Files live under objects/<aa>/<bb>/<sha256>, so identical uploads are
+    stored once and no directory grows past a few hundred entries. How many
+    UserPDFCode rows point at each file is tracked in StoredFile.
+
+    A file is only moved into place after the transaction that references it
+    has committed, and remove_if_unreferenced() double-checks the database
+    after moving a file aside. Together this keeps a concurrent upload of the
+    same content from losing its file to a concurrent delete.
+    """
+
+    def __init__(self, root):
+        self.root = root
+        self.objects_dir = os.path.join(root, 'objects')
+        self.tmp_dir = os.path.join(root, '.tmp')
+
+    def path_for(self, digest):
+        return os.path.join(self.objects_dir, digest[:2], digest[2:4], digest)
+
+    def digest_from_path(self, path):
+        """The digest of a path inside the store, or None for other (legacy) paths"""
+        digest = os.path.basename(path or '')
+        if _DIGEST_RE.match(digest) and os.path.abspath(path) == os.path.abspath(self.path_for(digest)):
+            return digest
+        return None
+
+    def stage(self, stream):
+        """Write a stream to a temp file, hashing it on the way"""
+        os.makedirs(self.tmp_dir, exist_ok=True)
+        hasher = hashlib.sha256()
+        size = 0
+        fd, temp_path = tempfile.mkstemp(dir=self.tmp_dir)
+        try:
+            with os.fdopen(fd, 'wb') as destination:
+                for chunk in iter(lambda: stream.read(1024 * 1024), b''):
+                    hasher.update(chunk)
+                    destination.write(chunk)
+                    size += len(chunk)
+        except Exception:
+            os.remove(temp_path)
+            raise
+
+        digest = hasher.hexdigest()
+        return StagedFile(temp_path, digest, size, self.path_for(digest))
+
+    def add_reference(self, digest, size):
+        """Count one more reference to a file in the current transaction"""
+        for _ in range(2):
+            result = db.session.execute(
+                update(StoredFile).where(StoredFile.sha256 == digest).values(ref_count=StoredFile.ref_count + 1)
+            )
+            if result.rowcount:
+                return
+            try:
+                with db.session.begin_nested():
+                    db.session.execute(insert(StoredFile).values(sha256=digest, size=size, ref_count=1))
+                return
+            except IntegrityError:
+                # Another request inserted the row first; increment it instead
+                continue
+        raise RuntimeError(f'Could not reference stored file {digest}')
+
+    def release_reference(self, digest):
+        """Count one reference less in the current transaction
+
+        Call remove_if_unreferenced() after committing to free the file.
+        """
+        db.session.execute(
+            update(StoredFile)
+            .where(StoredFile.sha256 == digest, StoredFile.ref_count > 0)
+            .values(ref_count=StoredFile.ref_count - 1)
+        )
+
+    def publish(self, staged):
+        """Move a staged file into place; call after committing its reference"""
+        if os.path.exists(staged.path):
+            os.remove(staged.temp_path)
+            return False
+        os.makedirs(os.path.dirname(staged.path), exist_ok=True)
+        os.replace(staged.temp_path, staged.path)
+        return True
+
+    def discard(self, staged):
+        """Remove a staged file that was not published"""
+        if os.path.exists(staged.temp_path):
+            os.remove(staged.temp_path)
+
+    def sweep_tmp(self, max_age):
+        """Remove temp files left behind by failed uploads; returns (files, bytes) removed"""
+        removed = 0
+        freed = 0
+        if not os.path.isdir(self.tmp_dir):
+            return removed, freed
+        cutoff = time.time() - max_age
+        for entry in os.scandir(self.tmp_dir):
+            if entry.is_file(follow_symlinks=False) and entry.stat().st_mtime < cutoff:
+                freed += entry.stat().st_size
+                os.remove(entry.path)
+                removed += 1
+        return removed, freed
+
+    def remove_if_unreferenced(self, digest):
+        """Delete a file and its row once nothing references it; returns True if deleted"""
+        result = db.session.execute(delete(StoredFile).where(StoredFile.sha256 == digest, StoredFile.ref_count <= 0))
+        db.session.commit()
+        if not result.rowcount:
+            return False
+
+        path = self.path_for(digest)
+        if not os.path.exists(path):
+            return True
+
+        os.makedirs(self.tmp_dir, exist_ok=True)
+        # Reserve a unique name, then move the file over it
+        fd, doomed = tempfile.mkstemp(dir=self.tmp_dir, suffix='.deleted')
+        os.close(fd)
+        try:
+            os.replace(path, doomed)
+        except FileNotFoundError:
+            # Removed by a concurrent call for the same digest
+            os.remove(doomed)
+            return True
+        # An upload of the same content may have referenced it since the DELETE
+        referenced = db.session.execute(select(StoredFile.id).where(StoredFile.sha256 == digest)).first()
+        db.session.commit()
+        if referenced and not os.path.exists(path):
+            os.replace(doomed, path)
+        else:
+            os.remove(doomed)
+        return not referenced
@@ -1,6 +1,7 @@
 from datetime import datetime, timedelta
 from flask_sqlalchemy import SQLAlchemy
 from werkzeug.security import generate_password_hash, check_password_hash
+import json
 import secrets
 import string
 
@@ -61,9 +62,27 @@ class UserPDFCode(db.Model):
     downloaded_at = db.Column(db.DateTime, nullable=True)
     download_count = db.Column(db.Integer, default=0)
 
+    __table_args__ = (
+        # User dashboard file list and admin "recent uploads"
+        db.Index('ix_user_pdf_code_user_uploaded', 'user_id', 'uploaded_at'),
+        db.Index('ix_user_pdf_code_uploaded_at', 'uploaded_at'),
+        db.Index('ix_user_pdf_code_uploaded_by', 'uploaded_by_admin_id'),
+    )
+
     def __repr__(self):
         return f'<UserPDFCode {self.filename}>'
 
+class StoredFile(db.Model):
+    """Reference count for a content-addressed upload, keyed by its SHA-256"""
+    id = db.Column(db.Integer, primary_key=True)
+    sha256 = db.Column(db.String(64), unique=True, nullable=False)
+    size = db.Column(db.Integer, nullable=False)
+    ref_count = db.Column(db.Integer, nullable=False, default=0)
+    created_at = db.Column(db.DateTime, default=datetime.utcnow)
+
+    def __repr__(self):
+        return f'<StoredFile {self.sha256} x{self.ref_count}>'
+
 class PDFRequest(db.Model):
     """Model for user requests for PDF codes"""
     id = db.Column(db.Integer, primary_key=True)
@@ -75,6 +94,12 @@ class PDFRequest(db.Model):
     created_at = db.Column(db.DateTime, default=datetime.utcnow)
     updated_at = db.Column(db.DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
 
+    __table_args__ = (
+        # User dashboard request list and admin pending requests
+        db.Index('ix_pdf_request_user_created', 'user_id', 'created_at'),
+        db.Index('ix_pdf_request_status_created', 'status', 'created_at'),
+    )
+
     def __repr__(self):
         return f'<PDFRequest {self.title}>'
 
@@ -89,6 +114,14 @@ class Message(db.Model):
     created_at = db.Column(db.DateTime, default=datetime.utcnow)
     parent_message_id = db.Column(db.Integer, db.ForeignKey('message.id', ondelete='CASCADE'), nullable=True)
 
+    __table_args__ = (
+        # Unread counts, inbox/outbox listings and thread lookups
+        db.Index('ix_message_recipient_read', 'recipient_id', 'is_read'),
+        db.Index('ix_message_recipient_created', 'recipient_id', 'created_at'),
+        db.Index('ix_message_sender_created', 'sender_id', 'created_at'),
+        db.Index('ix_message_parent', 'parent_message_id'),
+    )
+
     # Self-referential relationship for message threads
     replies = db.relationship('Message', backref=db.backref('parent', remote_side=[id]), lazy=True)
 
@@ -106,10 +139,72 @@ class DownloadCode(db.Model):
     used = db.Column(db.Boolean, default=False)
     used_at = db.Column(db.DateTime, nullable=True)
 
+    __table_args__ = (
+        db.Index('ix_download_code_user', 'user_id'),
+    )
+
     def __repr__(self):
         return f'<DownloadCode {self.code}>'
 
-class BusinessSettings(db.Model):
+# Client-side settings keys and their values when no settings row exists
+SETTINGS_DEFAULTS = {
+    'businessName': '',
+    'businessAddress': '',
+    'businessPhone': '',
+    'businessEmail': '',
+    'businessLogoUrl': '',
+    'signatureUrl': '',
+    'taxRate': 0,
+    'currency': 'USD'
+}
+EMPTY_SETTINGS_JSON = json.dumps(SETTINGS_DEFAULTS, separators=(',', ':')).encode('utf-8')
+
+# Encoded settings per (table, row id), kept with the updated_at they were built from
+SETTINGS_JSON_CACHE_SIZE = 10000
+_settings_json_cache = {}
+
+class SettingsSerializerMixin:
+    """Shared serialization for BusinessSettings and UserBusinessSettings rows"""
+
+    def to_settings_dict(self):
+        return {
+            'businessName': self.business_name or '',
+            'businessAddress': self.business_address or '',
+            'businessPhone': self.business_phone or '',
+            'businessEmail': self.business_email or '',
+            'businessLogoUrl': self.business_logo_url or '',
+            'signatureUrl': self.signature_url or '',
+            'taxRate': self.tax_rate or 0,
+            'currency': self.currency or 'USD'
+        }
+
+    def settings_json(self):
+        """Encoded to_settings_dict(), rebuilt only when the row's updated_at changes"""
+        key = (self.__tablename__, self.id)
+        cached = _settings_json_cache.get(key)
+        if cached and cached[0] == self.updated_at:
+            return cached[1]
+
+        fragment = json.dumps(self.to_settings_dict(), separators=(',', ':')).encode('utf-8')
+        if self.id is not None:
+            if len(_settings_json_cache) >= SETTINGS_JSON_CACHE_SIZE:
+                _settings_json_cache.clear()
+            _settings_json_cache[key] = (self.updated_at, fragment)
+        return fragment
+
+def clear_settings_json_cache():
+    """Forget all encoded settings, e.g. after rows were rewritten in bulk"""
+    _settings_json_cache.clear()
+
+def settings_to_dict(settings):
+    """Settings dict for a settings row, or the defaults when there is none"""
+    return settings.to_settings_dict() if settings else dict(SETTINGS_DEFAULTS)
+
+def settings_to_json(settings):
+    """Encoded settings for a settings row, or the encoded defaults when there is none"""
+    return settings.settings_json() if settings else EMPTY_SETTINGS_JSON
+
+class BusinessSettings(SettingsSerializerMixin, db.Model):
     """Model for storing global business settings"""
     id = db.Column(db.Integer, primary_key=True)
     business_name = db.Column(db.String(200), nullable=True)
@@ -126,7 +221,7 @@ class BusinessSettings(db.Model):
     def __repr__(self):
         return f'<BusinessSettings {self.business_name}>'
 
-class UserBusinessSettings(db.Model):
+class UserBusinessSettings(SettingsSerializerMixin, db.Model):
     """Model for storing user-specific business settings"""
     id = db.Column(db.Integer, primary_key=True)
     user_id = db.Column(db.Integer, db.ForeignKey('user.id'), nullable=False)
@@ -141,6 +236,10 @@ class UserBusinessSettings(db.Model):
     created_at = db.Column(db.DateTime, default=datetime.utcnow)
     updated_at = db.Column(db.DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
 
+    __table_args__ = (
+        db.Index('ix_user_business_settings_user', 'user_id'),
+    )
+
     # Relationship
     user = db.relationship('User', backref='business_settings')
 
@@ -159,6 +258,11 @@ class ClientSettings(db.Model):
     created_at = db.Column(db.DateTime, default=datetime.utcnow)
     updated_at = db.Column(db.DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
 
+    __table_args__ = (
+        # Active clients for the current user
+        db.Index('ix_client_settings_user_active', 'user_id', 'is_active'),
+    )
+
     # Relationship
     user = db.relationship('User', backref='clients')
 
@@ -192,6 +296,12 @@ class ActivityLog(db.Model):
     user_agent = db.Column(db.Text, nullable=True)
     created_at = db.Column(db.DateTime, default=datetime.utcnow)
 
+    __table_args__ = (
+        # Per-user cleanup and the admin log, newest first
+        db.Index('ix_activity_log_user_created', 'user_id', 'created_at'),
+        db.Index('ix_activity_log_created_at', 'created_at'),
+    )
+
     # Relationship
     user = db.relationship('User', backref='activity_logs')
 
@@ -207,12 +317,62 @@ class GeneratedDocument(db.Model):
     file_path = db.Column(db.String(500), nullable=False)
     created_at = db.Column(db.DateTime, default=datetime.utcnow)
 
+    __table_args__ = (
+        db.Index('ix_generated_document_user_created', 'user_id', 'created_at'),
+        db.Index('ix_generated_document_created_at', 'created_at'),
+    )
+
     # Relationship
     user = db.relationship('User', backref='generated_documents')
 
     def __repr__(self):
         return f'<GeneratedDocument {self.document_title} - User {self.user_id}>'
 
+class RenderJob(db.Model):
+    """Model for batch rendering jobs, one RenderJobItem per document"""
+    id = db.Column(db.Integer, primary_key=True)
+    user_id = db.Column(db.Integer, db.ForeignKey('user.id'), nullable=False)
+    status = db.Column(db.String(20), default='queued')  # queued, running, completed, cancelled
+    total_items = db.Column(db.Integer, nullable=False, default=0)
+    completed_items = db.Column(db.Integer, nullable=False, default=0)
+    failed_items = db.Column(db.Integer, nullable=False, default=0)
+    created_at = db.Column(db.DateTime, default=datetime.utcnow)
+    started_at = db.Column(db.DateTime, nullable=True)
+    finished_at = db.Column(db.DateTime, nullable=True)
+
+    __table_args__ = (
+        db.Index('ix_render_job_user_created', 'user_id', 'created_at'),
+    )
+
+    # Relationships
+    user = db.relationship('User', backref='render_jobs')
+    items = db.relationship('RenderJobItem', backref='job', cascade='all, delete-orphan', order_by='RenderJobItem.position')
+
+    def __repr__(self):
+        return f'<RenderJob {self.id} - User {self.user_id}>'
+
+class RenderJobItem(db.Model):
+    """Model for one document of a RenderJob"""
+    id = db.Column(db.Integer, primary_key=True)
+    job_id = db.Column(db.Integer, db.ForeignKey('render_job.id', ondelete='CASCADE'), nullable=False)
+    position = db.Column(db.Integer, nullable=False)
+    document_data = db.Column(db.Text, nullable=False)  # JSON data for document
+    status = db.Column(db.String(20), default='pending')  # pending, running, done, failed, cancelled
+    file_path = db.Column(db.String(500), nullable=True)
+    error = db.Column(db.Text, nullable=True)
+    attempts = db.Column(db.Integer, nullable=False, default=0)
+    claimed_at = db.Column(db.DateTime, nullable=True)
+    finished_at = db.Column(db.DateTime, nullable=True)
+
+    __table_args__ = (
+        # Dispatcher: next pending items, and running items whose worker went away
+        db.Index('ix_render_job_item_status_claimed', 'status', 'claimed_at'),
+        db.Index('ix_render_job_item_job_position', 'job_id', 'position'),
+    )
+
+    def __repr__(self):
+        return f'<RenderJobItem {self.position} of RenderJob {self.job_id}>'
+
 class SystemSettings(db.Model):
     """Model for storing system settings"""
     id = db.Column(db.Integer, primary_key=True)
@@ -222,4 +382,15 @@ class SystemSettings(db.Model):
     updated_at = db.Column(db.DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
 
     def __repr__(self):
-        return f'<SystemSettings {self.setting_key}>'
\ No newline at end of file
+        return f'<SystemSettings {self.setting_key}>'
+
+
+def ensure_indexes():
+    """Create any model indexes missing from an existing database
+
+    db.create_all() only creates indexes together with new tables, so
+    databases created before an index was added need it built here.
+    """
+    for table in db.metadata.sorted_tables:
+        for index in table.indexes:
+            index.create(bind=db.engine, checkfirst=True)
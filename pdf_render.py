@@ -0,0 +1,801 @@
+import base64
+import logging
+import multiprocessing
+import os
+import re
+import sys
+import threading
+import unicodedata
+import zlib
+
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from datetime import date, datetime
+from functools import lru_cache
+
+MM = 72 / 25.4
+
+# Advance widths (1/1000 em) of the printable ASCII characters 32..126
+_HELVETICA_WIDTHS = [
+    278, 278, 355, 556, 556, 889, 667, 191, 333, 333, 389, 584, 278, 333, 278, 278,
+    556, 556, 556, 556, 556, 556, 556, 556, 556, 556, 278, 278, 584, 584, 584, 556,
+    1015, 667, 667, 722, 722, 667, 611, 778, 722, 278, 500, 667, 556, 833, 722, 778,
+    667, 778, 722, 667, 611, 722, 667, 944, 667, 667, 611, 278, 278, 278, 469, 556,
+    333, 556, 556, 500, 556, 556, 278, 556, 556, 222, 222, 500, 222, 833, 556, 556,
+    556, 556, 333, 500, 278, 556, 500, 722, 500, 500, 500, 334, 260, 334, 584,
+]
+_HELVETICA_BOLD_WIDTHS = [
+    278, 333, 474, 556, 556, 889, 722, 238, 333, 333, 389, 584, 278, 333, 278, 278,
+    556, 556, 556, 556, 556, 556, 556, 556, 556, 556, 333, 333, 584, 584, 584, 611,
+    975, 722, 722, 722, 722, 667, 611, 778, 722, 278, 556, 722, 611, 833, 722, 778,
+    667, 778, 722, 667, 611, 722, 667, 944, 667, 667, 611, 333, 278, 333, 584, 556,
+    333, 556, 611, 556, 611, 556, 333, 611, 611, 278, 278, 556, 278, 889, 611, 611,
+    611, 611, 389, 556, 333, 611, 556, 778, 556, 556, 500, 389, 280, 389, 584,
+]
+
+# Font resource name and PDF base font per style
+FONTS = {
+    'normal': ('F1', 'Helvetica', _HELVETICA_WIDTHS),
+    'bold': ('F2', 'Helvetica-Bold', _HELVETICA_BOLD_WIDTHS),
+    'italic': ('F3', 'Helvetica-Oblique', _HELVETICA_WIDTHS),
+}
+
+
+def _char_width(char, widths):
+    code = ord(char)
+    if 32 <= code <= 126:
+        return widths[code - 32]
+    # Accented letters are as wide as their base letter; anything else gets an average width
+    base = unicodedata.normalize('NFKD', char)[:1]
+    if base and 32 <= ord(base) <= 126:
+        return widths[ord(base) - 32]
+    return 556
+
+
+@lru_cache(maxsize=8192)
+def text_width(text, style, size):
+    """Width of text in mm"""
+    widths = FONTS[style][2]
+    return sum(_char_width(char, widths) for char in text) * size / 1000 / MM
+
+
+def wrap_text(text, style, size, max_width):
+    """Split text into lines no wider than max_width, like jsPDF's splitTextToSize"""
+    lines = []
+    for paragraph in str(text).split('\n'):
+        line = ''
+        for word in paragraph.split(' '):
+            candidate = f'{line} {word}' if line else word
+            if text_width(candidate, style, size) <= max_width:
+                line = candidate
+                continue
+            if line:
+                lines.append(line)
+            # Break words that are wider than a whole line
+            while text_width(word, style, size) > max_width and len(word) > 1:
+                cut = len(word) - 1
+                while cut > 1 and text_width(word[:cut], style, size) > max_width:
+                    cut -= 1
+                lines.append(word[:cut])
+                word = word[cut:]
+            line = word
+        lines.append(line)
+    return lines
+
+
+class UnsupportedDocument(ValueError):
+    """Raised for documents this renderer cannot show faithfully; the browser renderer can"""
+
+
+def _pdf_string(text):
+    try:
+        data = str(text).encode('cp1252')
+    except UnicodeEncodeError as e:
+        # The standard fonts only cover Windows-1252; anything else would come out as '?'
+        raise UnsupportedDocument(f'Text contains characters the standard PDF fonts cannot show: {e.object[e.start:e.end]!r}')
+    return b'(' + data.replace(b'\\', b'\\\\').replace(b'(', b'\\(').replace(b')', b'\\)').replace(b'\r', b'\\r') + b')'
+
+
+def _info_string(text):
+    return b'<' + ('\ufeff' + str(text)).encode('utf-16-be').hex().upper().encode() + b'>'
+
+
+def _num(value):
+    return (b'%.3f' % value).rstrip(b'0').rstrip(b'.') or b'0'
+
+
+def jpeg_info(data):
+    """(width, height, components) of a baseline or progressive JPEG, or None"""
+    if data[:2] != b'\xff\xd8':
+        return None
+    i = 2
+    while i + 9 < len(data):
+        if data[i] != 0xFF:
+            return None
+        marker = data[i + 1]
+        length = int.from_bytes(data[i + 2:i + 4], 'big')
+        if marker in (0xC0, 0xC1, 0xC2):
+            height = int.from_bytes(data[i + 5:i + 7], 'big')
+            width = int.from_bytes(data[i + 7:i + 9], 'big')
+            return width, height, data[i + 9]
+        i += 2 + length
+    return None
+
+
+# Channels per PNG color type: gray, RGB, palette, gray + alpha, RGBA
+_PNG_CHANNELS = {0: 1, 2: 3, 3: 1, 4: 2, 6: 4}
+# Larger images are not decoded
+PNG_MAX_PIXELS = 16 * 1024 * 1024
+
+
+def _png_unfilter(raw, stride, height, bpp):
+    """Undo the per-row filters of PNG image data; stride is the bytes per row"""
+    pixels = bytearray(height * stride)
+    previous = bytearray(stride)
+    position = 0
+    for row in range(height):
+        filter_type = raw[position]
+        line = bytearray(raw[position + 1:position + 1 + stride])
+        position += 1 + stride
+        if filter_type == 1:
+            for i in range(bpp, stride):
+                line[i] = (line[i] + line[i - bpp]) & 0xFF
+        elif filter_type == 2:
+            line = bytearray((a + b) & 0xFF for a, b in zip(line, previous))
+        elif filter_type == 3:
+            for i in range(stride):
+                left = line[i - bpp] if i >= bpp else 0
+                line[i] = (line[i] + ((left + previous[i]) >> 1)) & 0xFF
+        elif filter_type == 4:
+            for i in range(stride):
+                left = line[i - bpp] if i >= bpp else 0
+                up = previous[i]
+                up_left = previous[i - bpp] if i >= bpp else 0
+                estimate = left + up - up_left
+                distance_left, distance_up, distance_up_left = abs(estimate - left), abs(estimate - up), abs(estimate - up_left)
+                if distance_left <= distance_up and distance_left <= distance_up_left:
+                    predictor = left
+                elif distance_up <= distance_up_left:
+                    predictor = up
+                else:
+                    predictor = up_left
+                line[i] = (line[i] + predictor) & 0xFF
+        elif filter_type != 0:
+            raise ValueError(f'Unknown PNG filter {filter_type}')
+        pixels[row * stride:(row + 1) * stride] = line
+        previous = line
+    return bytes(pixels)
+
+
+def _unpack_samples(pixels, stride, width, height, bit_depth):
+    """Spread 1, 2 or 4-bit samples out to one byte each"""
+    per_byte = 8 // bit_depth
+    mask = (1 << bit_depth) - 1
+    table = [bytes((byte >> (8 - bit_depth * (i + 1))) & mask for i in range(per_byte)) for byte in range(256)]
+    return b''.join(
+        b''.join(table[byte] for byte in pixels[row * stride:(row + 1) * stride])[:width]
+        for row in range(height)
+    )
+
+
+@lru_cache(maxsize=16)
+def png_image(data):
+    """A PNG as PDF image parts, or None if it cannot be used
+
+    Returns (dictionary entries, stream, soft mask) where the soft mask is
+    None or (dictionary entries, stream) for the alpha channel. 8-bit images
+    without transparency keep their compressed data, which PDF reads with the
+    PNG predictors; the others are unfiltered once, and transparent ones have
+    their alpha channel split off. Memoized, since the same logo shows up in
+    every document of a business.
+    """
+    if data[:8] != b'\x89PNG\r\n\x1a\n':
+        return None
+    position = 8
+    header = None
+    palette = b''
+    transparency = None
+    idat = []
+    while position + 8 <= len(data):
+        length = int.from_bytes(data[position:position + 4], 'big')
+        chunk_type = data[position + 4:position + 8]
+        body = data[position + 8:position + 8 + length]
+        position += 12 + length
+        if chunk_type == b'IHDR':
+            header = body
+        elif chunk_type == b'PLTE':
+            palette = body
+        elif chunk_type == b'tRNS':
+            transparency = body
+        elif chunk_type == b'IDAT':
+            idat.append(body)
+        elif chunk_type == b'IEND':
+            break
+    if header is None or len(header) < 13 or not idat:
+        return None
+
+    width = int.from_bytes(header[0:4], 'big')
+    height = int.from_bytes(header[4:8], 'big')
+    bit_depth, color_type, interlace = header[8], header[9], header[12]
+    channels = _PNG_CHANNELS.get(color_type)
+    if channels is None or interlace or bit_depth > 8 or not 0 < width * height <= PNG_MAX_PIXELS:
+        return None
+    if color_type == 3:
+        if not palette:
+            return None
+        color_space = b'[/Indexed /DeviceRGB %d <%s>]' % (len(palette) // 3 - 1, palette.hex().encode())
+    else:
+        color_space = b'/DeviceGray' if color_type in (0, 4) else b'/DeviceRGB'
+    compressed = b''.join(idat)
+
+    has_alpha = color_type in (4, 6) or (color_type == 3 and transparency)
+    if not has_alpha and bit_depth == 8:
+        # tRNS on gray and RGB images (a single transparent color) is ignored
+        colors = 3 if color_type == 2 else 1
+        entries = b'/Width %d /Height %d /ColorSpace %s /BitsPerComponent 8 /Filter /FlateDecode ' \
+                  b'/DecodeParms << /Predictor 15 /Colors %d /BitsPerComponent 8 /Columns %d >>' % (
+                      width, height, color_space, colors, width)
+        return entries, compressed, None
+
+    stride = (width * channels * bit_depth + 7) // 8
+    try:
+        pixels = _png_unfilter(zlib.decompress(compressed), stride, height, max(1, channels * bit_depth // 8))
+    except (zlib.error, ValueError, IndexError):
+        return None
+
+    if not has_alpha:
+        # 1, 2 and 4-bit gray or palette images: PDF rows are packed the same way
+        entries = b'/Width %d /Height %d /ColorSpace %s /BitsPerComponent %d /Filter /FlateDecode' % (
+            width, height, color_space, bit_depth)
+        return entries, zlib.compress(pixels, 6), None
+    if bit_depth < 8:
+        pixels = _unpack_samples(pixels, stride, width, height, bit_depth)
+
+    if color_type == 3:
+        color = pixels
+        alpha = pixels.translate(transparency[:256] + b'\xff' * (256 - len(transparency[:256])))
+    else:
+        color_channels = channels - 1
+        color = bytearray(width * height * color_channels)
+        for channel in range(color_channels):
+            color[channel::color_channels] = pixels[channel::channels]
+        alpha = pixels[channels - 1::channels]
+
+    entries = b'/Width %d /Height %d /ColorSpace %s /BitsPerComponent 8 /Filter /FlateDecode' % (width, height, color_space)
+    mask_entries = b'/Width %d /Height %d /ColorSpace /DeviceGray /BitsPerComponent 8 /Filter /FlateDecode' % (width, height)
+    return entries, zlib.compress(bytes(color), 6), (mask_entries, zlib.compress(alpha, 6))
+
+
+class PDFPage:
+    """Drawing operations for one page, in mm measured from the top left"""
+
+    def __init__(self, document):
+        self.document = document
+        self.ops = []
+
+    def _y(self, y):
+        return (self.document.height - y) * MM
+
+    def text(self, x, y, text, style='normal', size=10, gray=0):
+        font = FONTS[style][0].encode()
+        self.ops.append(b'BT /%s %s Tf %s g %s %s Td %s Tj ET' % (
+            font, _num(size), _num(gray), _num(x * MM), _num(self._y(y)), _pdf_string(text)))
+
+    def line(self, x1, y1, x2, y2, width=0.2, gray=0):
+        self.ops.append(b'%s w %s G %s %s m %s %s l S' % (
+            _num(width * MM), _num(gray), _num(x1 * MM), _num(self._y(y1)), _num(x2 * MM), _num(self._y(y2))))
+
+    def rect(self, x, y, w, h, width=0.2, stroke=0, fill=None):
+        box = b'%s %s %s %s re' % (_num(x * MM), _num(self._y(y + h)), _num(w * MM), _num(h * MM))
+        if fill is not None:
+            self.ops.append(b'%s g %s f' % (_num(fill), box))
+        if stroke is not None:
+            self.ops.append(b'%s w %s G %s S' % (_num(width * MM), _num(stroke), box))
+
+    def image(self, name, x, y, w, h):
+        self.ops.append(b'q %s 0 0 %s %s %s cm /%s Do Q' % (
+            _num(w * MM), _num(h * MM), _num(x * MM), _num(self._y(y + h)), name.encode()))
+
+
+class PDFDocument:
+    """Minimal PDF writer: pages of text, lines, rectangles and JPEG or PNG images"""
+
+    def __init__(self, width=210, height=297):
+        self.width = width
+        self.height = height
+        self.pages = []
+        self.images = {}
+        self.info = {}
+
+    def add_page(self):
+        page = PDFPage(self)
+        self.pages.append(page)
+        return page
+
+    def add_image(self, data):
+        """Register a JPEG or PNG and return its resource name, or None if it cannot be used"""
+        info = jpeg_info(data)
+        if info:
+            width, height, components = info
+            color_space = {1: b'/DeviceGray', 4: b'/DeviceCMYK'}.get(components, b'/DeviceRGB')
+            image = (b'/Width %d /Height %d /ColorSpace %s /BitsPerComponent 8 /Filter /DCTDecode' % (width, height, color_space), data, None)
+        else:
+            image = png_image(data)
+        if not image:
+            return None
+        name = f'Im{len(self.images) + 1}'
+        self.images[name] = image
+        return name
+
+    def to_bytes(self):
+        objects = []
+
+        def add(body):
+            objects.append(body)
+            return len(objects)
+
+        font_refs = {}
+        for style, (resource, base_font, _) in FONTS.items():
+            font_refs[resource] = add(b'<< /Type /Font /Subtype /Type1 /BaseFont /%s /Encoding /WinAnsiEncoding >>' % base_font.encode())
+
+        image_refs = {}
+        for name, (entries, stream, soft_mask) in self.images.items():
+            if soft_mask:
+                mask_entries, mask_stream = soft_mask
+                mask_ref = add(b'<< /Type /XObject /Subtype /Image %s /Length %d >>\nstream\n' % (mask_entries, len(mask_stream))
+                               + mask_stream + b'\nendstream')
+                entries += b' /SMask %d 0 R' % mask_ref
+            image_refs[name] = add(
+                b'<< /Type /XObject /Subtype /Image %s /Length %d >>\nstream\n' % (entries, len(stream)) + stream + b'\nendstream'
+            )
+
+        resources = b'<< /Font << %s >> /XObject << %s >> >>' % (
+            b' '.join(b'/%s %d 0 R' % (name.encode(), ref) for name, ref in font_refs.items()),
+            b' '.join(b'/%s %d 0 R' % (name.encode(), ref) for name, ref in image_refs.items()),
+        )
+        resources_ref = add(resources)
+
+        pages_ref = len(objects) + 1 + 2 * len(self.pages)
+        page_refs = []
+        for page in self.pages:
+            content = zlib.compress(b'\n'.join(page.ops), 6)
+            content_ref = add(b'<< /Length %d /Filter /FlateDecode >>\nstream\n' % len(content) + content + b'\nendstream')
+            page_refs.append(add(
+                b'<< /Type /Page /Parent %d 0 R /MediaBox [0 0 %s %s] /Resources %d 0 R /Contents %d 0 R >>' % (
+                    pages_ref, _num(self.width * MM), _num(self.height * MM), resources_ref, content_ref)
+            ))
+        add(b'<< /Type /Pages /Kids [%s] /Count %d >>' % (b' '.join(b'%d 0 R' % ref for ref in page_refs), len(page_refs)))
+        catalog_ref = add(b'<< /Type /Catalog /Pages %d 0 R >>' % pages_ref)
+        info_ref = add(b'<< %s >>' % b' '.join(b'/%s %s' % (key.encode(), _info_string(value)) for key, value in self.info.items()))
+
+        output = bytearray(b'%PDF-1.4\n%\xe2\xe3\xcf\xd3\n')
+        offsets = []
+        for number, body in enumerate(objects, 1):
+            offsets.append(len(output))
+            output += b'%d 0 obj\n' % number + body + b'\nendobj\n'
+        xref = len(output)
+        output += b'xref\n0 %d\n0000000000 65535 f \n' % (len(objects) + 1)
+        output += b''.join(b'%010d 00000 n \n' % offset for offset in offsets)
+        output += b'trailer\n<< /Size %d /Root %d 0 R /Info %d 0 R >>\nstartxref\n%d\n%%%%EOF\n' % (
+            len(objects) + 1, catalog_ref, info_ref, xref)
+        return bytes(output)
+
+
+def parse_float(value):
+    """Number parsing with JavaScript parseFloat(value) || 0 semantics"""
+    if isinstance(value, bool):
+        return 0.0
+    if isinstance(value, (int, float)):
+        return float(value) if value == value else 0.0
+    match = re.match(r'\s*[+-]?(\d+\.?\d*|\.\d+)([eE][+-]?\d+)?', str(value or ''))
+    return float(match.group(0)) if match else 0.0
+
+
+def _js_number(value):
+    """A number as JavaScript's toString() would print it"""
+    if isinstance(value, str):
+        return value
+    value = float(value)
+    return str(int(value)) if value.is_integer() else repr(value)
+
+
+# Symbols Intl.NumberFormat('en-US') uses for the currencies the app offers
+CURRENCY_SYMBOLS = {'USD': '$', 'EUR': '€', 'GBP': '£', 'JPY': '¥', 'CAD': 'CA$', 'AUD': 'A$', 'CNY': 'CN¥', 'INR': '₹'}
+
+
+def format_currency(amount, currency='USD'):
+    amount = parse_float(amount)
+    symbol = CURRENCY_SYMBOLS.get(currency, f'{currency} ')
+    try:
+        symbol.encode('cp1252')
+    except UnicodeEncodeError:
+        # Not in the standard fonts' character set
+        symbol = f'{currency} '
+    return f"{'-' if amount < 0 else ''}{symbol}{abs(amount):,.2f}"
+
+
+def format_date(value):
+    """'2025-07-03' -> 'Jul 3, 2025', leaving anything unparseable as is"""
+    try:
+        parsed = date.fromisoformat(str(value)[:10])
+    except ValueError:
+        return str(value or '')
+    return f"{parsed.strftime('%b')} {parsed.day}, {parsed.year}"
+
+
+def load_image(url, static_root):
+    """Image bytes for a data: URL or a file under /static/, else None
+
+    Other URLs are not fetched: the server must not make requests to
+    addresses taken from user input.
+    """
+    if not url:
+        return None
+    if url.startswith('data:image/'):
+        try:
+            return base64.b64decode(url.split(',', 1)[1])
+        except (ValueError, IndexError):
+            return None
+    if url.startswith('/static/') and static_root:
+        path = os.path.normpath(os.path.join(static_root, url[len('/static/'):]))
+        if path.startswith(os.path.abspath(static_root) + os.sep) and os.path.isfile(path):
+            with open(path, 'rb') as f:
+                return f.read()
+    return None
+
+
+class DocumentLayout:
+    """Lays out a document the way MinimalPDFGenerator in pdf-generator.js does
+
+    Uses the same positions, fonts and sizes, and adds page breaks (with the
+    table header repeated) where the browser version would run off the page.
+    """
+
+    margin = 20
+    line_height = 6
+    font_size = {'title': 18, 'subtitle': 14, 'normal': 10, 'small': 8}
+    # Content may not run into the footer area at the bottom of the page
+    content_bottom = 297 - 50
+
+    def __init__(self, static_root=None):
+        self.static_root = static_root
+        self.pdf = PDFDocument()
+        self.page_width = self.pdf.width
+        self.page_height = self.pdf.height
+        self.page = self.pdf.add_page()
+        self.y = self.margin
+
+    def new_page(self):
+        self.page = self.pdf.add_page()
+        self.y = self.margin
+
+    def ensure_space(self, height):
+        """Start a new page unless height mm still fit above the footer area"""
+        if self.y + height > self.content_bottom:
+            self.new_page()
+            return True
+        return False
+
+    def add_image(self, url, label):
+        """Register the image at url, logging it when it has to be left out"""
+        if not url:
+            return None
+        data = load_image(url, self.static_root)
+        if not data:
+            logging.warning(f"Leaving the {label} out of the PDF: only data: URLs and files under /static/ are read")
+            return None
+        name = self.pdf.add_image(data)
+        if not name:
+            logging.warning(f"Leaving the {label} out of the PDF: only JPEG and non-interlaced PNG images up to 8 bits per channel are supported")
+        return name
+
+    def text_lines(self, lines, x, style, size, step):
+        for line in lines:
+            self.ensure_space(step)
+            self.page.text(x, self.y, line, style, size)
+            self.y += step
+
+    def add_header(self, business):
+        start_y = self.y
+        content_width = self.page_width - 2 * self.margin
+        logo_added = False
+
+        name = self.add_image(business.get('businessLogoUrl'), 'logo')
+        if name:
+            size = 25
+            x = self.page_width - self.margin - size
+            self.page.rect(x - 2, self.y - 2, size + 4, size + 4, width=0.5, stroke=200 / 255)
+            self.page.image(name, x, self.y, size, size)
+            logo_added = True
+            content_width -= 30
+
+        if business.get('businessName'):
+            for line in wrap_text(business['businessName'], 'bold', self.font_size['title'], content_width):
+                self.page.text(self.margin, self.y, line, 'bold', self.font_size['title'])
+                self.y += 8
+            self.y += 2
+
+        small = self.font_size['small']
+        if business.get('businessAddress'):
+            self.text_lines(wrap_text(business['businessAddress'], 'normal', small, content_width), self.margin, 'normal', small, 5)
+
+        contact = []
+        if business.get('businessPhone'):
+            contact.append('Phone: ' + str(business['businessPhone']))
+        if business.get('businessEmail'):
+            contact.append('Email: ' + str(business['businessEmail']))
+        if contact:
+            self.text_lines(wrap_text(' | '.join(contact), 'normal', small, content_width), self.margin, 'normal', small, 5)
+            self.y += 3
+
+        if logo_added:
+            self.y = max(self.y, start_y + 30)
+
+        self.page.line(self.margin, self.y, self.page_width - self.margin, self.y, width=1)
+        self.y += 15
+
+    def add_document_section(self, data):
+        size = self.font_size['subtitle']
+        doc_type = str(data.get('type') or '')
+        self.page.text(self.margin, self.y, doc_type.replace('_', ' ', 1).upper(), 'bold', size)
+        number = f"# {data.get('number', '')}"
+        self.page.text(self.page_width - self.margin - text_width(number, 'bold', size), self.y, number, 'bold', size)
+        self.y += 10
+
+        self.page.text(self.margin, self.y, 'Date: ' + format_date(data.get('date')), 'normal', self.font_size['normal'])
+        self.y += 15
+
+    def add_client_section(self, data):
+        client = data.get('client') or {}
+        name = data.get('clientName') or client.get('name') or ''
+        address = data.get('clientAddress') or client.get('address') or ''
+        phone = data.get('clientPhone') or client.get('phone') or ''
+        email = data.get('clientEmail') or client.get('email') or ''
+        normal, small = self.font_size['normal'], self.font_size['small']
+
+        self.ensure_space(30)
+        self.page.text(self.margin, self.y, 'BILL TO:', 'bold', normal)
+        self.y += 8
+
+        if name:
+            self.page.text(self.margin, self.y, str(name), 'bold', normal)
+            self.y += 6
+        if address:
+            self.text_lines(wrap_text(address, 'normal', small, self.page_width - 2 * self.margin), self.margin, 'normal', small, 5)
+        if phone:
+            self.text_lines(['Phone: ' + str(phone)], self.margin, 'normal', small, 5)
+        if email:
+            self.text_lines(['Email: ' + str(email)], self.margin, 'normal', small, 5)
+
+        if not (name or address or phone or email):
+            self.page.text(self.margin, self.y, 'No client information provided', 'italic', small, gray=128 / 255)
+            self.y += 6
+
+        self.y += 10
+
+    def _table_header(self, columns, x, width):
+        header_height = 10
+        self.page.rect(x, self.y, width, header_height, width=0.5, stroke=0, fill=240 / 255)
+        for column in columns:
+            self._cell(column, column['name'], self.y + 7, 'bold')
+        for column in columns[1:]:
+            self.page.line(column['x'], self.y, column['x'], self.y + header_height, width=0.5)
+        self.y += header_height
+
+    def _cell(self, column, text, baseline, style='normal'):
+        size = self.font_size['normal']
+        if column['align'] == 'center':
+            x = column['x'] + column['width'] / 2 - text_width(text, style, size) / 2
+        elif column['align'] == 'right':
+            x = column['x'] + column['width'] - 2 - text_width(text, style, size)
+        else:
+            x = column['x'] + 2
+        self.page.text(x, baseline, text, style, size)
+
+    def add_items_table(self, items, currency='USD'):
+        normal = self.font_size['normal']
+        if not items:
+            self.page.text(self.margin, self.y, 'No items added', 'normal', normal)
+            self.y += 15
+            return
+
+        x = self.margin
+        width = self.page_width - 2 * self.margin
+        row_height = 8
+        columns = []
+        for name, share, align in (('DESCRIPTION', 0.48, 'left'), ('QTY', 0.12, 'center'), ('UNIT PRICE', 0.20, 'right'), ('AMOUNT', 0.20, 'right')):
+            columns.append({'name': name, 'x': x, 'width': width * share, 'align': align})
+            x += width * share
+
+        self.ensure_space(10 + row_height)
+        self._table_header(columns, self.margin, width)
+
+        for item in items:
+            if self.ensure_space(row_height):
+                # Repeat the header on every page the table continues on
+                self._table_header(columns, self.margin, width)
+
+            price = parse_float(item.get('price'))
+            quantity = parse_float(item.get('quantity'))
+            description = str(item.get('description') or 'No description')
+            max_width = columns[0]['width'] - 4
+            if text_width(description, 'normal', normal) > max_width:
+                while description and text_width(description + '...', 'normal', normal) > max_width:
+                    description = description[:-1]
+                description += '...'
+
+            self.page.rect(self.margin, self.y, width, row_height, width=0.2, stroke=0)
+            for column in columns[1:]:
+                self.page.line(column['x'], self.y, column['x'], self.y + row_height, width=0.2)
+            values = [description, _js_number(quantity), format_currency(price, currency), format_currency(price * quantity, currency)]
+            for column, value in zip(columns, values):
+                self._cell(column, value, self.y + 6)
+            self.y += row_height
+
+        self.y += 10
+
+    def add_totals(self, totals, currency='USD'):
+        self.ensure_space(30)
+        normal = self.font_size['normal']
+        totals_width = 60
+        x = self.page_width - self.margin - totals_width
+
+        def row(label, amount, style='normal'):
+            text = format_currency(amount, currency)
+            self.page.text(x, self.y, label, style, normal)
+            self.page.text(x + totals_width - text_width(text, style, normal), self.y, text, style, normal)
+
+        subtotal = parse_float(totals.get('subtotal'))
+        row('Subtotal:', subtotal)
+        self.y += 6
+
+        tax_rate = totals.get('taxRate')
+        if parse_float(tax_rate) > 0:
+            row(f'Tax ({_js_number(tax_rate)}%):', subtotal * parse_float(tax_rate) / 100)
+            self.y += 6
+
+        self.page.line(x, self.y + 1, x + totals_width, self.y + 1, width=0.5)
+        self.y += 6
+
+        grand_total = parse_float(totals.get('grandTotal')) or subtotal + subtotal * parse_float(tax_rate) / 100
+        row('TOTAL:', grand_total, 'bold')
+        self.y += 15
+
+    def add_footer(self, notes, business):
+        normal, small = self.font_size['normal'], self.font_size['small']
+        if notes and str(notes).strip():
+            self.ensure_space(20)
+            self.page.text(self.margin, self.y, 'NOTES:', 'bold', normal)
+            self.y += 8
+            self.text_lines(wrap_text(notes, 'normal', small, self.page_width - 2 * self.margin), self.margin, 'normal', small, 5)
+            self.y += 10
+
+        footer_y = self.page_height - 40
+        if self.y > footer_y - 5:
+            self.new_page()
+
+        signature_added = False
+        name = self.add_image(business.get('signatureUrl'), 'signature')
+        if name:
+            width, height = 30, 15
+            x = self.page_width - self.margin - width
+            y = footer_y - 5
+            self.page.rect(x - 1, y - 1, width + 2, height + 2, width=0.3, stroke=220 / 255)
+            self.page.image(name, x, y, width, height)
+            self.page.text(x, y + height + 5, 'Authorized Signature', 'normal', small)
+            signature_added = True
+
+        thank_you = 'Thank you for your business!'
+        x = self.margin if signature_added else (self.page_width - text_width(thank_you, 'normal', normal)) / 2
+        self.page.text(x, footer_y + 10, thank_you, 'normal', normal)
+
+    def add_page_footers(self, generated_by, generated_on):
+        small = self.font_size['small']
+        count = len(self.pdf.pages)
+        for number, page in enumerate(self.pdf.pages, 1):
+            page.text(self.page_width - 25, self.page_height - 10, f'Page {number} of {count}', 'normal', small)
+            page.text(20, self.page_height - 10, f'Generated on {generated_on} by {generated_by}', 'normal', small)
+
+
+def render_document(data, generated_by='Unknown User', generated_on=None, static_root=None):
+    """Render a document JSON (as built by the document form) to PDF bytes
+
+    Only the standard Helvetica fonts are used, so nothing is embedded; their
+    metrics are module-level tables and text widths are memoized per process.
+    Text outside Windows-1252 (Greek, Cyrillic, CJK, ...) raises
+    UnsupportedDocument rather than being garbled.
+    """
+    if not isinstance(data, dict):
+        raise ValueError('Document data must be an object')
+    business = data.get('business') or {}
+    currency = business.get('currency') or 'USD'
+    generated_on = generated_on or datetime.now()
+
+    layout = DocumentLayout(static_root)
+    layout.pdf.info = {
+        'Title': f"{data.get('type', '')} {data.get('number', '')}",
+        'Subject': str(data.get('type', '')),
+        'Author': business.get('businessName') or 'Business Documents Generator',
+        'Creator': 'Minimal PDF Generator',
+    }
+    layout.add_header(business)
+    layout.add_document_section(data)
+    layout.add_client_section(data)
+    layout.add_items_table(data.get('items') or [], currency)
+    layout.add_totals(data.get('totals') or {}, currency)
+    layout.add_footer(data.get('notes') or '', business)
+    layout.add_page_footers(generated_by, f'{generated_on.month}/{generated_on.day}/{generated_on.year}')
+    return layout.pdf.to_bytes()
+
+
+def render_to_file(data, path, generated_by='Unknown User', generated_on=None, static_root=None):
+    """Render a document and write it atomically to path; returns the size in bytes"""
+    pdf = render_document(data, generated_by, generated_on, static_root)
+    os.makedirs(os.path.dirname(path) or '.', exist_ok=True)
+    temp_path = f'{path}.{os.getpid()}.tmp'
+    with open(temp_path, 'wb') as f:
+        f.write(pdf)
+    os.replace(temp_path, path)
+    return len(pdf)
+
+
+class RenderPoolBusy(Exception):
+    """Raised when the render queue is full"""
+
+
+class RenderPool:
+    """A bounded pool of rendering workers
+
+    At most max_workers documents render at once and at most max_pending may
+    be queued or running; beyond that submit() raises RenderPoolBusy instead
+    of letting the backlog grow. On POSIX the workers are processes started
+    by a forkserver, so rendering never holds the web worker's GIL. Forking
+    the web worker itself is unsafe, since its background threads may hold
+    locks (logging, sqlite3) at the moment of the fork; the forkserver is a
+    fresh single-threaded process that has imported only this module. The
+    workers are reused, so their text width caches stay warm. Where no
+    forkserver is available (Windows, packaged executables) every worker
+    would have to re-run the whole app, so threads are used instead.
+    """
+
+    def __init__(self, max_workers=2, max_pending=8):
+        self.max_workers = max_workers
+        self.max_pending = max_pending
+        self._slots = threading.BoundedSemaphore(max_pending)
+        self._lock = threading.Lock()
+        self._executor = None
+
+    def _get_executor(self):
+        with self._lock:
+            if self._executor is None:
+                if 'forkserver' in multiprocessing.get_all_start_methods() and not getattr(sys, 'frozen', False):
+                    context = multiprocessing.get_context('forkserver')
+                    # Only this module, not the app in __main__
+                    context.set_forkserver_preload([__name__])
+                    self._executor = ProcessPoolExecutor(self.max_workers, mp_context=context)
+                else:
+                    self._executor = ThreadPoolExecutor(self.max_workers, thread_name_prefix='pdf-render')
+            return self._executor
+
+    def submit(self, fn, *args, **kwargs):
+        if not self._slots.acquire(blocking=False):
+            raise RenderPoolBusy('Too many documents are being rendered, try again shortly')
+        try:
+            try:
+                future = self._get_executor().submit(fn, *args, **kwargs)
+            except BrokenProcessPool:
+                # A worker died (e.g. killed for memory); start a fresh pool
+                with self._lock:
+                    self._executor = None
+                future = self._get_executor().submit(fn, *args, **kwargs)
+        except Exception:
+            self._slots.release()
+            raise
+        future.add_done_callback(lambda _: self._slots.release())
+        return future
+
+    def shutdown(self):
+        with self._lock:
+            if self._executor is not None:
+                self._executor.shutdown(wait=False, cancel_futures=True)
+                self._executor = None
@@ -0,0 +1,197 @@
+import hashlib
+import json
+import os
+import secrets
+import shutil
+import threading
+import time
+
+from concurrent.futures import Future
+
+# Bump when the PDF layout changes so earlier renders are not served
+RENDER_CACHE_VERSION = 1
+
+
+def normalize_document(value):
+    """Drop empty values from a document payload; the renderer treats them as missing"""
+    if isinstance(value, dict):
+        return {key: normalize_document(item) for key, item in value.items() if item is not None and item != ''}
+    if isinstance(value, list):
+        return [normalize_document(item) for item in value]
+    return value
+
+
+def render_cache_key(data, generated_by, generated_on, settings_version=''):
+    """Hash of everything that ends up in a rendered PDF
+
+    The footer shows the day and the user, so both are part of the key.
+    """
+    payload = json.dumps(
+        [RENDER_CACHE_VERSION, normalize_document(data), generated_by, generated_on.strftime('%Y-%m-%d'), settings_version],
+        sort_keys=True, separators=(',', ':'), ensure_ascii=False, default=str
+    )
+    return hashlib.sha256(payload.encode('utf-8')).hexdigest()
+
+
+def _link_or_copy(source, target):
+    """Hard link or copy source to target, raising FileExistsError if target exists"""
+    try:
+        os.link(source, target)
+    except FileExistsError:
+        raise
+    except OSError:
+        with open(source, 'rb') as src, open(target, 'xb') as dst:
+            shutil.copyfileobj(src, dst)
+
+
+class RenderCache:
+    """Rendered PDFs on disk, keyed by render_cache_key(), with LRU eviction
+
+    Entries live at <root>/<aa>/<key>.pdf. A hit bumps the entry's mtime, and
+    once the cache grows past max_bytes the least recently used entries are
+    removed until it is back under 90%. Entries are hard links to rendered
+    files where the filesystem allows, so caching costs no copy. The size is
+    tracked per process and re-read from disk at least every rescan_interval
+    seconds, since other workers add entries too.
+    """
+
+    def __init__(self, root, max_bytes=256 * 1024 * 1024, rescan_interval=60):
+        self.root = root
+        self.max_bytes = max_bytes
+        self.rescan_interval = rescan_interval
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._bytes = None
+        self._last_scan = 0
+        self._lock = threading.Lock()
+
+    @property
+    def enabled(self):
+        return self.max_bytes > 0
+
+    def path_for(self, key):
+        return os.path.join(self.root, key[:2], f'{key}.pdf')
+
+    def get(self, key):
+        """Path of a cached PDF, or None on a miss"""
+        path = self.path_for(key)
+        try:
+            os.utime(path)
+        except FileNotFoundError:
+            with self._lock:
+                self.misses += 1
+            return None
+        with self._lock:
+            self.hits += 1
+        return path
+
+    def put(self, key, source):
+        """Add a rendered file to the cache"""
+        path = self.path_for(key)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        while True:
+            temp_path = os.path.join(os.path.dirname(path), f'{secrets.token_hex(8)}.tmp')
+            try:
+                _link_or_copy(source, temp_path)
+                break
+            except FileExistsError:
+                continue
+        os.replace(temp_path, path)
+        if os.path.exists(temp_path):
+            # rename() does nothing when both names already link to the same file
+            os.remove(temp_path)
+
+        with self._lock:
+            if self._bytes is not None:
+                self._bytes += os.path.getsize(path)
+            due = self._bytes is None or self._bytes > self.max_bytes or time.monotonic() - self._last_scan > self.rescan_interval
+        if due:
+            self.evict()
+
+    def render(self, pool, key, path, fn, *args):
+        """Write the PDF for key to path, from the cache or by rendering it on pool
+
+        Returns a future resolving to the file size either way; renders are
+        added to the cache when they finish.
+        """
+        if self.enabled:
+            cached = self.get(key)
+            if cached:
+                future = Future()
+                try:
+                    os.makedirs(os.path.dirname(path) or '.', exist_ok=True)
+                    if os.path.exists(path):
+                        os.remove(path)
+                    _link_or_copy(cached, path)
+                    future.set_result(os.path.getsize(path))
+                except OSError as e:
+                    future.set_exception(e)
+                return future
+
+        future = pool.submit(fn, *args)
+        if self.enabled:
+            future.add_done_callback(lambda future: self._store_result(key, path, future))
+        return future
+
+    def _store_result(self, key, path, future):
+        if future.cancelled() or future.exception() is not None:
+            return
+        try:
+            self.put(key, path)
+        except OSError:
+            # Caching is best effort; the document itself was rendered
+            pass
+
+    def evict(self):
+        """Remove least recently used entries until the cache fits; returns bytes freed"""
+        entries = []
+        total = 0
+        for directory in (os.scandir(self.root) if os.path.isdir(self.root) else ()):
+            if not directory.is_dir(follow_symlinks=False):
+                continue
+            for entry in os.scandir(directory.path):
+                try:
+                    stat = entry.stat(follow_symlinks=False)
+                except FileNotFoundError:
+                    continue
+                if entry.name.endswith('.tmp'):
+                    # Left behind by a crash mid-put
+                    if stat.st_mtime < time.time() - 3600:
+                        os.remove(entry.path)
+                    continue
+                entries.append((stat.st_mtime, stat.st_size, entry.path))
+                total += stat.st_size
+
+        freed = 0
+        evicted = 0
+        if total > self.max_bytes:
+            target = self.max_bytes * 0.9
+            for _, size, path in sorted(entries):
+                if total - freed <= target:
+                    break
+                try:
+                    os.remove(path)
+                except FileNotFoundError:
+                    continue
+                freed += size
+                evicted += 1
+
+        with self._lock:
+            self._bytes = total - freed
+            self._last_scan = time.monotonic()
+            self.evictions += evicted
+        return freed
+
+    def stats(self):
+        """Counters for monitoring the cache"""
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                'hits': self.hits,
+                'misses': self.misses,
+                'hit_rate': round(self.hits / lookups, 3) if lookups else None,
+                'evictions': self.evictions,
+                'bytes': self._bytes,
+                'max_bytes': self.max_bytes
+            }
@@ -0,0 +1,297 @@
+import json
+import logging
+import os
+import shutil
+import threading
+import zipfile
+
+from collections import deque
+from datetime import datetime, timedelta
+from sqlalchemy import select, update
+from werkzeug.utils import secure_filename
+
+from backup_scheduler import LeaderLock
+from models import db, RenderJob, RenderJobItem
+from pdf_render import RenderPool, RenderPoolBusy, render_to_file
+
+# Jobs whose items are all finished
+FINISHED_STATUSES = ('completed', 'cancelled')
+
+
+def create_render_job(user_id, documents):
+    """Queue a list of document payloads as a RenderJob; commits and returns the job"""
+    job = RenderJob(user_id=user_id, total_items=len(documents))
+    db.session.add(job)
+    db.session.flush()
+    db.session.execute(RenderJobItem.__table__.insert(), [
+        {'job_id': job.id, 'position': position, 'document_data': json.dumps(document),
+         'status': 'pending', 'attempts': 0}
+        for position, document in enumerate(documents, start=1)
+    ])
+    db.session.commit()
+    return job
+
+
+def client_documents(template, clients):
+    """One copy of a document payload per ClientSettings row, addressed to that client"""
+    documents = []
+    for client in clients:
+        document = dict(template)
+        document.update({
+            'clientName': client.client_name,
+            'clientAddress': client.client_address or '',
+            'clientEmail': client.client_email or '',
+            'clientPhone': client.client_phone or ''
+        })
+        documents.append(document)
+    return documents
+
+
+def cancel_render_job(job):
+    """Cancel the items of a job that have not started; returns how many were cancelled"""
+    result = db.session.execute(
+        update(RenderJobItem)
+        .where(RenderJobItem.job_id == job.id, RenderJobItem.status == 'pending')
+        .values(status='cancelled', finished_at=datetime.utcnow())
+    )
+    if job.status not in FINISHED_STATUSES:
+        job.status = 'cancelled'
+        job.finished_at = job.finished_at or datetime.utcnow()
+    db.session.commit()
+    return result.rowcount
+
+
+def item_filename(item, data):
+    """Name of an item's PDF, unique within its job"""
+    name = secure_filename(f"{data.get('type') or 'document'}-{data.get('number') or ''}".strip('-')) or 'document'
+    return f'{item.position:04d}-{name}.pdf'
+
+
+class _ZipStream:
+    """Write-only file object collecting what zipfile writes, for streaming"""
+
+    def __init__(self):
+        self._chunks = []
+
+    def write(self, data):
+        self._chunks.append(bytes(data))
+        return len(data)
+
+    def flush(self):
+        pass
+
+    def drain(self):
+        data = b''.join(self._chunks)
+        self._chunks = []
+        return data
+
+
+def iter_zip(entries, chunk_size=1024 * 1024):
+    """Yield a ZIP archive of (name, path or bytes) entries piece by piece
+
+    Nothing is buffered beyond one chunk, so a job's archive is streamed to
+    the client while it is being built.
+    """
+    stream = _ZipStream()
+    with zipfile.ZipFile(stream, 'w', compression=zipfile.ZIP_DEFLATED, compresslevel=1) as archive:
+        for name, source in entries:
+            with archive.open(name, 'w') as member:
+                if isinstance(source, bytes):
+                    member.write(source)
+                else:
+                    with open(source, 'rb') as f:
+                        for chunk in iter(lambda: f.read(chunk_size), b''):
+                            member.write(chunk)
+                            yield stream.drain()
+            yield stream.drain()
+    yield stream.drain()
+
+
+class RenderJobRunner:
+    """Renders queued RenderJobItems on a pool of `workers` render processes
+
+    All job state lives in the database, so jobs survive restarts and can be
+    polled from any worker. Every process may start a runner, but only the
+    one holding the leader lock creates the pool and dispatches, keeping at
+    most as many items in flight as the pool has workers (plus one queued
+    each). Items left running by a leader that died are requeued after
+    stale_after seconds and fail for good after max_attempts. Finished jobs
+    and their files are deleted once older than retention. With a RenderCache, documents already
+    rendered are copied from it instead; cache_key(data, user, generated_on)
+    computes their key.
+    """
+
+    def __init__(self, app, workers, lock_path, output_dir, retention=timedelta(days=3),
+                 poll_interval=2.0, stale_after=600, max_attempts=3, static_root=None, cache=None, cache_key=None):
+        self.app = app
+        self.workers = workers
+        self.pool = None
+        self.lock = LeaderLock(lock_path)
+        self.output_dir = output_dir
+        self.retention = retention
+        self.poll_interval = poll_interval
+        self.stale_after = stale_after
+        self.max_attempts = max_attempts
+        self.static_root = static_root
+        self.cache = cache
+        self.cache_key = cache_key
+        self.capacity = workers * 2
+        self.rendered = 0
+        self.failed = 0
+        self._running = set()
+        self._finished = deque()
+        self._wake = threading.Event()
+        self._thread = None
+        self._last_purge = None
+
+    def start(self):
+        if self._thread is None:
+            self._thread = threading.Thread(target=self._run, name='render-job-runner', daemon=True)
+            self._thread.start()
+
+    def wake(self):
+        """Dispatch newly queued items without waiting for the next poll"""
+        self._wake.set()
+
+    def stats(self):
+        """Counters for monitoring the runner"""
+        return {'leader': self.lock.is_held, 'in_flight': len(self._running), 'rendered': self.rendered, 'failed': self.failed}
+
+    def job_dir(self, job_id):
+        return os.path.join(self.output_dir, str(job_id))
+
+    def _run(self):
+        while True:
+            self._run_once()
+            self._wake.wait(self.poll_interval)
+            self._wake.clear()
+
+    def _run_once(self):
+        if not self.lock.acquire():
+            return
+        # Followers never start render processes of their own
+        if self.pool is None:
+            self.pool = RenderPool(max_workers=self.workers, max_pending=self.capacity)
+        with self.app.app_context():
+            try:
+                self._record_finished()
+                self._dispatch()
+                self._purge_expired()
+            except Exception as e:
+                db.session.rollback()
+                logging.error(f"Render job runner error: {str(e)}")
+
+    def _dispatch(self):
+        now = datetime.utcnow()
+        # Items claimed by a previous leader that never reported back
+        stale = (
+            RenderJobItem.status == 'running',
+            RenderJobItem.claimed_at < now - timedelta(seconds=self.stale_after),
+            RenderJobItem.id.notin_(self._running)
+        )
+        db.session.execute(
+            update(RenderJobItem).where(*stale, RenderJobItem.attempts < self.max_attempts).values(status='pending')
+        )
+        for item in db.session.execute(select(RenderJobItem).where(*stale)).scalars().all():
+            self._finish_item(item, None, 'Rendering did not finish')
+        db.session.commit()
+
+        free = self.capacity - len(self._running)
+        if free <= 0:
+            return
+        items = db.session.execute(
+            select(RenderJobItem)
+            .join(RenderJob)
+            .where(RenderJobItem.status == 'pending', RenderJob.status.notin_(FINISHED_STATUSES))
+            .order_by(RenderJobItem.job_id, RenderJobItem.position)
+            .limit(free)
+        ).scalars().all()
+
+        for item in items:
+            job = item.job
+            if job.status == 'queued':
+                job.status = 'running'
+                job.started_at = now
+            item.status = 'running'
+            item.claimed_at = now
+            item.attempts += 1
+            db.session.commit()
+
+            try:
+                data = json.loads(item.document_data)
+                path = os.path.join(self.job_dir(job.id), item_filename(item, data))
+                generated_on = datetime.now()
+                render_args = (render_to_file, data, path, job.user.username, generated_on, self.static_root)
+                if self.cache is not None:
+                    future = self.cache.render(self.pool, self.cache_key(data, job.user, generated_on), path, *render_args)
+                else:
+                    future = self.pool.submit(*render_args)
+            except RenderPoolBusy:
+                # Interactive renders filled the pool; try again on the next poll
+                item.status = 'pending'
+                item.attempts -= 1
+                db.session.commit()
+                return
+            except Exception as e:
+                self._finish_item(item, None, str(e))
+                db.session.commit()
+                continue
+
+            self._running.add(item.id)
+            future.add_done_callback(lambda future, item_id=item.id, path=path: self._on_done(item_id, path, future))
+
+    def _on_done(self, item_id, path, future):
+        # Runs in the executor's thread; the database is updated from the runner thread
+        error = None
+        if future.cancelled():
+            error = 'Rendering was cancelled'
+        elif future.exception() is not None:
+            error = str(future.exception()) or future.exception().__class__.__name__
+        self._finished.append((item_id, path, error))
+        self._wake.set()
+
+    def _record_finished(self):
+        while self._finished:
+            item_id, path, error = self._finished.popleft()
+            self._running.discard(item_id)
+            item = db.session.get(RenderJobItem, item_id)
+            if item is None or item.status != 'running':
+                # The job was deleted, or the item was requeued meanwhile
+                continue
+            self._finish_item(item, None if error else path, error)
+            db.session.commit()
+
+    def _finish_item(self, item, path, error):
+        item.finished_at = datetime.utcnow()
+        item.file_path = path
+        item.error = error
+        item.status = 'failed' if error else 'done'
+        job = item.job
+        if error:
+            job.failed_items += 1
+            self.failed += 1
+            logging.warning(f"Render job {job.id} item {item.position} failed: {error}")
+        else:
+            job.completed_items += 1
+            self.rendered += 1
+        if job.completed_items + job.failed_items >= job.total_items and job.status not in FINISHED_STATUSES:
+            job.status = 'completed'
+            job.finished_at = item.finished_at
+
+    def _purge_expired(self):
+        now = datetime.utcnow()
+        if self._last_purge and now - self._last_purge < timedelta(hours=1):
+            return
+        self._last_purge = now
+
+        expired = db.session.execute(
+            select(RenderJob).where(RenderJob.status.in_(FINISHED_STATUSES), RenderJob.finished_at < now - self.retention)
+        ).scalars().all()
+        for job in expired:
+            if any(item.status == 'running' for item in job.items):
+                continue
+            shutil.rmtree(self.job_dir(job.id), ignore_errors=True)
+            db.session.delete(job)
+        db.session.commit()
+        if expired:
+            logging.info(f"Removed {len(expired)} expired render jobs")
@@ -0,0 +1,66 @@
+import logging
+import os
+import threading
+import time
+
+from sqlalchemy import event, text
+
+
+def sqlite_pragmas_from_env():
+    """Default SQLite connection pragmas, each overridable by an environment variable"""
+    return {
+        # Readers and the writer no longer block each other
+        'journal_mode': os.environ.get('SQLITE_JOURNAL_MODE', 'WAL'),
+        # Safe with WAL: only the last transactions may be lost on power failure
+        'synchronous': os.environ.get('SQLITE_SYNCHRONOUS', 'NORMAL'),
+        # Negative values are KiB, so the default is a 64 MB page cache
+        'cache_size': int(os.environ.get('SQLITE_CACHE_SIZE', -64000)),
+        'mmap_size': int(os.environ.get('SQLITE_MMAP_SIZE', 256 * 1024 * 1024)),
+        'temp_store': os.environ.get('SQLITE_TEMP_STORE', 'MEMORY'),
+    }
+
+
+def sqlite_engine_options(busy_timeout=None):
+    """Engine options for SQLite; the pysqlite timeout is SQLite's busy timeout"""
+    if busy_timeout is None:
+        busy_timeout = float(os.environ.get('SQLITE_BUSY_TIMEOUT', 15))
+    return {'connect_args': {'timeout': busy_timeout}}
+
+
+def init_sqlite_tuning(app, db):
+    """Apply app.config['SQLITE_PRAGMAS'] to every new SQLite connection
+
+    Must run before the first connection is opened. Does nothing for other
+    database engines. If SQLITE_OPTIMIZE_INTERVAL is set, a background
+    thread also runs PRAGMA optimize every that many seconds.
+    """
+    with app.app_context():
+        engine = db.engine
+
+    if engine.dialect.name != 'sqlite':
+        return
+
+    pragmas = app.config.get('SQLITE_PRAGMAS', {})
+
+    @event.listens_for(engine, 'connect')
+    def apply_pragmas(dbapi_connection, connection_record):
+        cursor = dbapi_connection.cursor()
+        try:
+            for name, value in pragmas.items():
+                cursor.execute(f'PRAGMA {name}={value}')
+        finally:
+            cursor.close()
+
+    interval = app.config.get('SQLITE_OPTIMIZE_INTERVAL', 0)
+    if interval:
+        def optimize_scheduler():
+            while True:
+                time.sleep(interval)
+                try:
+                    with engine.connect() as connection:
+                        connection.execute(text('PRAGMA optimize'))
+                except Exception as e:
+                    logging.error(f"PRAGMA optimize failed: {str(e)}")
+
+        optimize_thread = threading.Thread(target=optimize_scheduler, name='sqlite-optimize', daemon=True)
+        optimize_thread.start()
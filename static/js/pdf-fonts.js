@@ -0,0 +1,124 @@
+// Picks and loads the PDF font for a document's text.
+// Text Helvetica can show (Windows-1252) needs no download at all; anything else gets the
+// smallest subset from static/fonts/manifest.json (built by build_fonts.py) that covers it.
+
+class PDFFonts {
+    constructor(baseUrl = '/static/fonts/') {
+        this.baseUrl = baseUrl;
+        this.manifestPromise = null;
+        this.files = new Map();
+    }
+
+    // Characters of Windows-1252 outside Latin-1, which the standard PDF fonts also have
+    static isStandardCodePoint(codePoint) {
+        if (codePoint < 0x100) {
+            return codePoint >= 0x20 || codePoint === 0x09 || codePoint === 0x0A || codePoint === 0x0D;
+        }
+        return PDFFonts.WIN_ANSI_EXTRA.has(codePoint);
+    }
+
+    // Code points of every string in a value, nested objects and arrays included
+    static collectCodePoints(value, codePoints = new Set()) {
+        if (typeof value === 'string') {
+            for (const char of value) {
+                codePoints.add(char.codePointAt(0));
+            }
+        } else if (Array.isArray(value)) {
+            value.forEach(item => PDFFonts.collectCodePoints(item, codePoints));
+        } else if (value && typeof value === 'object') {
+            Object.values(value).forEach(item => PDFFonts.collectCodePoints(item, codePoints));
+        }
+        return codePoints;
+    }
+
+    static covers(ranges, codePoint) {
+        // Ranges are sorted [first, last] pairs
+        let low = 0;
+        let high = ranges.length - 1;
+        while (low <= high) {
+            const middle = (low + high) >> 1;
+            if (codePoint < ranges[middle][0]) {
+                high = middle - 1;
+            } else if (codePoint > ranges[middle][1]) {
+                low = middle + 1;
+            } else {
+                return true;
+            }
+        }
+        return false;
+    }
+
+    loadManifest() {
+        if (!this.manifestPromise) {
+            this.manifestPromise = fetch(this.baseUrl + 'manifest.json')
+                .then(response => {
+                    if (!response.ok) throw new Error(`HTTP error! status: ${response.status}`);
+                    return response.json();
+                })
+                .catch(error => {
+                    this.manifestPromise = null;
+                    throw error;
+                });
+        }
+        return this.manifestPromise;
+    }
+
+    // A font file as base64, which is what jsPDF's virtual file system takes
+    loadFile(file) {
+        if (!this.files.has(file)) {
+            const promise = fetch(this.baseUrl + file)
+                .then(response => {
+                    if (!response.ok) throw new Error(`HTTP error! status: ${response.status}`);
+                    return response.arrayBuffer();
+                })
+                .then(buffer => {
+                    const bytes = new Uint8Array(buffer);
+                    let binary = '';
+                    for (let i = 0; i < bytes.length; i += 0x8000) {
+                        binary += String.fromCharCode.apply(null, bytes.subarray(i, i + 0x8000));
+                    }
+                    return btoa(binary);
+                })
+                .catch(error => {
+                    this.files.delete(file);
+                    throw error;
+                });
+            this.files.set(file, promise);
+        }
+        return this.files.get(file);
+    }
+
+    // { family, file, data } for PDFLayout, or null when Helvetica can show all the text.
+    // texts are the strings the layout adds itself, such as formatted amounts and the footer.
+    async fontFor(documentData, texts = []) {
+        const codePoints = PDFFonts.collectCodePoints([documentData, texts]);
+        const needed = Array.from(codePoints).filter(codePoint => !PDFFonts.isStandardCodePoint(codePoint));
+        if (needed.length === 0) {
+            return null;
+        }
+
+        try {
+            const manifest = await this.loadManifest();
+            const subsets = manifest.subsets;
+            // Fall back to the largest subset; glyphs no subset has are left to the PDF viewer
+            const subset = subsets.find(candidate => needed.every(codePoint => PDFFonts.covers(candidate.ranges, codePoint))) ||
+                           subsets[subsets.length - 1];
+            return {
+                family: manifest.family,
+                file: subset.file,
+                data: await this.loadFile(subset.file)
+            };
+        } catch (error) {
+            console.warn('Could not load a PDF font, using Helvetica:', error);
+            return null;
+        }
+    }
+}
+
+PDFFonts.WIN_ANSI_EXTRA = new Set([
+    0x20AC, 0x201A, 0x0192, 0x201E, 0x2026, 0x2020, 0x2021, 0x02C6, 0x2030, 0x0160, 0x2039, 0x0152,
+    0x017D, 0x2018, 0x2019, 0x201C, 0x201D, 0x2022, 0x2013, 0x2014, 0x02DC, 0x2122, 0x0161, 0x203A,
+    0x0153, 0x017E, 0x0178
+]);
+
+self.PDFFonts = PDFFonts;
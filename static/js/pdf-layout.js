@@ -0,0 +1,559 @@
+// Document layout for jsPDF, shared by the page and the PDF worker (pdf-worker.js).
+// Has no DOM access: images arrive as data URLs and the user name as a string.
+
+class PDFLayout {
+    constructor(jsPDF) {
+        this.jsPDF = jsPDF;
+        this.doc = null;
+        this.fontFamily = 'helvetica';
+        this.pageWidth = 210; // A4 width in mm
+        this.pageHeight = 297; // A4 height in mm
+        this.margin = 20;
+        // Content may not run into the footer area at the bottom of the page
+        this.contentBottom = this.pageHeight - 50;
+        this.currentY = this.margin;
+        this.lineHeight = 6;
+        this.fontSize = {
+            title: 18,
+            subtitle: 14,
+            normal: 10,
+            small: 8
+        };
+        // Measured table rows by content, kept across renders so that
+        // re-rendering a large invoice only measures the rows that changed
+        this.rowCache = new Map();
+        this.maxCachedRows = 2000;
+        this.stats = { rowsMeasured: 0, rowsReused: 0 };
+        this.currencyFormatters = new Map();
+    }
+
+    // Initialize new PDF document, embedding font ({ family, file, data } from PDFFonts) if given
+    initializeDocument(font = null) {
+        this.doc = new this.jsPDF('p', 'mm', 'a4');
+        this.currentY = this.margin;
+        this.fontFamily = 'helvetica';
+
+        if (font) {
+            this.doc.addFileToVFS(font.file, font.data);
+            // Subsets have a single weight; it stands in for bold and italic too
+            ['normal', 'bold', 'italic'].forEach(style => this.doc.addFont(font.file, font.family, style));
+            this.fontFamily = font.family;
+        }
+        return this.doc;
+    }
+
+    // Set font with size and style
+    setFont(size, style = 'normal') {
+        this.doc.setFontSize(size);
+        this.doc.setFont(this.fontFamily, style);
+        this.doc.setTextColor(0, 0, 0); // Always black
+    }
+
+    // Start a new page unless height mm still fit above the footer area
+    ensureSpace(height) {
+        if (this.currentY + height > this.contentBottom) {
+            this.doc.addPage();
+            this.currentY = this.margin;
+            return true;
+        }
+        return false;
+    }
+
+    // Write wrapped lines, moving to a new page when they run out of room
+    addLines(lines, x, step) {
+        for (let i = 0; i < lines.length; i++) {
+            this.ensureSpace(step);
+            this.doc.text(lines[i], x, this.currentY);
+            this.currentY += step;
+        }
+    }
+
+    // Add simple header with business logo
+    addSimpleHeader(businessData, logoData) {
+        const headerStartY = this.currentY;
+        let logoAdded = false;
+
+        // Add business logo at top right if provided
+        if (logoData) {
+            try {
+                const logoSize = 25; // Appropriate size for header
+                const logoX = this.pageWidth - this.margin - logoSize;
+                const logoY = this.currentY;
+
+                // Add logo with border
+                this.doc.setLineWidth(0.5);
+                this.doc.setDrawColor(200, 200, 200);
+                this.doc.rect(logoX - 2, logoY - 2, logoSize + 4, logoSize + 4);
+
+                this.doc.addImage(logoData, 'JPEG', logoX, logoY, logoSize, logoSize);
+                logoAdded = true;
+            } catch (error) {
+                console.warn('Failed to add business logo:', error);
+            }
+        }
+
+        // Company name (left side)
+        if (businessData.businessName) {
+            this.setFont(this.fontSize.title, 'bold');
+            const maxWidth = logoAdded ? this.pageWidth - (2 * this.margin) - 30 : this.pageWidth - (2 * this.margin);
+            const nameLines = this.doc.splitTextToSize(businessData.businessName, maxWidth);
+            for (let i = 0; i < nameLines.length; i++) {
+                this.doc.text(nameLines[i], this.margin, this.currentY);
+                this.currentY += 8;
+            }
+            this.currentY += 2;
+        }
+
+        // Contact information
+        this.setFont(this.fontSize.small, 'normal');
+        const maxContactWidth = logoAdded ? this.pageWidth - (2 * this.margin) - 30 : this.pageWidth - (2 * this.margin);
+
+        if (businessData.businessAddress) {
+            const addressLines = this.doc.splitTextToSize(businessData.businessAddress, maxContactWidth);
+            for (let i = 0; i < addressLines.length; i++) {
+                this.doc.text(addressLines[i], this.margin, this.currentY);
+                this.currentY += 5;
+            }
+        }
+
+        if (businessData.businessPhone || businessData.businessEmail) {
+            let contactLine = '';
+            if (businessData.businessPhone) {
+                contactLine += 'Phone: ' + businessData.businessPhone;
+            }
+            if (businessData.businessEmail) {
+                if (contactLine) contactLine += ' | ';
+                contactLine += 'Email: ' + businessData.businessEmail;
+            }
+
+            const contactLines = this.doc.splitTextToSize(contactLine, maxContactWidth);
+            for (let i = 0; i < contactLines.length; i++) {
+                this.doc.text(contactLines[i], this.margin, this.currentY);
+                this.currentY += 5;
+            }
+            this.currentY += 3;
+        }
+
+        // Ensure adequate spacing after header, especially when logo is present
+        if (logoAdded) {
+            this.currentY = Math.max(this.currentY, headerStartY + 30);
+        }
+
+        // Separator line
+        this.doc.setLineWidth(1);
+        this.doc.setDrawColor(0, 0, 0);
+        this.doc.line(this.margin, this.currentY, this.pageWidth - this.margin, this.currentY);
+        this.currentY += 15;
+    }
+
+    // Add document section
+    addDocumentSection(documentData) {
+        // Document type and number
+        this.setFont(this.fontSize.subtitle, 'bold');
+        const type = String(documentData.type || '');
+        const docType = type.charAt(0).toUpperCase() + type.slice(1).replace('_', ' ');
+        this.doc.text(docType.toUpperCase(), this.margin, this.currentY);
+
+        // Document number on the right
+        const docNumberText = `# ${documentData.number}`;
+        const docNumberWidth = this.doc.getTextWidth(docNumberText);
+        this.doc.text(docNumberText, this.pageWidth - this.margin - docNumberWidth, this.currentY);
+
+        this.currentY += 10;
+
+        // Date
+        this.setFont(this.fontSize.normal, 'normal');
+        const formattedDate = this.formatDate(documentData.date);
+        this.doc.text('Date: ' + formattedDate, this.margin, this.currentY);
+
+        this.currentY += 15;
+    }
+
+    // Add client section
+    addClientSection(documentData) {
+        this.setFont(this.fontSize.normal, 'bold');
+        this.doc.text('BILL TO:', this.margin, this.currentY);
+        this.currentY += 8;
+
+        // Extract client data from documentData
+        const clientName = documentData.clientName || documentData.client?.name || '';
+        const clientAddress = documentData.clientAddress || documentData.client?.address || '';
+        const clientPhone = documentData.clientPhone || documentData.client?.phone || '';
+        const clientEmail = documentData.clientEmail || documentData.client?.email || '';
+
+        // Client information
+        if (clientName) {
+            this.setFont(this.fontSize.normal, 'bold');
+            this.doc.text(clientName, this.margin, this.currentY);
+            this.currentY += 6;
+        }
+
+        if (clientAddress) {
+            this.setFont(this.fontSize.small, 'normal');
+            const addressLines = this.doc.splitTextToSize(clientAddress, this.pageWidth - (2 * this.margin));
+            this.addLines(addressLines, this.margin, 5);
+        }
+
+        if (clientPhone || clientEmail) {
+            this.setFont(this.fontSize.small, 'normal');
+            if (clientPhone) {
+                this.doc.text('Phone: ' + clientPhone, this.margin, this.currentY);
+                this.currentY += 5;
+            }
+            if (clientEmail) {
+                this.doc.text('Email: ' + clientEmail, this.margin, this.currentY);
+                this.currentY += 5;
+            }
+        }
+
+        // Add default placeholder if no client info is provided
+        if (!clientName && !clientAddress && !clientPhone && !clientEmail) {
+            this.setFont(this.fontSize.small, 'italic');
+            this.doc.setTextColor(128, 128, 128);
+            this.doc.text('No client information provided', this.margin, this.currentY);
+            this.doc.setTextColor(0, 0, 0);
+            this.currentY += 6;
+        }
+
+        this.currentY += 10;
+    }
+
+    // Table columns for the current page width
+    tableColumns() {
+        const tableWidth = this.pageWidth - (2 * this.margin);
+        const columns = [
+            { name: 'DESCRIPTION', width: tableWidth * 0.48, align: 'left' },
+            { name: 'QTY', width: tableWidth * 0.12, align: 'center' },
+            { name: 'UNIT PRICE', width: tableWidth * 0.20, align: 'right' },
+            { name: 'AMOUNT', width: tableWidth * 0.20, align: 'right' }
+        ];
+
+        // Calculate column positions
+        let currentX = this.margin;
+        columns.forEach(col => {
+            col.x = currentX;
+            currentX += col.width;
+        });
+        return columns;
+    }
+
+    // Draw the table header at the current position
+    addTableHeader(columns) {
+        const tableX = this.margin;
+        const tableWidth = this.pageWidth - (2 * this.margin);
+        const headerHeight = 10;
+        const headerY = this.currentY;
+
+        // Header background
+        this.doc.setFillColor(240, 240, 240);
+        this.doc.rect(tableX, headerY, tableWidth, headerHeight, 'F');
+
+        // Header border
+        this.doc.setLineWidth(0.5);
+        this.doc.setDrawColor(0, 0, 0);
+        this.doc.rect(tableX, headerY, tableWidth, headerHeight);
+
+        // Header text
+        this.setFont(this.fontSize.normal, 'bold');
+        columns.forEach(col => {
+            let textX = col.x + 2;
+            if (col.align === 'center') {
+                textX = col.x + (col.width / 2) - (this.doc.getTextWidth(col.name) / 2);
+            } else if (col.align === 'right') {
+                textX = col.x + col.width - 2 - this.doc.getTextWidth(col.name);
+            }
+            this.doc.text(col.name, textX, headerY + 7);
+        });
+
+        // Column separators
+        for (let i = 1; i < columns.length; i++) {
+            this.doc.line(columns[i].x, headerY, columns[i].x, headerY + headerHeight);
+        }
+
+        this.currentY = headerY + headerHeight;
+        this.setFont(this.fontSize.normal, 'normal');
+    }
+
+    // Cell texts and x positions of one row, measured once per distinct row content
+    measureRow(item, columns, currency) {
+        const key = JSON.stringify([this.fontFamily, item.description || '', item.quantity, item.price, currency]);
+        const cached = this.rowCache.get(key);
+        if (cached) {
+            this.stats.rowsReused++;
+            return cached;
+        }
+
+        const price = parseFloat(item.price) || 0;
+        const quantity = parseFloat(item.quantity) || 0;
+        const rowData = [
+            this.truncateText(item.description || 'No description', columns[0].width - 4),
+            quantity.toString(),
+            this.formatCurrency(price, currency),
+            this.formatCurrency(price * quantity, currency)
+        ];
+
+        const cells = columns.map((col, colIndex) => {
+            const text = rowData[colIndex];
+            let textX = col.x + 2;
+            if (col.align === 'center') {
+                textX = col.x + (col.width / 2) - (this.doc.getTextWidth(text) / 2);
+            } else if (col.align === 'right') {
+                textX = col.x + col.width - 2 - this.doc.getTextWidth(text);
+            }
+            return { text, x: textX };
+        });
+
+        if (this.rowCache.size >= this.maxCachedRows) {
+            this.rowCache.clear();
+        }
+        this.rowCache.set(key, cells);
+        this.stats.rowsMeasured++;
+        return cells;
+    }
+
+    // Shorten text with an ellipsis until it fits maxWidth
+    truncateText(text, maxWidth) {
+        if (this.doc.getTextWidth(text) <= maxWidth) {
+            return text;
+        }
+        // Longest prefix that still fits together with the ellipsis
+        let low = 0;
+        let high = text.length;
+        while (low < high) {
+            const middle = Math.ceil((low + high) / 2);
+            if (this.doc.getTextWidth(text.slice(0, middle) + '...') <= maxWidth) {
+                low = middle;
+            } else {
+                high = middle - 1;
+            }
+        }
+        return text.slice(0, low) + '...';
+    }
+
+    // Add items table
+    addItemsTable(items, currency = 'USD') {
+        if (!items || items.length === 0) {
+            this.setFont(this.fontSize.normal, 'normal');
+            this.doc.text('No items added', this.margin, this.currentY);
+            this.currentY += 15;
+            return;
+        }
+
+        const tableX = this.margin;
+        const tableWidth = this.pageWidth - (2 * this.margin);
+        const rowHeight = 8;
+        const columns = this.tableColumns();
+
+        this.ensureSpace(10 + rowHeight);
+        this.addTableHeader(columns);
+
+        // Table rows
+        for (let i = 0; i < items.length; i++) {
+            // Repeat the header on every page the table continues on
+            if (this.ensureSpace(rowHeight)) {
+                this.addTableHeader(columns);
+            }
+
+            const cells = this.measureRow(items[i], columns, currency);
+            const rowY = this.currentY;
+
+            // Row border
+            this.doc.setLineWidth(0.2);
+            this.doc.setDrawColor(0, 0, 0);
+            this.doc.rect(tableX, rowY, tableWidth, rowHeight);
+
+            // Column separators
+            for (let j = 1; j < columns.length; j++) {
+                this.doc.line(columns[j].x, rowY, columns[j].x, rowY + rowHeight);
+            }
+
+            // Row data
+            for (let j = 0; j < cells.length; j++) {
+                this.doc.text(cells[j].text, cells[j].x, rowY + 6);
+            }
+
+            this.currentY += rowHeight;
+        }
+
+        this.currentY += 10;
+    }
+
+    // Add totals section
+    addTotals(totals = {}, currency = 'USD') {
+        const totalsX = this.pageWidth - this.margin - 60;
+        const totalsWidth = 60;
+
+        this.ensureSpace(30);
+        let currentY = this.currentY;
+
+        // Subtotal
+        const subtotal = parseFloat(totals.subtotal) || 0;
+        this.setFont(this.fontSize.normal, 'normal');
+        this.doc.text('Subtotal:', totalsX, currentY);
+        const subtotalText = this.formatCurrency(subtotal, currency);
+        const subtotalWidth = this.doc.getTextWidth(subtotalText);
+        this.doc.text(subtotalText, totalsX + totalsWidth - subtotalWidth, currentY);
+        currentY += 6;
+
+        // Tax if applicable
+        if (totals.taxRate > 0) {
+            const taxAmount = subtotal * (parseFloat(totals.taxRate) / 100);
+            this.doc.text(`Tax (${totals.taxRate}%):`, totalsX, currentY);
+            const taxText = this.formatCurrency(taxAmount, currency);
+            const taxWidth = this.doc.getTextWidth(taxText);
+            this.doc.text(taxText, totalsX + totalsWidth - taxWidth, currentY);
+            currentY += 6;
+        }
+
+        // Separator line
+        this.doc.setLineWidth(0.5);
+        this.doc.setDrawColor(0, 0, 0);
+        this.doc.line(totalsX, currentY + 1, totalsX + totalsWidth, currentY + 1);
+        currentY += 6;
+
+        // Grand total
+        const grandTotal = parseFloat(totals.grandTotal) ||
+                          subtotal + (subtotal * (parseFloat(totals.taxRate || 0) / 100));
+
+        this.setFont(this.fontSize.normal, 'bold');
+        this.doc.text('TOTAL:', totalsX, currentY);
+        const totalText = this.formatCurrency(grandTotal, currency);
+        const totalWidth = this.doc.getTextWidth(totalText);
+        this.doc.text(totalText, totalsX + totalsWidth - totalWidth, currentY);
+
+        this.currentY = currentY + 15;
+    }
+
+    // Add simple footer with signature
+    addSimpleFooter(notes = '', signatureData = null) {
+        // Notes section
+        if (notes && notes.trim()) {
+            this.ensureSpace(16);
+            this.setFont(this.fontSize.normal, 'bold');
+            this.doc.text('NOTES:', this.margin, this.currentY);
+            this.currentY += 8;
+
+            this.setFont(this.fontSize.small, 'normal');
+            const maxWidth = this.pageWidth - (2 * this.margin);
+            this.addLines(this.doc.splitTextToSize(notes, maxWidth), this.margin, 5);
+
+            this.currentY += 10;
+        }
+
+        // Footer area
+        const footerY = this.pageHeight - 40;
+        let signatureAdded = false;
+
+        // Add signature at bottom right if provided
+        if (signatureData) {
+            try {
+                const signatureWidth = 30;
+                const signatureHeight = 15;
+                const signatureX = this.pageWidth - this.margin - signatureWidth;
+                const signatureY = footerY - 5;
+
+                // Add signature with subtle border
+                this.doc.setLineWidth(0.3);
+                this.doc.setDrawColor(220, 220, 220);
+                this.doc.rect(signatureX - 1, signatureY - 1, signatureWidth + 2, signatureHeight + 2);
+
+                this.doc.addImage(signatureData, 'JPEG', signatureX, signatureY, signatureWidth, signatureHeight);
+
+                // Add "Authorized Signature" label below
+                this.setFont(this.fontSize.small, 'normal');
+                this.doc.text('Authorized Signature', signatureX, signatureY + signatureHeight + 5);
+                signatureAdded = true;
+            } catch (error) {
+                console.warn('Failed to add signature image:', error);
+            }
+        }
+
+        // Thank you message at bottom center
+        this.setFont(this.fontSize.normal, 'normal');
+        const thankYou = 'Thank you for your business!';
+        const textWidth = this.doc.getTextWidth(thankYou);
+        const thankYouX = signatureAdded ? this.margin : (this.pageWidth - textWidth) / 2;
+        this.doc.text(thankYou, thankYouX, footerY + 10);
+    }
+
+    // Lay out a complete document; options carry the loaded images and footer details
+    render(documentData, options = {}) {
+        const business = documentData.business || {};
+        const currency = business.currency || 'USD';
+
+        this.initializeDocument(options.font);
+
+        // Set document properties
+        this.doc.setProperties({
+            title: `${documentData.type} ${documentData.number}`,
+            subject: documentData.type,
+            author: business.businessName || 'Business Documents Generator',
+            creator: 'Minimal PDF Generator'
+        });
+
+        this.addSimpleHeader(business, options.logo);
+        this.addDocumentSection(documentData);
+        this.addClientSection(documentData);
+        this.addItemsTable(documentData.items, currency);
+        this.addTotals(documentData.totals, currency);
+        this.addSimpleFooter(documentData.notes, options.signature);
+
+        // Add page numbers and generation info
+        const pageCount = this.doc.internal.getNumberOfPages();
+        for (let i = 1; i <= pageCount; i++) {
+            this.doc.setPage(i);
+            this.setFont(this.fontSize.small, 'normal');
+            this.doc.text(`Page ${i} of ${pageCount}`, this.pageWidth - 25, this.pageHeight - 10);
+            this.doc.text(`Generated on ${options.generatedOn || new Date().toLocaleDateString()} by ${options.generatedBy || 'Unknown User'}`, 20, this.pageHeight - 10);
+        }
+
+        return this.doc;
+    }
+
+    // Helper: Format currency
+    formatCurrency(amount, currency = 'USD') {
+        const numAmount = parseFloat(amount) || 0;
+
+        try {
+            // Building a formatter is far slower than using one
+            let formatter = this.currencyFormatters.get(currency);
+            if (!formatter) {
+                formatter = new Intl.NumberFormat('en-US', {
+                    style: 'currency',
+                    currency: currency,
+                    minimumFractionDigits: 2,
+                    maximumFractionDigits: 2
+                });
+                this.currencyFormatters.set(currency, formatter);
+            }
+            return formatter.format(numAmount);
+        } catch (error) {
+            const symbols = {
+                'USD': '$', 'EUR': '€', 'GBP': '£', 'NGN': '₦', 'CAD': 'C$',
+                'AUD': 'A$', 'INR': '₹', 'JPY': '¥', 'CNY': '¥'
+            };
+            const symbol = symbols[currency] || `${currency} `;
+            const formatted = numAmount.toLocaleString('en-US', {
+                minimumFractionDigits: 2,
+                maximumFractionDigits: 2
+            });
+            return `${symbol}${formatted}`;
+        }
+    }
+
+    // Helper: Format date
+    formatDate(dateString) {
+        try {
+            const date = new Date(dateString);
+            return date.toLocaleDateString('en-US', {
+                year: 'numeric',
+                month: 'short',
+                day: 'numeric'
+            });
+        } catch (error) {
+            return dateString;
+        }
+    }
+}
+
+self.PDFLayout = PDFLayout;
@@ -0,0 +1,56 @@
+// PDF rendering worker, driven by MinimalPDFGenerator (pdf-generator.js).
+//
+// Messages in:  { type: 'render', id, documentData, options }
+//               { type: 'cancel', id }
+// Messages out: { type: 'done', id, buffer }  (the PDF as a transferred ArrayBuffer)
+//               { type: 'error', id, message }
+//               { type: 'cancelled', id }
+
+importScripts(
+    'https://cdnjs.cloudflare.com/ajax/libs/jspdf/2.5.1/jspdf.umd.min.js',
+    'pdf-layout.js' + self.location.search
+);
+
+// One layout for the worker's lifetime, so its row measurements carry over between renders
+const layout = new PDFLayout(self.jspdf.jsPDF);
+const queue = [];
+let scheduled = false;
+
+self.onmessage = function(event) {
+    const message = event.data;
+
+    if (message.type === 'render') {
+        queue.push(message);
+        scheduleNext();
+    } else if (message.type === 'cancel') {
+        // Jobs still queued are dropped; a running one finishes and is ignored by the page
+        const index = queue.findIndex(job => job.id === message.id);
+        if (index !== -1) {
+            queue.splice(index, 1);
+            self.postMessage({ type: 'cancelled', id: message.id });
+        }
+    }
+};
+
+// Run one job per task so cancel messages are handled between jobs
+function scheduleNext() {
+    if (!scheduled && queue.length) {
+        scheduled = true;
+        setTimeout(runNext, 0);
+    }
+}
+
+function runNext() {
+    scheduled = false;
+    const job = queue.shift();
+    if (!job) return;
+
+    try {
+        const buffer = layout.render(job.documentData, job.options).output('arraybuffer');
+        self.postMessage({ type: 'done', id: job.id, buffer: buffer }, [buffer]);
+    } catch (error) {
+        self.postMessage({ type: 'error', id: job.id, message: error.message || String(error) });
+    }
+
+    scheduleNext();
+}
@@ -1,5 +1,5 @@
 
-const CACHE_NAME = 'business-docs-v2';
+const CACHE_NAME = 'business-docs-v6';
 const OFFLINE_CACHE = 'business-docs-offline-v1';
 
 // Critical resources for offline functionality
@@ -9,9 +9,10 @@ const urlsToCache = [
   '/static/css/style.css',
   '/static/js/app.js',
   '/static/js/pdf-generator.js',
+  '/static/js/pdf-layout.js',
+  '/static/js/pdf-worker.js',
+  '/static/js/pdf-fonts.js',
   '/static/js/pwa-utils.js',
-  '/static/js/NotoSans.js',
-  '/static/js/Roboto-Regular-normal.js',
   '/static/manifest.json',
   '/static/icons/icon-192.png',
   '/static/icons/icon-512.png',
@@ -48,6 +49,27 @@ self.addEventListener('fetch', function(event) {
     return;
   }
 
+  // The font manifest names the current subsets, so prefer the network's copy.
+  // The subsets themselves have hashed names and are cached on first use below.
+  if (new URL(event.request.url).pathname === '/static/fonts/manifest.json') {
+    event.respondWith(
+      fetch(event.request)
+        .then(function(response) {
+          if (response.ok) {
+            var responseToCache = response.clone();
+            caches.open(CACHE_NAME).then(function(cache) {
+              cache.put(event.request, responseToCache);
+            });
+          }
+          return response;
+        })
+        .catch(function() {
+          return caches.match(event.request);
+        })
+    );
+    return;
+  }
+
   // Handle navigation requests
   if (event.request.mode === 'navigate') {
     event.respondWith(
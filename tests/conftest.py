@@ -0,0 +1,37 @@
+import os
+import sys
+import tempfile
+
+import pytest
+
+# app.py configures itself from the environment and the working directory at
+# import time, so point both at a scratch directory before it is imported
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+WORK_DIR = tempfile.mkdtemp(prefix='business-docs-tests-')
+os.environ['DATABASE_URL'] = f"sqlite:///{os.path.join(WORK_DIR, 'test.db')}"
+os.environ['BACKUP_SCHEDULER'] = '0'
+os.chdir(WORK_DIR)
+sys.path.insert(0, ROOT)
+
+
+@pytest.fixture(scope='session')
+def app():
+    from app import app as flask_app
+    flask_app.config['TESTING'] = True
+    return flask_app
+
+
+@pytest.fixture
+def db(app):
+    from models import db as database
+    with app.app_context():
+        yield database
+        database.session.remove()
+
+
+@pytest.fixture
+def admin_client(app):
+    client = app.test_client()
+    response = client.post('/login', json={'username': 'admin', 'password': 'admin123'})
+    assert response.status_code == 200
+    return client
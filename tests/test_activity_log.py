@@ -0,0 +1,18 @@
+from activity_log import ActivityLogWriter
+from models import ActivityLog, User
+
+
+def test_bad_row_does_not_drop_its_batch(app, db):
+    writer = ActivityLogWriter(batch_size=50)
+    writer.app = app
+    user_id = User.query.filter_by(username='admin').first().id
+    rows = [{'user_id': user_id, 'activity_type': 'test_batch', 'description': f'row {n}'} for n in range(20)]
+    # activity_type is NOT NULL
+    rows[7] = {'user_id': user_id, 'activity_type': None, 'description': 'bad row'}
+    for row in rows:
+        assert writer.log(**row)
+
+    writer.flush()
+
+    assert writer.stats() == {'pending': 0, 'written': 19, 'dropped': 1}
+    assert ActivityLog.query.filter_by(activity_type='test_batch').count() == 19
@@ -0,0 +1,68 @@
+import threading
+import uuid
+from contextlib import contextmanager
+
+from sqlalchemy import event
+
+import app as app_module
+from models import ClientSettings, User, UserBusinessSettings
+
+
+@contextmanager
+def count_statements(engine):
+    """Count the statements this thread sends to engine"""
+    statements = []
+    thread = threading.get_ident()
+
+    def before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+        if threading.get_ident() == thread:
+            statements.append(statement)
+
+    event.listen(engine, 'before_cursor_execute', before_cursor_execute)
+    try:
+        yield statements
+    finally:
+        event.remove(engine, 'before_cursor_execute', before_cursor_execute)
+
+
+def add_users(db, count):
+    for _ in range(count):
+        name = f'user-{uuid.uuid4().hex[:12]}'
+        user = User(username=name, email=f'{name}@example.com', first_name='Test', last_name='User')
+        user.set_password('password')
+        db.session.add(user)
+        db.session.flush()
+        db.session.add(UserBusinessSettings(user_id=user.id, business_name=f'{name} Ltd'))
+        db.session.add_all([ClientSettings(user_id=user.id, client_name=f'{name} client {n}') for n in range(2)])
+    db.session.commit()
+
+
+def test_admin_users_query_count_is_constant(app, db, admin_client, monkeypatch):
+    # Check the shared users_version on every request rather than now and then,
+    # and let the first request fill the user-flags cache
+    monkeypatch.setattr(app_module, 'USER_FLAGS_VERSION_INTERVAL', 0)
+    admin_client.get('/api/admin/users?per_page=500')
+
+    counts = []
+    for count in (5, 50):
+        add_users(db, count)
+        with count_statements(db.engine) as statements:
+            response = admin_client.get('/api/admin/users?per_page=500')
+        assert response.status_code == 200
+        assert len(response.get_json()['users']) >= count
+        counts.append(len(statements))
+
+    assert counts[0] == counts[1]
+
+
+def test_admin_users_keyset_pagination(app, db, admin_client):
+    add_users(db, 5)
+    seen = []
+    cursor = 0
+    while cursor is not None:
+        data = admin_client.get(f'/api/admin/users?per_page=2&after={cursor}&fields=id,username').get_json()
+        assert all(set(user) == {'id', 'username'} for user in data['users'])
+        seen.extend(user['id'] for user in data['users'])
+        cursor = data['next_cursor']
+    assert seen == sorted(set(seen))
+    assert len(seen) >= 5
@@ -0,0 +1,36 @@
+from datetime import datetime, timedelta
+
+import app as app_module
+
+
+def test_restoring_an_earlier_snapshot_of_the_day_keeps_it_and_the_undo_point(app):
+    with app.app_context():
+        store = app_module.get_backup_store()
+        earlier = app_module.create_backup()['snapshot']
+        # Retention would already retire `earlier`, so store the second one directly
+        store.create_snapshot(app_module.get_database_path(), [app.config['UPLOAD_FOLDER'], 'generated_documents'])
+
+        stats = app_module.restore_backup(snapshot=earlier)
+        # The next backup of the day must not retire either of them
+        app_module.create_backup()
+        store.collect_garbage(grace_seconds=0)
+
+        snapshots = store.list_snapshots()
+        assert earlier in snapshots
+        assert stats['pre_restore_snapshot'] in snapshots
+        assert store.verify_snapshot(earlier) == []
+        assert store.verify_snapshot(stats['pre_restore_snapshot']) == []
+
+
+def test_pre_restore_snapshots_age_out_after_keep_daily_days(app):
+    with app.app_context():
+        store = app_module.get_backup_store()
+        earlier = app_module.create_backup()['snapshot']
+        safety = app_module.create_backup(label='pre_restore', restores=earlier)['snapshot']
+        latest = app_module.create_backup()['snapshot']
+
+        removed = store.apply_retention(1, 0, now=datetime.utcnow() + timedelta(days=2))
+
+        assert earlier in removed
+        assert safety in removed
+        assert latest in store.list_snapshots()
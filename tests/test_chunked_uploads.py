@@ -0,0 +1,64 @@
+import hashlib
+import io
+import os
+import threading
+import time
+
+import pytest
+
+from chunked_uploads import UploadOffsetMismatch, UploadSessionError, UploadSessionStore
+from file_storage import FileStore
+
+CHUNK = 2 * 1024 * 1024
+
+
+class SlowStream(io.BytesIO):
+    """A request body that arrives in pieces, so concurrent appends overlap"""
+
+    def read(self, size=-1):
+        time.sleep(0.01)
+        return super().read(min(size, 256 * 1024) if size and size > 0 else 256 * 1024)
+
+
+@pytest.fixture
+def store(tmp_path):
+    return UploadSessionStore(str(tmp_path / 'sessions'), FileStore(str(tmp_path / 'uploads')))
+
+
+def test_concurrent_chunks_at_one_offset(store):
+    data = os.urandom(2 * CHUNK)
+    upload_id = store.create(len(data), sha256=hashlib.sha256(data).hexdigest())
+    barrier = threading.Barrier(4)
+    accepted = []
+    rejected = []
+
+    def send():
+        barrier.wait()
+        try:
+            accepted.append(store.append(upload_id, 0, SlowStream(data[:CHUNK])))
+        except UploadOffsetMismatch as e:
+            rejected.append(e)
+
+    threads = [threading.Thread(target=send) for _ in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert accepted == [CHUNK]
+    assert len(rejected) == 3
+    assert store.load(upload_id)['offset'] == CHUNK
+
+    assert store.append(upload_id, CHUNK, io.BytesIO(data[CHUNK:])) == len(data)
+    metadata, staged = store.finish(upload_id)
+    assert staged.digest == hashlib.sha256(data).hexdigest()
+    assert not os.path.exists(os.path.join(store.root, f'{upload_id}.lock'))
+
+
+def test_chunk_past_declared_size_is_rejected(store):
+    upload_id = store.create(10)
+    assert store.append(upload_id, 0, io.BytesIO(b'12345')) == 5
+    with pytest.raises(UploadSessionError):
+        store.append(upload_id, 5, io.BytesIO(b'1234567890'))
+    assert store.load(upload_id)['offset'] == 5
+    assert store.append(upload_id, 5, io.BytesIO(b'67890')) == 10
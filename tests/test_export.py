@@ -0,0 +1,18 @@
+import json
+
+from data_export import EXPORT_TABLES, JSON_EXPORT_TABLES
+
+
+def test_json_export_leaves_out_high_volume_tables(admin_client):
+    data = admin_client.post('/api/admin/export-database').get_json()['data']
+    assert set(data) == set(JSON_EXPORT_TABLES) | {'export_info'}
+    assert 'activity_logs' not in data
+    assert set(data['export_info']['total_records']) == set(JSON_EXPORT_TABLES)
+
+
+def test_ndjson_export_covers_every_table(admin_client):
+    response = admin_client.post('/api/admin/export-database?format=ndjson')
+    lines = [json.loads(line) for line in response.get_data(as_text=True).splitlines()]
+    assert lines[0]['type'] == 'export_info'
+    assert lines[-1]['type'] == 'end'
+    assert [line['table'] for line in lines if line['type'] == 'section'] == [name for name, _, _ in EXPORT_TABLES]
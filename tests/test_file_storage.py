@@ -0,0 +1,19 @@
+import io
+import os
+
+from file_storage import FileStore
+
+
+def test_unreferenced_file_is_removed_without_leftovers(db, tmp_path):
+    store = FileStore(str(tmp_path / 'files'))
+    staged = store.stage(io.BytesIO(b'content'))
+    store.add_reference(staged.digest, staged.size)
+    db.session.commit()
+    store.publish(staged)
+
+    store.release_reference(staged.digest)
+    db.session.commit()
+
+    assert store.remove_if_unreferenced(staged.digest)
+    assert not os.path.exists(staged.path)
+    assert os.listdir(store.tmp_dir) == []
@@ -0,0 +1,64 @@
+import json
+import uuid
+
+from models import User
+
+
+def ndjson(users):
+    lines = [{'type': 'section', 'table': 'users'}] + [{'type': 'row', 'data': user} for user in users]
+    return '\n'.join(json.dumps(line) for line in lines)
+
+
+def import_users(client, users, query=''):
+    return client.post(f'/api/admin/import-database{query}', data=ndjson(users), content_type='application/x-ndjson')
+
+
+def make_user(db):
+    name = f'local-{uuid.uuid4().hex[:10]}'
+    user = User(username=name, email=f'{name}@example.com', first_name='Local', last_name='User')
+    user.set_password('password')
+    db.session.add(user)
+    db.session.commit()
+    return user
+
+
+def test_import_refuses_id_of_a_different_user(db, admin_client):
+    local = make_user(db)
+    foreign = {'id': local.id, 'username': 'someone-else', 'email': 'someone-else@example.com',
+               'first_name': 'Someone', 'last_name': 'Else', 'is_admin': True}
+
+    response = import_users(admin_client, [foreign])
+
+    assert response.status_code == 400
+    assert 'do not match' in response.get_json()['error']
+    db.session.expire_all()
+    user = db.session.get(User, local.id)
+    assert (user.username, user.is_admin) == (local.username, False)
+
+
+def test_import_refuses_username_under_another_id(db, admin_client):
+    local = make_user(db)
+    row = {'id': local.id + 100000, 'username': local.username, 'email': 'new@example.com', 'first_name': 'A', 'last_name': 'B'}
+    assert import_users(admin_client, [row]).status_code == 400
+
+
+def test_import_updates_the_same_user(db, admin_client):
+    local = make_user(db)
+    row = {'id': local.id, 'username': local.username, 'email': local.email, 'first_name': 'Renamed', 'last_name': 'User'}
+
+    response = import_users(admin_client, [row])
+
+    assert response.status_code == 200
+    assert response.get_json()['imported_counts']['users']['updated'] == 1
+    db.session.expire_all()
+    assert db.session.get(User, local.id).first_name == 'Renamed'
+
+
+def test_import_overwrite_lets_the_id_win(db, admin_client):
+    local = make_user(db)
+    name = f'foreign-{uuid.uuid4().hex[:10]}'
+    row = {'id': local.id, 'username': name, 'email': f'{name}@example.com', 'first_name': 'A', 'last_name': 'B'}
+
+    assert import_users(admin_client, [row], '?overwrite=1').status_code == 200
+    db.session.expire_all()
+    assert db.session.get(User, local.id).username == name
@@ -0,0 +1,104 @@
+import base64
+import logging
+import random
+import struct
+import zlib
+
+from pdf_render import png_image, render_document
+
+
+def paeth(left, up, up_left):
+    estimate = left + up - up_left
+    distances = abs(estimate - left), abs(estimate - up), abs(estimate - up_left)
+    if distances[0] <= distances[1] and distances[0] <= distances[2]:
+        return left
+    return up if distances[1] <= distances[2] else up_left
+
+
+def encode_png(rows, width, bit_depth, color_type, bpp, palette=None, transparency=None, interlace=0):
+    """A PNG from packed rows, cycling through all five row filters"""
+    raw = bytearray()
+    previous = bytes(len(rows[0]))
+    for number, row in enumerate(rows):
+        filter_type = number % 5
+        raw.append(filter_type)
+        for i, value in enumerate(row):
+            left = row[i - bpp] if i >= bpp else 0
+            up_left = previous[i - bpp] if i >= bpp else 0
+            predictor = [0, left, previous[i], (left + previous[i]) // 2, paeth(left, previous[i], up_left)][filter_type]
+            raw.append((value - predictor) & 0xFF)
+        previous = row
+
+    def chunk(kind, body):
+        return struct.pack('>I', len(body)) + kind + body + struct.pack('>I', zlib.crc32(kind + body))
+
+    png = b'\x89PNG\r\n\x1a\n' + chunk(b'IHDR', struct.pack('>IIBBBBB', width, len(rows), bit_depth, color_type, 0, 0, interlace))
+    if palette:
+        png += chunk(b'PLTE', palette)
+    if transparency:
+        png += chunk(b'tRNS', transparency)
+    return png + chunk(b'IDAT', zlib.compress(bytes(raw))) + chunk(b'IEND', b'')
+
+
+def test_rgba_png_is_split_into_color_and_soft_mask():
+    rng = random.Random(1)
+    width, height = 13, 11
+    pixels = [bytes(rng.randrange(256) for _ in range(width * 4)) for _ in range(height)]
+
+    entries, stream, soft_mask = png_image(encode_png(pixels, width, 8, 6, 4))
+
+    flat = b''.join(pixels)
+    color = bytearray()
+    for i in range(0, len(flat), 4):
+        color += flat[i:i + 3]
+    assert b'/ColorSpace /DeviceRGB' in entries
+    assert zlib.decompress(stream) == bytes(color)
+    assert zlib.decompress(soft_mask[1]) == flat[3::4]
+
+
+def test_palette_png_with_transparency_at_four_bits():
+    rng = random.Random(2)
+    width, height = 9, 7
+    indices = [[rng.randrange(16) for _ in range(width)] for _ in range(height)]
+    rows = [bytes((row[i] << 4) | (row[i + 1] if i + 1 < width else 0) for i in range(0, width, 2)) for row in indices]
+    palette = bytes(rng.randrange(256) for _ in range(16 * 3))
+    transparency = bytes(range(0, 160, 10))
+
+    entries, stream, soft_mask = png_image(encode_png(rows, width, 4, 3, 1, palette, transparency))
+
+    flat = bytes(index for row in indices for index in row)
+    assert b'/Indexed /DeviceRGB 15' in entries
+    assert zlib.decompress(stream) == flat
+    assert zlib.decompress(soft_mask[1]) == bytes(transparency[index] for index in flat)
+
+
+def test_opaque_png_keeps_its_compressed_data():
+    rows = [bytes(range(30)) for _ in range(4)]
+    png = encode_png(rows, 10, 8, 2, 3)
+
+    entries, stream, soft_mask = png_image(png)
+
+    assert b'/Predictor 15 /Colors 3' in entries
+    assert soft_mask is None
+    assert stream in png
+
+
+def test_png_signature_is_embedded():
+    rows = [bytes([0, 0, 0, 255] * 4) for _ in range(4)]
+    url = 'data:image/png;base64,' + base64.b64encode(encode_png(rows, 4, 8, 6, 4)).decode()
+
+    pdf = render_document({'type': 'invoice', 'number': 1, 'business': {'signatureUrl': url}})
+
+    assert b'/SMask' in pdf
+    assert b'/Subtype /Image' in pdf
+
+
+def test_unsupported_png_is_left_out_with_a_warning(caplog):
+    rows = [bytes(4) for _ in range(4)]
+    url = 'data:image/png;base64,' + base64.b64encode(encode_png(rows, 4, 8, 0, 1, interlace=1)).decode()
+
+    with caplog.at_level(logging.WARNING):
+        pdf = render_document({'type': 'invoice', 'number': 1, 'business': {'businessLogoUrl': url}})
+
+    assert b'/Subtype /Image' not in pdf
+    assert 'Leaving the logo out of the PDF' in caplog.text
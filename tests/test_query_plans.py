@@ -0,0 +1,41 @@
+import re
+
+import pytest
+
+from models import ActivityLog, ClientSettings, GeneratedDocument, Message, PDFRequest, RenderJobItem, UserPDFCode
+
+# The dashboard, messaging, request, activity-log and client queries from app.py
+HOT_QUERIES = {
+    'user files': lambda: UserPDFCode.query.filter_by(user_id=1).order_by(UserPDFCode.uploaded_at.desc()),
+    'recent uploads': lambda: UserPDFCode.query.order_by(UserPDFCode.uploaded_at.desc()).limit(10),
+    'user requests': lambda: PDFRequest.query.filter_by(user_id=1).order_by(PDFRequest.created_at.desc()),
+    'pending requests': lambda: PDFRequest.query.filter_by(status='pending').order_by(PDFRequest.created_at.desc()),
+    'unread count': lambda: Message.query.filter_by(recipient_id=1, is_read=False).with_entities(Message.id),
+    'inbox': lambda: Message.query.filter_by(recipient_id=1).order_by(Message.created_at.desc()),
+    'outbox': lambda: Message.query.filter_by(sender_id=1).order_by(Message.created_at.desc()),
+    'active clients': lambda: ClientSettings.query.filter_by(user_id=1, is_active=True),
+    'user activity': lambda: ActivityLog.query.filter_by(user_id=1),
+    'activity log page': lambda: ActivityLog.query.order_by(ActivityLog.created_at.desc()).limit(50),
+    'user documents': lambda: GeneratedDocument.query.filter_by(user_id=1),
+    'documents newest first': lambda: GeneratedDocument.query.order_by(GeneratedDocument.created_at.desc()),
+    'job items': lambda: RenderJobItem.query.filter_by(job_id=1).order_by(RenderJobItem.position),
+    'pending job items': lambda: RenderJobItem.query.filter_by(status='pending'),
+}
+
+
+def query_plan(db, query):
+    sql = str(query.statement.compile(db.engine, compile_kwargs={'literal_binds': True}))
+    with db.engine.connect() as connection:
+        return [row[-1] for row in connection.exec_driver_sql(f'EXPLAIN QUERY PLAN {sql}')]
+
+
+@pytest.mark.parametrize('name', HOT_QUERIES)
+def test_hot_query_uses_an_index(app, db, name):
+    query = HOT_QUERIES[name]()
+    plan = query_plan(db, query)
+    table = query.column_descriptions[0]['entity'].__tablename__
+
+    # "SCAN <table> USING INDEX" walks an index in order, which is fine;
+    # a bare "SCAN <table>" reads the whole table
+    assert not any(re.fullmatch(f'SCAN {table}', step) for step in plan), plan
+    assert not any('TEMP B-TREE' in step for step in plan), plan
@@ -0,0 +1,56 @@
+import threading
+from datetime import datetime, timedelta
+
+import pytest
+
+from app import redeem_download_code
+from download_codes import create_download_codes
+from models import DownloadCode
+
+THREADS = 16
+
+
+def redeem_concurrently(app, db, code):
+    barrier = threading.Barrier(THREADS)
+    results = []
+    errors = []
+
+    def redeem():
+        with app.app_context():
+            try:
+                barrier.wait()
+                redeemed = redeem_download_code(code)
+                db.session.commit()
+                results.append(redeemed)
+            except Exception as e:
+                db.session.rollback()
+                errors.append(e)
+            finally:
+                db.session.remove()
+
+    threads = [threading.Thread(target=redeem) for _ in range(THREADS)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert not errors
+    return [result for result in results if result]
+
+
+@pytest.mark.parametrize('returning', [True, False], ids=['returning', 'fallback'])
+def test_one_code_redeems_once(app, db, monkeypatch, returning):
+    monkeypatch.setattr(db.engine.dialect, 'update_returning', returning)
+    [code] = create_download_codes(1, datetime.utcnow() + timedelta(hours=1), document_data='{"type":"invoice"}')
+
+    redeemed = redeem_concurrently(app, db, code)
+
+    assert len(redeemed) == 1
+    assert redeemed[0].document_data == '{"type":"invoice"}'
+    db.session.expire_all()
+    assert DownloadCode.query.filter_by(code=code).one().used
+
+
+def test_expired_code_is_not_redeemed(app, db):
+    [code] = create_download_codes(1, datetime.utcnow() - timedelta(seconds=1))
+    assert redeem_download_code(code) is None
+    db.session.rollback()
@@ -0,0 +1,57 @@
+import uuid
+
+import app as app_module
+
+DOCUMENT = {
+    'type': 'invoice',
+    'date': '2025-07-03',
+    'business': {'businessName': 'Acme Ltd', 'currency': 'USD'},
+    'clientName': 'Client',
+    'items': [{'description': 'Consulting', 'quantity': 2, 'price': 150}],
+    'totals': {'subtotal': 300, 'grandTotal': 300},
+}
+
+
+def document(**changes):
+    return {**DOCUMENT, 'number': uuid.uuid4().hex[:8], **changes}
+
+
+def test_server_render_runs_in_forkserver_workers(admin_client):
+    response = admin_client.post('/api/render-document', json={'document_data': document()})
+
+    assert response.status_code == 200
+    assert response.mimetype == 'application/pdf'
+    assert response.get_data().startswith(b'%PDF-1.4')
+    assert app_module.render_pool._executor._mp_context.get_start_method() == 'forkserver'
+
+
+def test_text_outside_the_standard_fonts_is_refused(admin_client):
+    response = admin_client.post('/api/render-document', json={'document_data': document(clientName='Иван Петров')})
+
+    assert response.status_code == 422
+    assert response.get_json()['render_in_browser'] is True
+
+
+def test_windows_1252_text_renders(admin_client):
+    response = admin_client.post('/api/render-document', json={'document_data': document(clientName='Zoë “Straße” €')})
+    assert response.status_code == 200
+
+
+def test_render_job_pool_is_created_by_the_leader_only(app, tmp_path):
+    from backup_scheduler import LeaderLock
+    from render_jobs import RenderJobRunner
+
+    lock_path = str(tmp_path / 'render_jobs.lock')
+    leader = LeaderLock(lock_path)
+    assert leader.acquire()
+    runner = RenderJobRunner(app, 4, lock_path, str(tmp_path / 'jobs'), poll_interval=0.05)
+    assert runner.capacity == 8
+
+    runner._run_once()
+    assert runner.pool is None
+
+    leader.release()
+    runner._run_once()
+    assert runner.pool.max_workers == 4
+    assert runner.pool._executor is None
+    runner.lock.release()
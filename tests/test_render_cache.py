@@ -0,0 +1,18 @@
+import os
+
+from render_cache import RenderCache
+
+
+def test_put_leaves_no_temp_files(tmp_path):
+    source = tmp_path / 'rendered.pdf'
+    source.write_bytes(b'%PDF-1.4 test')
+    cache = RenderCache(str(tmp_path / 'cache'), max_bytes=1024 * 1024)
+    key = 'ab' * 16
+
+    cache.put(key, str(source))
+    # The entry is now a hard link to the source; caching it again must not strand its temp link
+    cache.put(key, str(source))
+
+    path = cache.get(key)
+    assert open(path, 'rb').read() == b'%PDF-1.4 test'
+    assert os.listdir(os.path.dirname(path)) == [os.path.basename(path)]
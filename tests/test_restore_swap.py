@@ -0,0 +1,93 @@
+import os
+import sqlite3
+
+import pytest
+
+import backups
+from backups import swap_in_staged
+
+
+def make_database(path, value):
+    connection = sqlite3.connect(path)
+    connection.execute('CREATE TABLE marker (value TEXT)')
+    connection.execute('INSERT INTO marker VALUES (?)', (value,))
+    connection.commit()
+    connection.close()
+
+
+def read_database(path):
+    connection = sqlite3.connect(path)
+    try:
+        return connection.execute('SELECT value FROM marker').fetchone()[0]
+    finally:
+        connection.close()
+
+
+def make_tree(base, directory, content):
+    os.makedirs(os.path.join(base, directory), exist_ok=True)
+    with open(os.path.join(base, directory, 'file.txt'), 'w') as f:
+        f.write(content)
+
+
+def read_tree(base, directory):
+    with open(os.path.join(base, directory, 'file.txt')) as f:
+        return f.read()
+
+
+@pytest.fixture
+def restore(tmp_path):
+    base = str(tmp_path)
+    make_database(os.path.join(base, 'live.db'), 'old')
+    make_database(os.path.join(base, 'staged.db'), 'new')
+    staged = {}
+    for directory in ('uploads', 'generated_documents'):
+        make_tree(base, directory, f'old {directory}')
+        make_tree(base, directory + '.restore', f'new {directory}')
+        staged[directory] = os.path.join(base, directory + '.restore')
+    return base, staged
+
+
+def test_swap_replaces_directories_and_database(restore):
+    base, staged = restore
+    swap_in_staged(os.path.join(base, 'staged.db'), os.path.join(base, 'live.db'), staged, base)
+
+    assert read_database(os.path.join(base, 'live.db')) == 'new'
+    assert read_tree(base, 'uploads') == 'new uploads'
+    assert read_tree(base, 'generated_documents') == 'new generated_documents'
+    assert sorted(os.listdir(base)) == ['generated_documents', 'live.db', 'uploads']
+
+
+def test_failed_rename_rolls_everything_back(restore, monkeypatch):
+    base, staged = restore
+    rename = os.rename
+
+    def failing_rename(source, target):
+        # A request recreates and writes to generated_documents/ while it is moved aside
+        if source == staged['generated_documents']:
+            make_tree(base, 'generated_documents', 'written meanwhile')
+            raise OSError('Directory not empty')
+        return rename(source, target)
+
+    monkeypatch.setattr(backups.os, 'rename', failing_rename)
+    with pytest.raises(OSError):
+        swap_in_staged(os.path.join(base, 'staged.db'), os.path.join(base, 'live.db'), staged, base)
+
+    assert read_database(os.path.join(base, 'live.db')) == 'old'
+    assert read_tree(base, 'uploads') == 'old uploads'
+    assert read_tree(base, 'generated_documents') == 'old generated_documents'
+    assert read_tree(base, 'uploads.restore') == 'new uploads'
+    conflict = [name for name in os.listdir(base) if name.startswith('generated_documents.restore-conflict-')]
+    assert len(conflict) == 1 and read_tree(base, conflict[0]) == 'written meanwhile'
+
+
+def test_failed_database_swap_rolls_back_directories(restore):
+    base, staged = restore
+    with open(os.path.join(base, 'staged.db'), 'wb') as f:
+        f.write(b'not a database' * 100)
+
+    with pytest.raises(sqlite3.DatabaseError):
+        swap_in_staged(os.path.join(base, 'staged.db'), os.path.join(base, 'live.db'), staged, base)
+
+    assert read_database(os.path.join(base, 'live.db')) == 'old'
+    assert read_tree(base, 'uploads') == 'old uploads'
+    assert read_tree(base, 'generated_documents') == 'old generated_documents'
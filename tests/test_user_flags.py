@@ -0,0 +1,37 @@
+import time
+
+import app as app_module
+from models import SystemSettings, User
+
+
+def test_flags_cache_is_bounded(app, db, monkeypatch):
+    monkeypatch.setattr(app_module, 'USER_FLAGS_CACHE_SIZE', 3)
+    app_module.forget_user_flags()
+    users = [User(id=100000 + n, is_admin=False, is_verified=True) for n in range(5)]
+    for user in users:
+        app_module.cache_user_flags(user)
+    assert list(app_module._user_flags_cache) == [user.id for user in users[-3:]]
+
+
+def test_change_from_another_worker_clears_flags(app, db, admin_client, monkeypatch):
+    monkeypatch.setattr(app_module, 'USER_FLAGS_VERSION_INTERVAL', 0)
+    assert admin_client.get('/api/admin/users').status_code == 200
+    admin = User.query.filter_by(username='admin').first()
+    assert admin.id in app_module._user_flags_cache
+
+    # Another process demotes the admin and bumps the shared stamp; this
+    # process has the admin's flags cached and never saw the change
+    admin.is_admin = False
+    db.session.commit()
+    setting = SystemSettings.query.filter_by(setting_key='users_version').first()
+    if setting is None:
+        db.session.add(SystemSettings(setting_key='users_version', setting_value=f'{time.time_ns():x}'))
+    else:
+        setting.setting_value = f'{time.time_ns():x}'
+    db.session.commit()
+    try:
+        assert admin_client.get('/api/admin/users').status_code == 302
+    finally:
+        admin.is_admin = True
+        db.session.commit()
+        app_module.invalidate_user_flags(admin.id)